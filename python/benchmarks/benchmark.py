@@ -0,0 +1,302 @@
+"""Benchmark suite for the signal engine and the front ends' report and plot code.
+
+Measures the transforms, the three systems, the property analysis, the text
+report (``get_system_analysis``), the power spectrum and the headless Agg rendering of the
+``plot_signal`` and ``update_signals_tab`` layouts, and the PNG export of both plots. The sweep covers signal
+lengths from 9 to 10^8 samples across dtypes. Results (best and median time,
+throughput, peak traced memory) are written to JSON, and ``compare`` flags
+regressions against a saved baseline.
+
+Usage:
+    python benchmarks/benchmark.py run --output results.json
+    python benchmarks/benchmark.py run --lengths 9 1e3 1e6 --dtypes int16 float64 --only system render
+    python benchmarks/benchmark.py compare baseline.json results.json --threshold 0.25
+"""
+
+import argparse
+import ast
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import subprocess
+import tracemalloc
+import warnings
+from datetime import datetime, timezone
+
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")  # Headless rendering, no window is ever opened
+import matplotlib.pyplot as pyplot
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+import signal_engine as engine
+from signal_engine import export
+from signal_engine.plotting import SignalPlot
+
+CLI_SCRIPT = os.path.join(ROOT, "simple_prompt_version.py")
+GUI_SCRIPT = os.path.join(ROOT, "graphic_version.py")
+
+# The front ends' messages (the scripts run in the default locale when started directly)
+MESSAGES = engine.load_catalog()
+
+DEFAULT_LENGTHS = (9, 10**3, 10**5, 10**6, 10**7, 10**8)
+DEFAULT_DTYPES = ("int16", "int32", "int64", "float32", "float64")
+
+# Differences below this many seconds are timer noise and never flagged
+NOISE_FLOOR = 2e-5
+
+
+def load_functions(path, names, namespace):
+    """Compiles the named top-level functions of a front-end script into namespace.
+
+    The scripts build their prompt or window at import time, so they cannot
+    simply be imported; their functions are benchmarked as written instead.
+    """
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    body = [node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name in names]
+    missing = set(names) - {node.name for node in body}
+    if missing:
+        raise LookupError(f"{path} has no function(s) {', '.join(sorted(missing))}")
+    exec(compile(ast.Module(body=body, type_ignores=[]), path, "exec"), namespace)
+    return namespace
+
+
+def plot_signal_headless(plot_signal):
+    """plot_signal drawing on Agg, where show() does nothing; its figure is closed afterwards."""
+    def run(x):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", "FigureCanvasAgg is non-interactive")
+            plot_signal(x)
+        pyplot.close("all")
+    return run
+
+
+def signals_tab():
+    """The Signals tab layout of the graphical version, on Agg canvases instead of Tk ones."""
+    namespace = {"engine": engine, "np": np, "messages": MESSAGES, "build_signals_tab": lambda: None}  # Built right here
+    fig_orig = Figure(figsize=(6, 3), dpi=100)
+    fig_trans = Figure(figsize=(6, 8), dpi=100)
+    namespace["canvas_orig"] = FigureCanvasAgg(fig_orig)   # Drawn by update_signals_tab itself
+    namespace["canvas_trans"] = FigureCanvasAgg(fig_trans)
+    namespace["plot_orig"] = SignalPlot(fig_orig.add_subplot(111), MESSAGES["plot.original"])
+    namespace["plot_shifted"] = SignalPlot(fig_trans.add_subplot(311), MESSAGES["plot.shifted"])
+    namespace["plot_reflected"] = SignalPlot(fig_trans.add_subplot(312), MESSAGES["plot.reflected"])
+    namespace["plot_compressed"] = SignalPlot(fig_trans.add_subplot(313), MESSAGES["plot.compressed"])
+    return load_functions(GUI_SCRIPT, ["update_signals_tab", "signal_transforms"], namespace)
+
+
+def export_headless():
+    """PNG export of one signal's two figures, on the figures of a warmed-up export worker."""
+    directory = tempfile.mkdtemp(prefix="signal_export_")
+    export._start_worker(100, export.TITLES)
+    return lambda x: export._export_rows([x], None, 0, directory, "png", 2)
+
+
+def fresh_cache():
+    """Empty result cache holding only the property verdicts, which do not depend on the signal."""
+    engine.configure_cache()
+    for system in engine.SYSTEMS.values():
+        engine.cached_verify(system)
+
+
+def make_signal(length, dtype, seed=0):
+    """Random test signal: integers in -9..9, or standard normal samples."""
+    rng = np.random.default_rng(seed)
+    if np.issubdtype(dtype, np.integer):
+        return rng.integers(-9, 10, length, dtype=dtype)
+    return rng.standard_normal(length, dtype=dtype)
+
+
+def signal_cases():
+    """(name, function of x, setup) for everything that depends on the signal."""
+    cli = load_functions(CLI_SCRIPT, ["plot_signal"], {"engine": engine, "np": np, "messages": MESSAGES})
+    gui = load_functions(GUI_SCRIPT, ["get_system_analysis"], {"engine": engine, "messages": MESSAGES})
+    tab = signals_tab()
+    return [
+        ("transform/shift", lambda x: engine.shift(x, 2), None),
+        ("transform/reflect", engine.reflect, None),
+        ("transform/compress", lambda x: engine.compress(x, 2), None),
+        ("system/difference", engine.difference, None),
+        ("system/cumulative_sum", engine.cumulative_sum, None),
+        ("system/decimate", engine.decimate, None),
+        # Outputs are recomputed on every run; the verdicts are measured by the property cases
+        ("report/get_system_analysis", gui["get_system_analysis"], fresh_cache),
+        ("spectrum/power_spectrum", engine.power_spectrum, None),
+        ("render/plot_signal", plot_signal_headless(cli["plot_signal"]), None),
+        ("render/update_signals_tab", tab["update_signals_tab"], fresh_cache),
+        ("render/export_png", export_headless(), None),
+    ]
+
+
+def property_cases(trials):
+    """(name, function, setup) for the property analysis of each system (independent of the signal)."""
+    return [(f"properties/{name}", lambda _, system=system: engine.verify_system(system, trials=trials), None)
+            for name, system in zip(("difference", "cumulative_sum", "decimate"), engine.SYSTEMS.values())]
+
+
+def startup_cases():
+    """(name, function, setup) for cold starts of a fresh interpreter, as a user would run them."""
+    def python(*arguments, stdin=None):
+        return lambda _: subprocess.run([sys.executable, *arguments], input=stdin, cwd=ROOT,
+                                        capture_output=True, text=True, check=True)
+    return [
+        ("startup/python", python("-c", "pass"), None),
+        ("startup/import_engine", python("-c", "import signal_engine"), None),
+        ("startup/cli_no_plot", python(CLI_SCRIPT, "--no-plot", stdin="1 2 3 -4\n"), None),
+    ]
+
+
+def measure(function, x, setup=None, repeat=5, budget=1.0, memory=True):
+    """Best and median wall time of function(x) over up to ``repeat`` runs, plus its peak traced memory."""
+    times = []
+    while len(times) < repeat and sum(times) < budget:
+        if setup:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        function(x)
+        times.append(time.perf_counter() - start)
+    result = {"seconds": min(times), "median": float(np.median(times)), "repeats": len(times)}
+    if memory:
+        # A separate traced run: tracing slows the function down, so it is never timed
+        if setup:
+            setup()
+        gc.collect()
+        tracemalloc.start()
+        function(x)
+        result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run(args):
+    """Runs the selected cases over the length/dtype sweep and writes the JSON results."""
+    def selected(name):
+        return not args.only or any(name.startswith(prefix) for prefix in args.only)
+
+    results = []
+
+    def record(name, length, dtype, units, function, x, setup):
+        entry = {"name": name, "length": length, "dtype": dtype}
+        entry.update(measure(function, x, setup, args.repeat, args.budget, not args.no_memory))
+        entry["throughput"] = units / entry["seconds"]
+        results.append(entry)
+        memory = f"  peak {entry['peak_bytes'] / 2**20:9.1f} MiB" if "peak_bytes" in entry else ""
+        print(f"{name:28} {length or '-':>10} {dtype or '-':>8}  {entry['seconds']:10.6f} s"
+              f"  {entry['throughput']:12.4g}/s{memory}", flush=True)
+
+    for name, function, setup in startup_cases():
+        if selected(name):
+            entry = {"name": name, "length": None, "dtype": None}
+            entry.update(measure(function, None, setup, args.repeat, args.budget, memory=False))
+            entry["throughput"] = 1 / entry["seconds"]
+            results.append(entry)
+            print(f"{name:28} {'-':>10} {'-':>8}  {entry['seconds']:10.6f} s", flush=True)
+
+    for name, function, setup in property_cases(args.trials):
+        if selected(name):
+            record(name, None, None, args.trials, function, None, setup)
+
+    cases = [case for case in signal_cases() if selected(case[0])]
+    for length in args.lengths:
+        for dtype in args.dtypes:
+            if not cases:
+                break
+            x = make_signal(length, np.dtype(dtype))
+            for name, function, setup in cases:
+                record(name, length, dtype, length, function, x, setup)
+                pyplot.close("all")
+            del x
+
+    report = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"Results written to {args.output}")
+
+
+def compare(args):
+    """Prints the time ratio of each case against a baseline; exits with 1 if any case regressed."""
+    def load(path):
+        with open(path) as f:
+            return {(r["name"], r["length"], r["dtype"]): r for r in json.load(f)["results"]}
+
+    baseline, current = load(args.baseline), load(args.results)
+    regressions = 0
+    for key in sorted(baseline.keys() & current.keys(), key=lambda k: (k[0], k[1] or 0, k[2] or "")):
+        old, new = baseline[key]["seconds"], current[key]["seconds"]
+        ratio = new / old
+        flag = ""
+        if ratio > 1 + args.threshold and new - old > NOISE_FLOOR:
+            flag = "REGRESSION"
+            regressions += 1
+        elif ratio < 1 / (1 + args.threshold) and old - new > NOISE_FLOOR:
+            flag = "faster"
+        name, length, dtype = key
+        print(f"{name:28} {length or '-':>10} {dtype or '-':>8}  {old:10.6f} s -> {new:10.6f} s"
+              f"  x{ratio:6.2f}  {flag}")
+    for label, keys in (("only in baseline", baseline.keys() - current.keys()),
+                        ("only in results", current.keys() - baseline.keys())):
+        if keys:
+            print(f"{len(keys)} case(s) {label}")
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def length(text):
+    """Signal length argument; accepts scientific notation such as 1e6."""
+    value = float(text)
+    if value < 1 or value != int(value):
+        raise argparse.ArgumentTypeError(f"invalid length: {text}")
+    return int(value)
+
+
+parser = argparse.ArgumentParser(description="Discrete Signal Analyzer benchmarks")
+commands = parser.add_subparsers(dest="command", required=True)
+
+run_parser = commands.add_parser("run", help="run the benchmarks and write JSON results")
+run_parser.add_argument("--lengths", nargs="+", type=length, default=DEFAULT_LENGTHS,
+                        help="signal lengths to sweep (default: 9 to 1e8)")
+run_parser.add_argument("--dtypes", nargs="+", choices=DEFAULT_DTYPES, default=DEFAULT_DTYPES,
+                        help="sample types to sweep (default: all)")
+run_parser.add_argument("--only", nargs="+", metavar="PREFIX",
+                        help="run only cases whose name starts with one of these (e.g. system render/plot)")
+run_parser.add_argument("--trials", type=int, default=1000,
+                        help="random probes per property check (default 1000)")
+run_parser.add_argument("--repeat", type=int, default=5, help="maximum timed runs per case (default 5)")
+run_parser.add_argument("--budget", type=float, default=1.0,
+                        help="stop repeating a case after this many seconds (default 1)")
+run_parser.add_argument("--no-memory", action="store_true", help="skip the traced peak-memory run")
+run_parser.add_argument("--output", default="benchmark_results.json", help="JSON file for the results")
+
+compare_parser = commands.add_parser("compare", help="compare results against a saved baseline")
+compare_parser.add_argument("baseline", help="JSON results of the reference run")
+compare_parser.add_argument("results", help="JSON results of the run to check")
+compare_parser.add_argument("--threshold", type=float, default=0.25,
+                            help="relative slowdown flagged as a regression (default 0.25)")
+
+if __name__ == "__main__":
+    arguments = parser.parse_args()
+    if arguments.command == "run":
+        run(arguments)
+    else:
+        sys.exit(compare(arguments))
@@ -0,0 +1,510 @@
+# Importing necessary libraries
+import argparse                             # For command-line options
+import os                                   # For locating the shared engine package
+import sys                                  # For extending the import path
+import time                                 # For pacing the live view
+import numpy as np                          # For numerical and array operations
+import tkinter as tk                        # For creating the graphical interface
+from tkinter import messagebox              # For displaying popup messages
+from tkinter import filedialog              # For choosing where to export the metrics
+from tkinter import ttk                     # For using modern widgets (such as tabs)
+
+# Make the shared signal engine (in this directory) importable
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import signal_engine as engine              # Transforms and systems shared with the CLI
+from signal_engine.plotting import MinMaxPyramid, SignalPlot  # Stem plots / min-max envelopes updated in place
+
+# Language and program name set by the launcher script of each language directory (English when run directly)
+messages = engine.load_catalog(globals().get("LOCALE", engine.DEFAULT_LOCALE))
+PROG = globals().get("PROG")
+
+def get_system_analysis(x, job=None):
+    """Generates the report of the systems' analysis for the input signal x.
+
+    Each system's output and property verdicts are collected first and the
+    report text is formatted once at the end. When run as a background job,
+    progress is reported after each system.
+    """
+    reports = []
+
+    # --- Systems 1, 2 and 3: difference, cumulative sum and time compression ---
+    for (number, system), name in zip(engine.SYSTEMS.items(), engine.BUILTIN_SYSTEMS):
+        with engine.span(f"system/{name}"):
+            y = engine.cached_system(system, x)
+        # The properties are tested on random probes once per system, then reused
+        reports.append(engine.SystemReport(name, engine.REGISTRY[name].label, y, engine.cached_verify(system)))
+        if job:
+            job.progress(0.5 + 0.1 * number, messages("gui.progress.system", number=number))
+
+    # --- User-defined systems from the registry ---
+    for name, system in engine.REGISTRY.items():
+        if name not in engine.BUILTIN_SYSTEMS:
+            with engine.span(f"system/{name}"):
+                y = engine.cached_system(system, x)
+            reports.append(engine.SystemReport(name, system.label, y, engine.cached_verify(system)))
+            if job:
+                job.progress(0.9, messages("gui.progress.registered", name=name))
+
+    return engine.format_report(reports, messages, "gui")
+
+def get_spectrum_analysis(x, job=None):
+    """Frequency-domain stage: spectra of the input and of each system output, and each system's frequency response."""
+    systems = dict(zip(engine.BUILTIN_SYSTEMS, engine.SYSTEMS.values()))
+    systems.update((name, system) for name, system in engine.REGISTRY.items() if name not in engine.BUILTIN_SYSTEMS)
+    outputs = {name: engine.cached_system(system, x) for name, system in systems.items()}  # Cached by the report
+    # Exact responses come from the registered coefficients (engine.SYSTEMS holds plain functions)
+    responses = {name: engine.REGISTRY[name] for name in systems}
+    spectra = engine.analyze_spectrum(x, outputs, responses)
+    if job:
+        job.progress(0.95, messages["gui.progress.spectra"])
+    return spectra
+
+def time_draws(canvas, name):
+    """Records every draw of a canvas as the span ``name``, including those draw_idle runs later from the Tk loop."""
+    draw = canvas.draw
+    def timed_draw(*args, **kwargs):
+        with engine.span(name):
+            return draw(*args, **kwargs)
+    canvas.draw = timed_draw
+    return canvas
+
+def build_signals_tab():
+    """Builds the figures and canvases of the 'Signals' tab once; new signals only update their data."""
+    global canvas_orig, canvas_trans, plot_orig, plot_shifted, plot_reflected, plot_compressed
+    if plot_orig is not None:
+        return  # Already built
+
+    # matplotlib and its Tk backend are only loaded here, once the window is already up
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+    # --- Original Signal Graph ---
+    fig_orig = Figure(figsize=(6, 3), dpi=100)
+    plot_orig = SignalPlot(fig_orig.add_subplot(111), messages["plot.original"])
+
+    # --- Transformed Signal Graphs ---
+    fig_trans = Figure(figsize=(6, 8), dpi=100)
+    plot_shifted = SignalPlot(fig_trans.add_subplot(311), messages["plot.shifted"])        # Time Shift: x[n-2]
+    plot_reflected = SignalPlot(fig_trans.add_subplot(312), messages["plot.reflected"])    # Time Reflection: x[-n]
+    plot_compressed = SignalPlot(fig_trans.add_subplot(313), messages["plot.compressed"])  # Time Compression: x[2n]
+
+    # --- Creating a scrollable container ---
+    canvasFrame = tk.Frame(frameSignals)
+    canvasFrame.pack(fill=tk.BOTH, expand=True)
+
+    scroll_signals = tk.Scrollbar(canvasFrame)
+    scroll_signals.pack(side=tk.RIGHT, fill=tk.Y)
+
+    canvas = tk.Canvas(canvasFrame, yscrollcommand=scroll_signals.set)
+    canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    scroll_signals.config(command=canvas.yview)
+
+    # Internal frame to place the graphs
+    frame_inner = tk.Frame(canvas)
+    canvas.create_window((0, 0), window=frame_inner, anchor="nw")
+
+    # Adding the original signal graph
+    canvas_orig = time_draws(FigureCanvasTkAgg(fig_orig, master=frame_inner), "figure/original/draw")
+    canvas_orig.get_tk_widget().pack(pady=5)
+    NavigationToolbar2Tk(canvas_orig, frame_inner).pack()  # Zoom and pan refine long signals
+
+    # Adding the transformed signal graphs
+    canvas_trans = time_draws(FigureCanvasTkAgg(fig_trans, master=frame_inner), "figure/transforms/draw")
+    canvas_trans.get_tk_widget().pack(pady=5)
+    NavigationToolbar2Tk(canvas_trans, frame_inner).pack()
+
+    # Setting the scrollable area (the graphs keep their size from now on)
+    frame_inner.update_idletasks()
+    canvas.config(scrollregion=canvas.bbox("all"))
+
+def build_spectrum_tab():
+    """Builds the figure and canvas of the 'Spectrum' tab once; new signals only redraw its lines."""
+    global canvas_spectrum, ax_spectrum, ax_response
+    if ax_spectrum is not None:
+        return  # Already built
+
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+
+    fig_spectrum = Figure(figsize=(6, 6), dpi=100)
+    ax_spectrum = fig_spectrum.add_subplot(211)
+    ax_response = fig_spectrum.add_subplot(212)
+    fig_spectrum.subplots_adjust(hspace=0.6)
+
+    canvas_spectrum = time_draws(FigureCanvasTkAgg(fig_spectrum, master=frameSpectrum), "figure/spectrum/draw")
+    canvas_spectrum.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    NavigationToolbar2Tk(canvas_spectrum, frameSpectrum).pack()
+
+def update_spectrum_tab(spectra):
+    """Redraws the 'Spectrum' tab: power spectra of the input and outputs, and the systems' magnitude responses."""
+    build_spectrum_tab()
+    with engine.span("figure/spectrum/update"):
+        ax_spectrum.clear()
+        ax_spectrum.plot(spectra["input"].freqs, engine.to_db(spectra["input"].power), label="x[n]", linewidth=2)
+        for name, spectrum in spectra["outputs"].items():
+            ax_spectrum.plot(spectrum.freqs, engine.to_db(spectrum.power), label=name)
+        ax_spectrum.set_title(messages("gui.plot.spectrum", method=messages[f"spectrum.{spectra['input'].method}"]))
+        ax_spectrum.set_xlabel(messages["plot.frequency"])
+        ax_spectrum.set_ylabel("dB")
+        ax_spectrum.grid(True)
+        ax_spectrum.legend(fontsize=8)
+
+        ax_response.clear()
+        for name, response in spectra["responses"].items():
+            if response is None:
+                continue  # Not LTI: no frequency response
+            label = name if response.exact else messages("gui.plot.impulse", name=name)
+            ax_response.plot(response.freqs, engine.to_db(np.abs(response.response) ** 2), label=label)
+        ax_response.set_title(messages["gui.plot.responses"])
+        ax_response.set_xlabel(messages["plot.frequency"])
+        ax_response.set_ylabel("dB")
+        ax_response.grid(True)
+        ax_response.legend(fontsize=8)
+    canvas_spectrum.draw_idle()  # Drawn (and timed) once the Tk loop is idle
+
+def update_signals_tab(x, transforms=None, pyramids=None):
+    """Updates the 'Signals' tab by displaying the original signal and its transformations.
+
+    Transforms and plot pyramids computed in the background worker can be passed in.
+    """
+    build_signals_tab()  # No-op unless the first result arrives before the idle-time build
+    if transforms is None:
+        transforms = signal_transforms(x)
+    if pyramids is None:
+        pyramids = [None] * 4
+    with engine.span("figure/signals/update"):
+        plots = (plot_orig, plot_shifted, plot_reflected, plot_compressed)
+        for plot, signal, pyramid in zip(plots, transforms, pyramids):
+            plot.show(signal, pyramid)
+
+    # Redraw the existing canvases when the Tk loop is idle, without rebuilding any widget
+    canvas_orig.draw_idle()
+    canvas_trans.draw_idle()
+
+def signal_transforms(x):
+    """The original signal, x[n-2], x[-n] and x[2n] as IndexedSignals, in plotting order.
+
+    Each transform only changes the index map (or takes a strided view), so none is worth caching.
+    """
+    transforms = [engine.IndexedSignal(x)]
+    with engine.span("transform/shift"):
+        transforms.append(engine.shift(x, 2))
+    with engine.span("transform/reflect"):
+        transforms.append(engine.reflect(x))
+    with engine.span("transform/compress"):
+        transforms.append(engine.compress(x, 2))
+    return transforms
+
+def analyze_signal(job, input_data, unlimited, profile=False):
+    """Background job: parses and analyzes the signal. Runs in the worker thread, so it never touches Tk."""
+    if profile:
+        engine.default_metrics.start_capture()  # cProfile follows the worker thread
+    try:
+        return run_analysis(job, input_data, unlimited)
+    finally:
+        if profile:
+            engine.default_metrics.stop_capture()
+
+def run_analysis(job, input_data, unlimited):
+    """The stages of analyze_signal: parsing, transforms, plot pyramids, the report and the spectra."""
+    try:
+        # Convert input to a numpy array in a single vectorized pass
+        with engine.span("parse"):
+            x = engine.parse_signal(input_data, allow_float=unlimited)
+    except ValueError:
+        raise ValueError(messages["gui.invalid.unlimited" if unlimited else "gui.invalid.limited"]) from None
+
+    # Validate number of elements and value range (classic mode only)
+    violation = None if unlimited else engine.check_limits(x)
+    if violation:
+        raise ValueError(messages[f"gui.limits.{violation}"])  # Too many samples, or out of range
+    job.progress(0.1, messages("gui.progress.parsed", count=len(x)))
+
+    transforms = signal_transforms(x)
+    job.progress(0.3, messages["gui.progress.transforms"])
+    with engine.span("figure/signals/pyramids"):
+        # Plot levels of detail, built once per distinct sample array (shift and reflection share x's)
+        built = {}
+        for signal in transforms:
+            if id(signal.values) not in built:
+                built[id(signal.values)] = MinMaxPyramid(signal.values)
+        pyramids = [built[id(signal.values)] for signal in transforms]
+    job.progress(0.5, messages["gui.progress.plots"])
+
+    analysis_str = get_system_analysis(x, job)
+    spectra = get_spectrum_analysis(x, job)
+    return x, transforms, pyramids, analysis_str, spectra
+
+def process_signal():
+    """Sends the signal to the background worker; a newer submission cancels the one in flight."""
+    global last_request, running_request
+    request = (entry.get(), unlimited_var.get())
+
+    # Same text and mode as the last processed (or running) signal: nothing new to compute
+    if request == last_request and not worker.busy():
+        notebook.select(tab_signals)
+        return
+    if request == running_request and worker.busy():
+        return
+    running_request = request
+    worker.submit(analyze_signal, *request, profile_var.get())
+    progress_var.set(0)
+    status_var.set(messages["gui.processing"])
+
+def poll_worker():
+    """Applies the worker's events for the latest signal on the Tk thread, then polls again."""
+    global last_request, last_result
+    for kind, payload in worker.poll():
+        if kind == "progress":
+            fraction, message = payload
+            progress_var.set(100 * fraction)
+            status_var.set(message)
+        elif kind == "error":
+            progress_var.set(0)
+            status_var.set("")
+            messagebox.showerror(messages["gui.error"], str(payload))
+        elif kind == "done":
+            x, transforms, pyramids, analysis_str, spectra = payload
+
+            # Update graphs
+            update_signals_tab(x, transforms, pyramids)
+            update_spectrum_tab(spectra)
+
+            # Update system analysis text
+            textAnalysis.config(state="normal")
+            textAnalysis.delete("1.0", tk.END)
+            textAnalysis.insert(tk.END, analysis_str)
+            textAnalysis.config(state="disabled")
+
+            last_request = running_request
+            last_result = (x, transforms)
+            progress_var.set(100)
+            status_var.set(messages("gui.done", count=len(x)))
+
+            # Switch to the "Signals" tab automatically
+            notebook.select(tab_signals)
+    root.after(POLL_INTERVAL_MS, poll_worker)
+
+def show_metrics():
+    """Opens a window with the per-stage timings (and profile) recorded so far."""
+    window = tk.Toplevel(root)
+    window.title(messages["gui.metrics"])
+    text = tk.Text(window, wrap=tk.NONE, font=("Courier", 10), width=110, height=30)
+    text.pack(fill=tk.BOTH, expand=True)
+    text.insert(tk.END, engine.default_metrics.format())
+    text.config(state="disabled")
+
+def export_metrics():
+    """Saves the per-stage timings (and profile) as JSON."""
+    path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+    if path:
+        engine.default_metrics.export(path)
+
+def save_results_file():
+    """Saves the last analyzed signal, its transforms, the system outputs and the verdicts to a columnar .npz file."""
+    if last_result is None:
+        messagebox.showinfo(messages["gui.save.title"], messages["gui.save.nothing"])
+        return
+    path = filedialog.asksaveasfilename(defaultextension=".npz", filetypes=[(messages["gui.save.filetype"], "*.npz")])
+    if not path:
+        return
+    x, transforms = last_result
+    systems = dict(zip(engine.BUILTIN_SYSTEMS, engine.SYSTEMS.values()))
+    systems.update((name, system) for name, system in engine.REGISTRY.items() if name not in engine.BUILTIN_SYSTEMS)
+    with engine.span("save"):
+        # Outputs and verdicts come from the cache filled by the analysis
+        engine.save_results(path, x, dict(zip(("shifted", "reflected", "compressed"), transforms[1:])),
+                            {name: engine.cached_system(system, x) for name, system in systems.items()},
+                            {name: engine.cached_verify(system) for name, system in systems.items()})
+    status_var.set(messages("results.written", path=path))
+
+def build_live_tab():
+    """Builds the scrolling figure of the 'Live' tab once: the last N samples, both system outputs and the spectrum."""
+    global canvas_live, live_plots, live_spectrum_line, ax_live_spectrum
+    if live_plots is not None:
+        return  # Already built
+
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    fig_live = Figure(figsize=(6, 8), dpi=100)
+    axes = fig_live.subplots(4, 1)
+    live_plots = [SignalPlot(axes[0], messages("gui.live.input", window=args.window))]
+    for number, name in ((1, "difference"), (2, "cumulative_sum")):
+        live_plots.append(SignalPlot(axes[number], messages("report.gui.numbered", number=number,
+                                                            label=messages[f"system.{name}"])))
+    ax_live_spectrum = axes[3]
+    live_spectrum_line, = ax_live_spectrum.plot([], [])
+    ax_live_spectrum.set_title(messages["gui.live.spectrum"])
+    ax_live_spectrum.set_xlabel(messages["plot.frequency"])
+    ax_live_spectrum.set_ylabel("dB")
+    ax_live_spectrum.grid(True)
+    fig_live.subplots_adjust(hspace=0.8)
+
+    canvas_live = FigureCanvasTkAgg(fig_live, master=frameLive)
+    canvas_live.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+def refresh_live():
+    """Draws the latest window of the live stream, then schedules the next frame.
+
+    Frames come every LIVE_FRAME_MS however fast the samples arrive; the
+    window is only redrawn when new samples came in since the last frame.
+    """
+    global live_position
+    started = time.perf_counter()
+    build_live_tab()
+    snapshot = live.snapshot()
+    if snapshot.position != live_position and len(snapshot.signal.values):
+        live_position = snapshot.position
+        with engine.span("figure/live/update"):
+            signals = (snapshot.signal, snapshot.outputs["difference"], snapshot.outputs["cumulative_sum"])
+            for plot, signal in zip(live_plots, signals):
+                plot.show(signal)
+            live_spectrum_line.set_data(snapshot.spectrum.freqs, engine.to_db(snapshot.spectrum.power))
+            ax_live_spectrum.relim()
+            ax_live_spectrum.autoscale_view()
+            lines = [f"n = {snapshot.position:,}"]
+            for name, stats in snapshot.stats.items():
+                label = "x[n]" if name == "input" else messages.get(f"live.{name}", name)
+                lines.append(messages("live.stats", label=label, stats=stats))
+            live_stats_var.set("\n".join(lines))
+        with engine.span("figure/live/draw"):
+            canvas_live.draw()
+    if live.finished.is_set():
+        status_var.set(messages("gui.live.failed", error=live.error) if live.error is not None
+                       else messages["gui.live.ended"])
+        return  # Last frame drawn above
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    root.after(max(1, int(LIVE_FRAME_MS - elapsed_ms)), refresh_live)
+
+# --- Command-line options ---
+parser = argparse.ArgumentParser(prog=PROG, description=messages["title"])
+parser.add_argument("--systems", metavar=messages["metavar.file"], help=messages["help.systems"])
+parser.add_argument("--profile", action="store_true", help=messages["gui.help.profile"])
+parser.add_argument("--metrics", metavar=messages["metavar.file"], help=messages["gui.help.metrics"])
+parser.add_argument("--live", metavar=messages["metavar.source"], help=messages["gui.help.live"])
+parser.add_argument("--window", type=int, default=engine.DEFAULT_WINDOW, metavar=messages["metavar.samples"],
+                    help=messages("gui.help.window", default=engine.DEFAULT_WINDOW))
+parser.add_argument("--fps", type=float, default=10.0, help=messages["gui.help.fps"])
+parser.add_argument("--dtype", choices=engine.RAW_DTYPES, default="float64", help=messages["gui.help.dtype"])
+args = parser.parse_args()
+if args.systems:
+    engine.load_systems(args.systems)
+
+# Text and mode of the last processed signal, and of the one being processed (None before the first one)
+last_request = None
+last_result = None  # (x, transforms) of the last processed signal, for "Save results"
+plot_orig = None  # Signals tab plots, built once the window is shown
+ax_spectrum = None  # Spectrum tab axes, likewise
+live_plots = None  # Live tab plots, likewise
+live_position = None  # Stream position of the last live frame drawn
+running_request = None
+
+# Background worker for the analysis; its events are polled from the Tk loop every POLL_INTERVAL_MS
+worker = engine.JobRunner()
+POLL_INTERVAL_MS = 50
+
+# --- Building the Graphical Interface ---
+
+# Creating the main window
+root = tk.Tk()
+root.title(messages["title"])
+root.geometry("800x800")
+
+# File menu: results; Tools menu: profiling and per-stage timings
+profile_var = tk.BooleanVar(value=args.profile)
+menubar = tk.Menu(root)
+file_menu = tk.Menu(menubar, tearoff=0)
+file_menu.add_command(label=messages["gui.menu.save"], command=save_results_file)
+menubar.add_cascade(label=messages["gui.menu.file"], menu=file_menu)
+tools_menu = tk.Menu(menubar, tearoff=0)
+tools_menu.add_checkbutton(label=messages["gui.menu.profile"], variable=profile_var)
+tools_menu.add_command(label=messages["gui.menu.show_metrics"], command=show_metrics)
+tools_menu.add_command(label=messages["gui.menu.export_metrics"], command=export_metrics)
+tools_menu.add_command(label=messages["gui.menu.reset_metrics"], command=engine.default_metrics.reset)
+menubar.add_cascade(label=messages["gui.menu.tools"], menu=tools_menu)
+root.config(menu=menubar)
+
+# Top frame with instructions and input
+frameInput = tk.Frame(root)
+frameInput.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
+
+tk.Label(frameInput, text=messages["welcome"], font=("Arial", 16)).pack()
+tk.Label(frameInput, text=messages["gui.instructions"], font=("Arial", 12)).pack()
+tk.Label(frameInput, text=messages["gui.recommendation"], font=("Arial", 12)).pack(pady=5)
+
+# Input field
+entry = tk.Entry(frameInput, font=("Arial", 12), width=40)
+entry.pack(pady=5)
+
+# Checkbox to lift the 9-sample / -9..9 limits
+unlimited_var = tk.BooleanVar(value=False)
+tk.Checkbutton(frameInput, text=messages["gui.unlimited"],
+               variable=unlimited_var, font=("Arial", 10)).pack()
+
+# Button to process the signal
+btnProcess = tk.Button(frameInput, text=messages["gui.process"], font=("Arial", 12), command=process_signal)
+btnProcess.pack(pady=5)
+
+# Progress of the analysis running in the background
+progress_var = tk.DoubleVar(value=0)
+ttk.Progressbar(frameInput, variable=progress_var, maximum=100, length=300).pack()
+status_var = tk.StringVar(value="")
+tk.Label(frameInput, textvariable=status_var, font=("Arial", 10)).pack()
+
+# Notebook with tabs: Signals, Spectrum and Analysis
+notebook = ttk.Notebook(root)
+notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+# "Signals" Tab
+tab_signals = tk.Frame(notebook)
+notebook.add(tab_signals, text=messages["gui.tab.signals"])
+frameSignals = tk.Frame(tab_signals)
+frameSignals.pack(fill=tk.BOTH, expand=True)
+root.after_idle(build_signals_tab)  # Figures are built once the window is shown
+
+# "Spectrum" Tab
+tab_spectrum = tk.Frame(notebook)
+notebook.add(tab_spectrum, text=messages["gui.tab.spectrum"])
+frameSpectrum = tk.Frame(tab_spectrum)
+frameSpectrum.pack(fill=tk.BOTH, expand=True)
+root.after_idle(build_spectrum_tab)
+
+# "Live" Tab (with --live): the last samples of the stream, redrawn LIVE_FRAME_MS apart
+if args.live:
+    tab_live = tk.Frame(notebook)
+    notebook.add(tab_live, text=messages["gui.tab.live"])
+    live_stats_var = tk.StringVar(value=messages["gui.live.waiting"])
+    tk.Label(tab_live, textvariable=live_stats_var, font=("Courier", 9), justify=tk.LEFT).pack(anchor=tk.W)
+    frameLive = tk.Frame(tab_live)
+    frameLive.pack(fill=tk.BOTH, expand=True)
+    LIVE_FRAME_MS = 1000 / args.fps
+    live = engine.LiveAnalysis(engine.live_chunks(args.live, args.dtype),
+                               engine.SlidingWindow(args.window, args.dtype)).start()
+    notebook.select(tab_live)
+    root.after_idle(build_live_tab)
+    root.after(int(LIVE_FRAME_MS), refresh_live)
+
+# "System Analysis" Tab
+tab_analysis = tk.Frame(notebook)
+notebook.add(tab_analysis, text=messages["gui.tab.analysis"])
+
+frame_analysis = tk.Frame(tab_analysis)
+frame_analysis.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+scrollbar_analysis = tk.Scrollbar(frame_analysis)
+scrollbar_analysis.pack(side=tk.RIGHT, fill=tk.Y)
+
+# Text box for system analysis
+textAnalysis = tk.Text(frame_analysis, wrap=tk.WORD, font=("Arial", 12), yscrollcommand=scrollbar_analysis.set)
+textAnalysis.pack(fill=tk.BOTH, expand=True)
+scrollbar_analysis.config(command=textAnalysis.yview)
+textAnalysis.config(state="disabled")  # Initially disabled
+
+# Start polling the worker and the interface main loop
+root.after(POLL_INTERVAL_MS, poll_worker)
+root.mainloop()
+
+if args.metrics:
+    engine.default_metrics.export(args.metrics)
\ No newline at end of file
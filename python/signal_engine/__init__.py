@@ -0,0 +1,136 @@
+"""Headless signal-processing engine shared by the CLI and GUI front ends.
+
+Importing this package never touches tkinter or matplotlib, so batch jobs and
+worker processes can use it without paying for the graphical stack. Its
+submodules are imported on first use of one of their names (``engine.shift``
+imports ``transforms``, and NumPy with it), so a run only pays for the parts of
+the engine it touches.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "shift": "transforms",
+    "reflect": "transforms",
+    "compress": "transforms",
+    "remap": "transforms",
+    "IndexedSignal": "transforms",
+    "difference": "systems",
+    "cumulative_sum": "systems",
+    "decimate": "systems",
+    "SYSTEMS": "systems",
+    "difference_dtype": "accumulate",
+    "sum_dtype": "accumulate",
+    "fir_dtype": "accumulate",
+    "check_difference": "accumulate",
+    "RunningSum": "accumulate",
+    "running_sum": "accumulate",
+    "parse_signal": "parsing",
+    "check_limits": "parsing",
+    "MAX_SAMPLES": "parsing",
+    "MAX_AMPLITUDE": "parsing",
+    "SignalParseError": "parsing",
+    "StreamingDifference": "streaming",
+    "StreamingCumulativeSum": "streaming",
+    "StreamingDecimate": "streaming",
+    "STREAMING_SYSTEMS": "streaming",
+    "stream_system": "streaming",
+    "stream_systems": "streaming",
+    "text_chunks": "streaming",
+    "binary_chunks": "streaming",
+    "RAW_DTYPES": "fileio",
+    "TEXT_EXTENSIONS": "fileio",
+    "open_signal": "fileio",
+    "is_text_file": "fileio",
+    "load_text": "fileio",
+    "convert_text": "fileio",
+    "run_systems_to_files": "fileio",
+    "pack_signals": "batch",
+    "analyze_batch": "batch",
+    "signal_result": "batch",
+    "load_batch": "batch",
+    "parallel_systems": "parallel",
+    "parallel_systems_to_files": "parallel",
+    "parallel_batch": "parallel",
+    "PROPERTIES": "properties",
+    "PropertyResult": "properties",
+    "verify_system": "properties",
+    "lfilter": "filters",
+    "REGISTRY": "registry",
+    "BUILTIN_SYSTEMS": "registry",
+    "RegisteredSystem": "registry",
+    "register_system": "registry",
+    "register_lti": "registry",
+    "register_fir": "registry",
+    "get_system": "registry",
+    "unregister_system": "registry",
+    "load_systems": "registry",
+    "ResultCache": "cache",
+    "configure_cache": "cache",
+    "cached_transform": "cache",
+    "cached_system": "cache",
+    "cached_verify": "cache",
+    "cached_batch": "cache",
+    "cache_stats": "cache",
+    "RESULTS_FORMAT": "results",
+    "SavedResults": "results",
+    "save_results": "results",
+    "save_batch_results": "results",
+    "load_results": "results",
+    "saved_signal": "results",
+    "Spectrum": "spectrum",
+    "FrequencyResponse": "spectrum",
+    "periodogram": "spectrum",
+    "welch": "spectrum",
+    "power_spectrum": "spectrum",
+    "frequency_response": "spectrum",
+    "is_lti": "spectrum",
+    "analyze_spectrum": "spectrum",
+    "to_db": "spectrum",
+    "DEFAULT_PORT": "server",
+    "AnalysisServer": "server",
+    "serve": "server",
+    "AnalysisClient": "client",
+    "ServiceError": "client",
+    "EXPORT_FORMATS": "export",
+    "export_plots": "export",
+    "DEFAULT_WINDOW": "realtime",
+    "WindowStats": "realtime",
+    "LiveSnapshot": "realtime",
+    "RingBuffer": "realtime",
+    "SlidingStats": "realtime",
+    "SlidingSpectrum": "realtime",
+    "SlidingWindow": "realtime",
+    "LiveAnalysis": "realtime",
+    "live_chunks": "realtime",
+    "LOCALES": "messages",
+    "DEFAULT_LOCALE": "messages",
+    "Catalog": "messages",
+    "load_catalog": "messages",
+    "SystemReport": "report",
+    "format_report": "report",
+    "Cancelled": "jobs",
+    "Job": "jobs",
+    "JobRunner": "jobs",
+    "Metrics": "metrics",
+    "default_metrics": "metrics",
+    "span": "metrics",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Imports the submodule defining ``name`` on first access (PEP 562)."""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later accesses skip this function
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,270 @@
+"""Sample-type policy of the difference and cumulative-sum systems.
+
+Outputs are widened so that they can hold every result the input type allows:
+
+- a difference of two integers needs one more bit: int8/int16/int32 inputs
+  give int16/int32/int64 outputs and unsigned inputs give signed ones;
+- a running sum of integers is accumulated in int64 (uint64 for unsigned
+  inputs), and one of float16/float32 samples in float64;
+- an FIR filter with integer taps on integers is accumulated in the smallest
+  integer type that holds every output the input type allows (for the taps
+  [1, -1] of the difference, the same type as a difference).
+
+64-bit integers cannot be widened further, so their results are range-checked
+and an overflow raises OverflowError instead of wrapping around. The check is
+a max/min bound over the input; the exact position of an overflow is only
+searched for when that bound fails.
+
+Floating-point running sums are blocked. Each block of SUM_BLOCK samples is
+summed with a plain ``np.cumsum``, so its rounding error grows with the block
+length only. The block totals are then carried with compensated (Kahan/TwoSum)
+additions, so the error does not keep growing with the signal length.
+"""
+
+import numpy as np
+
+# Samples per block of a floating-point running sum
+SUM_BLOCK = 1 << 12
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def difference_dtype(dtype):
+    """The sample type of x[n] - x[n-1] for samples of ``dtype``."""
+    dtype = np.dtype(dtype).newbyteorder("=")
+    if dtype.kind == "b":
+        return np.dtype(np.int8)
+    if dtype.kind in "iu":
+        # One more bit than the input: the next wider signed type (int64 at most)
+        return np.dtype(f"i{min(2 * dtype.itemsize, 8)}")
+    return dtype
+
+
+def sum_dtype(dtype):
+    """The accumulator type of a running sum of samples of ``dtype``."""
+    dtype = np.dtype(dtype).newbyteorder("=")
+    if dtype.kind in "bi":
+        return np.dtype(np.int64)
+    if dtype.kind == "u":
+        return np.dtype(np.uint64)
+    if dtype.kind == "f" and dtype.itemsize < 8:
+        return np.dtype(np.float64)
+    if dtype.kind == "c" and dtype.itemsize < 16:
+        return np.dtype(np.complex128)
+    return dtype
+
+
+def _fir_bounds(taps, low, high):
+    """Smallest and largest output of integer FIR ``taps`` on samples in [low, high]."""
+    return (sum(min(tap * low, tap * high) for tap in taps),
+            sum(max(tap * low, tap * high) for tap in taps))
+
+
+def fir_dtype(taps, dtype):
+    """The sample type of an FIR filter with integer ``taps`` on samples of ``dtype``.
+
+    Unsigned when no output can be negative. When no type holds every output
+    the input type allows, int64 (uint64), whose outputs check_fir verifies.
+    """
+    dtype = np.dtype(dtype).newbyteorder("=")
+    info = np.iinfo(dtype) if dtype.kind in "iu" else np.iinfo(np.uint8)  # Booleans: 0 or 1
+    low, high = _fir_bounds(taps, int(info.min), min(int(info.max), 1) if dtype.kind == "b" else int(info.max))
+    kind = "u" if low >= 0 else "i"
+    for size in (1, 2, 4, 8):
+        candidate = np.iinfo(f"{kind}{size}")
+        if candidate.min <= low and high <= candidate.max:
+            return np.dtype(f"{kind}{size}")
+    return np.dtype(f"{kind}8")
+
+
+def check_fir(taps, x, dtype):
+    """Raises OverflowError if some output of integer FIR ``taps`` on x does not fit in ``dtype``.
+
+    Only 64-bit outputs of 64-bit inputs can overflow. The check is a bound
+    over the range of x; the outputs are only computed exactly (with Python
+    integers) when that bound fails.
+    """
+    info = np.iinfo(dtype)
+    if x.size == 0:
+        return
+    low, high = _fir_bounds(taps, int(x.min()), int(x.max()))
+    if info.min <= low and high <= info.max:
+        return
+    exact = np.zeros(x.shape, dtype=object)
+    samples = x.astype(object)
+    for k, tap in enumerate(taps):
+        if tap and k < x.shape[-1]:
+            exact[..., k:] += tap * samples[..., :x.shape[-1] - k]
+    bad = np.argwhere((exact < info.min) | (exact > info.max))
+    if len(bad):
+        raise OverflowError(f"FIR output does not fit in {dtype} at n = {bad[0][-1]}")
+
+
+def check_difference(x, last=None, start=0):
+    """Raises OverflowError if some x[n] - x[n-1] does not fit in the output type.
+
+    When x is a chunk of a longer signal, ``last`` is the sample preceding it
+    and ``start`` the index of x[0] in the whole signal. Only 64-bit integers
+    can overflow; other inputs return at once.
+    """
+    if x.dtype.kind not in "iu" or x.dtype.itemsize < 8 or x.size == 0:
+        return  # Also an empty batch (no rows), which has no max/min
+    high, low = int(x.max()), int(x.min())
+    if last is not None:
+        high, low = max(high, int(last)), min(low, int(last))
+    if high - low <= _INT64_MAX:
+        return
+    # Some pair of samples is too far apart: find the first consecutive one
+    if last is not None:
+        x = np.concatenate([np.asarray(last, dtype=x.dtype).reshape(x.shape[:-1] + (1,)), x], axis=-1)
+    a, b = x[..., 1:], x[..., :-1]
+    if x.dtype.kind == "u":
+        bad = np.where(a >= b, a - b > _INT64_MAX, b - a > _INT64_MAX + 1)
+    else:
+        with np.errstate(over="ignore"):
+            d = a - b  # Wraps around where the true difference does not fit
+        bad = ((a ^ b) & (a ^ d)) < 0
+    if not bad.any():
+        return  # Far-apart samples, but never consecutive ones (or a difference of exactly -2**63)
+    n = start + np.argwhere(bad)[0][-1] + (0 if last is not None else 1)
+    raise OverflowError(f"x[n] - x[n-1] does not fit in int64 at n = {n}")
+
+
+def conform_chunk(x, dtype):
+    """A chunk of a signal in ``dtype``, the sample type of its first chunk (None: x is the first).
+
+    Carried state (the last sample, a running sum) only continues in one type.
+    A later chunk is converted when NumPy casts it safely (int64 samples after
+    float64 ones), as concatenating the chunks would; otherwise ValueError.
+    """
+    if dtype is None or x.dtype == dtype:
+        return x
+    if not np.can_cast(x.dtype, dtype, "safe"):
+        raise ValueError(f"a chunk of {x.dtype} samples follows chunks of {dtype}; "
+                         f"read the whole signal as one sample type (e.g. dtype=float64)")
+    return x.astype(dtype)
+
+
+class RunningSum:
+    """Running sum along the last axis, continued from one call to the next.
+
+    Feeding a signal in chunks gives results bit-identical to one call on the
+    whole signal. ``position`` counts the samples summed so far (per row).
+    Every chunk takes the sample type of the first one (see conform_chunk).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.position = 0
+        self.dtype = None         # Sample type of the first chunk
+        self.total = None         # Integers: running sum up to the previous chunk
+        self.carry = None         # Floats: compensated sum of the completed blocks,
+        self.compensation = None  # as a value plus its accumulated rounding error
+        self.partial = None       # Floats: running sum of the unfinished block
+        self.filled = 0           # Samples in the unfinished block
+
+    def process(self, x):
+        """The running sum of x, continuing the previous chunks; a new array of ``sum_dtype``."""
+        x = conform_chunk(np.asarray(x), self.dtype)
+        y = x.astype(sum_dtype(x.dtype))
+        if y.shape[-1]:
+            self.dtype = x.dtype
+            if y.dtype.kind in "iu":
+                self._integers(x, y)
+            else:
+                self._floats(y)
+            self.position += y.shape[-1]
+        return y
+
+    def _integers(self, x, y):
+        if self.total is None:
+            self.total = np.zeros(y.shape[:-1], dtype=y.dtype)
+        limit = np.iinfo(y.dtype).max
+        if x.dtype.itemsize < 8 and x.dtype.kind in "biu":
+            largest = 1 << (8 * x.dtype.itemsize)
+        else:
+            largest = max(abs(int(x.max(initial=0))), abs(int(x.min(initial=0))))  # A batch may have no rows
+        safe = int(np.abs(self.total).max(initial=0)) + y.shape[-1] * largest <= limit
+        with np.errstate(over="ignore"):
+            y[..., 0] += self.total
+            np.cumsum(y, axis=-1, out=y)
+        if not safe:
+            self._find_overflow(x.astype(y.dtype), y)
+        self.total = y[..., -1].copy()
+
+    def _find_overflow(self, increments, y):
+        """Raises OverflowError at the first running sum that wrapped around."""
+        before = np.concatenate([self.total[..., None], y[..., :-1]], axis=-1)
+        if y.dtype.kind == "u":
+            wrapped = y < before
+        else:
+            # Adding two numbers of the same sign cannot change the sign
+            wrapped = ((before ^ increments) >= 0) & ((before ^ y) < 0)
+        if wrapped.any():
+            n = self.position + np.argwhere(wrapped)[0][-1]
+            raise OverflowError(f"the running sum does not fit in {y.dtype} at n = {n}")
+
+    def _carried(self):
+        """The compensated sum of the completed blocks, as one value per row."""
+        return self.carry + self.compensation
+
+    def _close_block(self):
+        """Adds the finished block's total to the carry with a compensated (TwoSum) addition."""
+        carry = self.carry + self.partial
+        z = carry - self.carry
+        self.compensation = self.compensation + ((self.carry - (carry - z)) + (self.partial - z))
+        self.carry = carry
+        self.partial = np.zeros_like(self.partial)
+        self.filled = 0
+
+    def _floats(self, y):
+        if self.carry is None:
+            self.carry = np.zeros(y.shape[:-1], dtype=y.dtype)
+            self.compensation = np.zeros_like(self.carry)
+            self.partial = np.zeros_like(self.carry)
+        length = y.shape[-1]
+
+        # Samples that finish the block left open by the previous chunk
+        head = min((-self.filled) % SUM_BLOCK, length)
+        if head:
+            part = y[..., :head]
+            part[..., 0] += self.partial  # Repeats the additions of a whole-block cumsum
+            np.cumsum(part, axis=-1, out=part)
+            self.partial = part[..., -1].copy()
+            part += self._carried()[..., None]
+            self.filled += head
+            if self.filled == SUM_BLOCK:
+                self._close_block()
+
+        # Whole blocks: one cumsum per block, then all the carries at once
+        count = (length - head) // SUM_BLOCK
+        if count:
+            body = y[..., head:head + count * SUM_BLOCK]
+            blocks = body.reshape(body.shape[:-1] + (count, SUM_BLOCK))
+            np.cumsum(blocks, axis=-1, out=blocks)
+            totals = blocks[..., -1]
+            # Sequential sums of the carry and the block totals, plus their exact rounding errors
+            sums = np.cumsum(np.concatenate([self.carry[..., None], totals], axis=-1), axis=-1)
+            before, after = sums[..., :-1], sums[..., 1:]
+            z = after - before
+            errors = (before - (after - z)) + (totals - z)
+            compensation = np.cumsum(np.concatenate([self.compensation[..., None], errors], axis=-1), axis=-1)
+            blocks += (before + compensation[..., :-1])[..., None]
+            if not np.may_share_memory(blocks, y):
+                body[...] = blocks.reshape(body.shape)  # reshape had to copy (non-contiguous rows)
+            self.carry, self.compensation = sums[..., -1].copy(), compensation[..., -1].copy()
+
+        # Start of a new block, left open for the next chunk
+        tail = y[..., head + count * SUM_BLOCK:]
+        if tail.shape[-1]:
+            np.cumsum(tail, axis=-1, out=tail)
+            self.partial = tail[..., -1].copy()
+            self.filled = tail.shape[-1]
+            tail += self._carried()[..., None]
+
+
+def running_sum(x):
+    """Running sum of x along the last axis, under the policy of this module."""
+    return RunningSum().process(x)
@@ -0,0 +1,140 @@
+"""Vectorized analysis of many signals at once.
+
+A batch is a 2-D array with one signal per row. Signals of different lengths
+are packed into a zero-padded array plus their lengths. Every transform and
+system runs along axis 1 in a single NumPy call for the whole batch, and the
+per-signal results come back as one structured array.
+"""
+
+import numpy as np
+
+from .accumulate import difference_dtype, sum_dtype
+from .parsing import parse_signal
+from .systems import cumulative_sum, difference
+
+
+def pack_signals(signals, dtype=None):
+    """Packs a list of 1-D signals into a zero-padded 2-D array.
+
+    Returns ``(X, lengths)``, where row i of X holds signals[i] followed by zeros.
+    """
+    signals = [np.asarray(signal) for signal in signals]
+    lengths = np.array([len(signal) for signal in signals], dtype=np.int64)
+    if dtype is None:
+        dtype = np.result_type(*signals) if signals else np.int64
+    X = np.zeros((len(signals), lengths.max(initial=0)), dtype=dtype)
+    X[np.arange(X.shape[1]) < lengths[:, None]] = np.concatenate(signals) if signals else []
+    return X, lengths
+
+
+def batch_dtype(length, dtype):
+    """The structured dtype holding the results of one signal of up to ``length`` samples."""
+    dtype = np.dtype(dtype)
+    compressed = (length + 1) // 2
+    return np.dtype([
+        ("length", np.int64),
+        ("x", dtype, (length,)),
+        ("shifted_n", np.int64, (length,)),
+        ("reflected_n", np.int64, (length,)),
+        ("compressed_n", np.int64, (compressed,)),
+        ("compressed", dtype, (compressed,)),
+        ("y1", difference_dtype(dtype), (length,)),
+        ("y2", sum_dtype(dtype), (length,)),
+        ("y3", dtype, (compressed,)),
+    ])
+
+
+def _unique_rows(X, lengths):
+    """Indices of the first occurrence of each distinct (row, length) pair, and the inverse map."""
+    rows = np.concatenate([X.reshape(len(X), -1).view(np.uint8).reshape(len(X), -1),
+                           lengths.astype(np.int64).view(np.uint8).reshape(len(X), -1)], axis=1)
+    keys = np.ascontiguousarray(rows).view(np.dtype((np.void, rows.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return first, inverse.ravel()
+
+
+def analyze_batch(X, lengths=None, shift_by=2, deduplicate=False):
+    """Runs the three transforms and the three systems on every row of X.
+
+    ``lengths`` gives the valid samples of each row (all of them if omitted).
+    Returns a structured array with one record per signal; entries past a
+    signal's length are padding and hold zeros. With ``deduplicate``, repeated
+    signals are analyzed once and their records copied.
+    """
+    X = np.asarray(X)
+    if X.ndim != 2:
+        raise ValueError(f"expected a 2-D batch of signals, got shape {X.shape}")
+    count, length = X.shape
+    if lengths is None:
+        lengths = np.full(count, length, dtype=np.int64)
+        valid = None
+    else:
+        lengths = np.asarray(lengths, dtype=np.int64)
+        valid = np.arange(length) < lengths[:, None]  # Mask of real (non-padding) samples
+        X = np.where(valid, X, 0)
+
+    if deduplicate and count:
+        first, inverse = _unique_rows(X, lengths)
+        if len(first) < count:
+            return analyze_batch(X[first], lengths[first], shift_by)[inverse]
+
+    results = np.zeros(count, dtype=batch_dtype(length, X.dtype))
+    results["length"] = lengths
+    results["x"] = X
+
+    # --- Transforms: the index axes are the same for every row ---
+    results["shifted_n"] = np.arange(shift_by, length + shift_by)
+    results["reflected_n"] = np.arange(0, -length, -1)
+    results["compressed_n"] = np.arange((length + 1) // 2)
+    results["compressed"] = X[:, ::2]
+
+    # --- Systems, each in one call along axis 1 ---
+    y1 = results["y1"]
+    y1[...] = difference(X)
+    results["y2"] = cumulative_sum(X)
+    results["y3"] = X[:, ::2]
+    if valid is not None:
+        y1[~valid] = 0                   # x[len] - x[len-1] would leak past the end
+        results["y2"][~valid] = 0        # The running sum would repeat past the end
+        # Index axes only exist for the valid samples of each signal
+        results["shifted_n"][~valid] = 0
+        results["reflected_n"][~valid] = 0
+        results["compressed_n"][~valid[:, ::2]] = 0
+    return results
+
+
+def signal_result(results, i):
+    """Returns the results of signal i as a dict of arrays trimmed to its length."""
+    record = results[i]
+    length = int(record["length"])
+    compressed = (length + 1) // 2
+    trimmed = {"length": length}
+    for name in results.dtype.names[1:]:
+        trimmed[name] = record[name][:compressed if name.startswith(("compressed", "y3")) else length]
+    return trimmed
+
+
+
+def load_batch(path, lengths_path=None):
+    """Loads a batch of signals from a file, returning ``(X, lengths)``.
+
+    ``.npy`` files hold a 2-D array (lengths may come from a second ``.npy``
+    file); ``.npz`` files hold ``signals`` and optionally ``lengths``; any
+    other file is read as text with one signal per line.
+    """
+    if path.endswith(".npz"):
+        with np.load(path) as archive:
+            X = archive["signals"]
+            lengths = archive["lengths"] if "lengths" in archive else None
+    elif path.endswith(".npy"):
+        X = np.load(path)
+        lengths = None
+    else:
+        with open(path) as f:
+            return pack_signals([parse_signal(line, first_line=number)
+                                 for number, line in enumerate(f, 1) if line.strip()])
+    if lengths_path is not None:
+        lengths = np.load(lengths_path)
+    if X.ndim != 2:
+        raise ValueError(f"expected a 2-D batch of signals, got shape {X.shape}")
+    return X, lengths
@@ -0,0 +1,393 @@
+"""Memoization of transforms, systems and property analyses.
+
+Results are keyed by the operation, a BLAKE2 hash of the input array's bytes,
+its dtype and shape, and the operation's parameters (including which system).
+They are held in a memory-bounded LRU, with an optional on-disk tier so that
+repeated analyses are also reused across runs. The on-disk tier has its own
+size budget; beyond it, the least recently used files are removed.
+
+In memory, a system is identified by its name and the identity of its
+function. On disk, where the function object is gone, it is identified by its
+content instead: bytecode, constants, defaults, closure values and referenced
+globals, recursively. Disk entries are also salted with a hash of the engine's
+source, so results computed by an older engine are never served.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import threading
+import types
+from collections import OrderedDict
+
+import numpy as np
+
+from .batch import analyze_batch
+from .properties import verify_system
+from .transforms import IndexedSignal, compress, reflect, shift
+
+# Default memory budget of a cache (bytes)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Default budget of the on-disk tier of a cache (bytes)
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+# Transforms that can be cached by name
+TRANSFORMS = {"shift": shift, "reflect": reflect, "compress": compress}
+
+_MISSING = object()
+
+
+def array_key(x):
+    """Content key of an array: hash of its bytes, dtype and shape."""
+    x = np.ascontiguousarray(x)
+    digest = hashlib.blake2b(memoryview(x).cast("B"), digest_size=16).hexdigest()
+    return digest, x.dtype.str, x.shape
+
+
+@functools.lru_cache(maxsize=None)
+def engine_version():
+    """Hash of the engine's source files, salting the keys of the on-disk tier."""
+    digest = hashlib.blake2b(digest_size=8)
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            with open(os.path.join(directory, name), "rb") as f:
+                digest.update(name.encode() + b"\0" + f.read())
+    return digest.hexdigest()
+
+
+class _Unstable(Exception):
+    """A value whose content cannot be described the same way in another run."""
+
+
+# Values whose repr is their content
+_PLAIN = (bool, int, float, complex, str, bytes, type(None), type(Ellipsis))
+
+
+def _fingerprint(value, seen):
+    """Content of a value a system depends on, as a repr-able tuple (_Unstable if it has none)."""
+    if isinstance(value, _PLAIN):
+        return value
+    if isinstance(value, np.ndarray):
+        return ("array",) + array_key(value)
+    if isinstance(value, np.generic):
+        return ("scalar", value.dtype.str, value.item())
+    if isinstance(value, (tuple, list, frozenset)):
+        items = sorted(value, key=repr) if isinstance(value, frozenset) else value
+        return (type(value).__name__,) + tuple(_fingerprint(item, seen) for item in items)
+    if isinstance(value, dict):
+        return ("dict",) + tuple((repr(key), _fingerprint(item, seen)) for key, item in sorted(value.items(), key=repr))
+    if isinstance(value, types.ModuleType):
+        return ("module", value.__name__)
+    if isinstance(value, types.CodeType):
+        return ("code", hashlib.blake2b(value.co_code, digest_size=8).hexdigest(), value.co_names,
+                _fingerprint(value.co_consts, seen))
+    if isinstance(value, (types.BuiltinFunctionType, np.ufunc)):
+        return ("builtin", getattr(value, "__module__", None), value.__name__)
+    if isinstance(value, functools.partial):
+        return ("partial", _fingerprint(value.func, seen), _fingerprint(value.args, seen),
+                _fingerprint(value.keywords, seen))
+    if isinstance(value, types.FunctionType):
+        if id(value) in seen:
+            return ("recursive", value.__qualname__)
+        seen = seen | {id(value)}
+        code = value.__code__
+        closure = []
+        for cell in value.__closure__ or ():
+            try:
+                closure.append(_fingerprint(cell.cell_contents, seen))
+            except ValueError:  # Empty cell
+                closure.append(("empty",))
+        referenced = ()
+        module = value.__module__ or ""  # None for functions built by exec without __name__
+        if not module.startswith(__package__ + "."):  # Engine globals are covered by engine_version
+            referenced = tuple((name, _fingerprint(value.__globals__[name], seen))
+                               for name in code.co_names if name in value.__globals__)
+        return ("function", value.__module__, value.__qualname__, _fingerprint(code, seen),
+                _fingerprint(value.__defaults__, seen), _fingerprint(value.__kwdefaults__, seen),
+                tuple(closure), referenced)
+    if callable(value) and isinstance(getattr(value, "__qualname__", None), str):
+        return ("callable", getattr(value, "__module__", None), value.__qualname__)  # Classes, library functions
+    raise _Unstable(type(value).__qualname__)
+
+
+class _Identity:
+    """A function in a cache key: the same object in memory, the same content on disk."""
+
+    __slots__ = ("function",)
+
+    def __init__(self, function):
+        self.function = function  # Held, so its id cannot be reused by another function
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.function is self.function
+
+    def __hash__(self):
+        return id(self.function)
+
+    def __repr__(self):
+        return f"_Identity({getattr(self.function, '__qualname__', type(self.function).__qualname__)})"
+
+    def fingerprint(self):
+        """Content of the function for the on-disk tier, or None if it has no stable description."""
+        try:
+            return _fingerprint(self.function, frozenset())
+        except (_Unstable, RecursionError):
+            return None
+
+
+def system_id(system):
+    """Identifier of a system callable, used in cache keys.
+
+    Registered systems are identified by their registry name and function,
+    other callables by their qualified name and themselves. Two systems only
+    share results if they are the same function object (or, on disk, have
+    the same content).
+    """
+    function = getattr(system, "function", system)
+    name = getattr(system, "name", None) or getattr(function, "__qualname__", type(function).__qualname__)
+    return (name, _Identity(function))
+
+
+def _disk_key(key):
+    """The key of a result on disk: functions replaced by their content (None if one has none)."""
+    if isinstance(key, _Identity):
+        fingerprint = key.fingerprint()
+        if fingerprint is None:
+            raise _Unstable(repr(key))
+        return fingerprint
+    if isinstance(key, tuple):
+        return tuple(_disk_key(item) for item in key)
+    return key
+
+
+def _arrays(values):
+    """The arrays among (or inside) a sequence of arguments."""
+    return [value.values if isinstance(value, IndexedSignal) else value for value in values
+            if isinstance(value, (np.ndarray, IndexedSignal))]
+
+
+def _freeze(value, inputs=None):
+    """Makes cached arrays read-only and independent of the caller's buffers.
+
+    ``inputs`` are the arrays the value was computed from; None means the
+    value itself came from the caller. Arrays that are views, or that share
+    memory with an input (a transform returning x, a system returning its
+    argument), are copied, so the flags of the caller's arrays never change.
+    """
+    if isinstance(value, np.ndarray):
+        if (inputs is None or value.base is not None
+                or any(np.may_share_memory(value, x) for x in inputs)):
+            value = value.copy()  # The caller's array, or a view that would change with it
+        value.setflags(write=False)
+        return value
+    if isinstance(value, IndexedSignal):
+        return IndexedSignal(_freeze(value.values, inputs), value.origin, value.step)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return type(value)(*(_freeze(item, inputs) for item in value))
+    if isinstance(value, (tuple, list)):
+        return type(value)(_freeze(item, inputs) for item in value)
+    if isinstance(value, dict):
+        return {key: _freeze(item, inputs) for key, item in value.items()}
+    return value
+
+
+def _size(value):
+    """Approximate memory held by a cached value, in bytes."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes + 112
+    if isinstance(value, IndexedSignal):
+        return _size(value.values) + 64
+    if isinstance(value, (tuple, list)):
+        return sum(_size(item) for item in value) + 56
+    if isinstance(value, dict):
+        return sum(_size(item) for item in value.values()) + 232
+    return 64
+
+
+class ResultCache:
+    """LRU cache bounded by ``max_bytes``, with an optional on-disk tier in ``directory``.
+
+    The on-disk tier is bounded by ``max_disk_bytes``: a file's modification
+    time records its last use, and the oldest files are removed first. Several
+    processes may share the directory.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, directory=None, max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_bytes = None         # Size of the on-disk tier, measured on the first write
+        self.entries = OrderedDict()   # key -> (value, size), least recently used first
+        self.bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self.lock = threading.Lock()   # The GUI may use the cache from a worker thread
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        """File of key in the on-disk tier, or None if the key cannot be stored across runs."""
+        try:
+            key = _disk_key(key)
+        except _Unstable:
+            return None
+        name = hashlib.blake2b(repr((engine_version(), key)).encode(), digest_size=16).hexdigest()
+        return os.path.join(self.directory, name + ".pkl")
+
+    def get(self, key, default=None):
+        """Returns the cached value for key, or ``default`` on a miss."""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+        path = self._path(key) if self.directory else None
+        if path:
+            try:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.PickleError, EOFError):
+                pass
+            else:
+                try:
+                    os.utime(path)  # Marks it as recently used
+                except OSError:
+                    pass  # Removed meanwhile by another process
+                with self.lock:
+                    self.disk_hits += 1
+                self._remember(key, value)
+                return value
+        with self.lock:
+            self.misses += 1
+        return default
+
+    def _remember(self, key, value):
+        size = _size(value)
+        with self.lock:
+            if key in self.entries:
+                self.bytes -= self.entries.pop(key)[1]
+            if size > self.max_bytes:
+                return  # Larger than the whole budget: not kept in memory
+            self.entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def put(self, key, value, inputs=None):
+        """Stores a read-only copy of value in memory and, if enabled, on disk.
+
+        When value was just computed from ``inputs`` (arrays), only the parts
+        that share memory with them are copied.
+        """
+        value = _freeze(value, inputs)
+        self._remember(key, value)
+        path = self._path(key) if self.directory else None
+        if path:
+            temporary = f"{path}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)  # Readers never see a partial file
+            self._trim_disk(os.path.getsize(path))
+        return value
+
+    def _disk_files(self):
+        """(last use, size, path) of every file of the on-disk tier, least recently used first."""
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pkl"):
+                    try:
+                        status = entry.stat()
+                    except OSError:
+                        continue  # Removed meanwhile by another process
+                    files.append((status.st_mtime, status.st_size, entry.path))
+        return sorted(files)
+
+    def _trim_disk(self, written):
+        """Counts a file just written, removing the least recently used ones beyond ``max_disk_bytes``."""
+        with self.lock:
+            if self.disk_bytes is not None:
+                self.disk_bytes += written
+            if self.disk_bytes is None or self.disk_bytes > self.max_disk_bytes:
+                files = self._disk_files()  # Other processes may have written or removed files
+                self.disk_bytes = sum(size for _, size, _ in files)
+                for _, size, path in files:
+                    if self.disk_bytes <= self.max_disk_bytes:
+                        break
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        continue
+                    self.disk_bytes -= size
+                    self.disk_evictions += 1
+
+    def call(self, key, function, *args, **kwargs):
+        """Returns the cached result for key, computing it with function(*args) on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.put(key, function(*args, **kwargs), _arrays(args))
+        return value
+
+    def stats(self):
+        """Hit/miss counters and memory use."""
+        with self.lock:
+            return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                    "evictions": self.evictions, "disk_evictions": self.disk_evictions,
+                    "entries": len(self.entries),
+                    "bytes": self.bytes, "max_bytes": self.max_bytes}
+
+    def clear(self):
+        """Empties the memory tier (the disk tier is left alone) and resets the counters."""
+        with self.lock:
+            self.entries.clear()
+            self.bytes = self.hits = self.disk_hits = self.misses = self.evictions = self.disk_evictions = 0
+
+
+# Cache shared by the cached_* helpers unless another one is passed
+default_cache = ResultCache()
+
+
+def configure_cache(max_bytes=DEFAULT_MAX_BYTES, directory=None, max_disk_bytes=DEFAULT_MAX_DISK_BYTES):
+    """Replaces the default cache, e.g. to enable the on-disk tier."""
+    global default_cache
+    default_cache = ResultCache(max_bytes, directory, max_disk_bytes)
+    return default_cache
+
+
+def cached_transform(name, x, *params, cache=None):
+    """A transform ("shift", "reflect" or "compress") of x, memoized."""
+    cache = cache or default_cache
+    return cache.call(("transform", name, array_key(x), params), TRANSFORMS[name], x, *params)
+
+
+def cached_system(system, x, cache=None):
+    """The output of a system for x, memoized."""
+    cache = cache or default_cache
+    return cache.call(("system", system_id(system), array_key(x)), system, x)
+
+
+def cached_verify(system, trials=1000, length=32, seed=0, cache=None):
+    """The property verdicts of a system (they do not depend on any input signal), memoized."""
+    cache = cache or default_cache
+    key = ("verify", system_id(system), trials, length, seed)
+    return cache.call(key, verify_system, system, trials, length, seed)
+
+
+def cached_batch(X, lengths=None, deduplicate=False, cache=None):
+    """The structured results of analyze_batch for a whole batch, memoized."""
+    cache = cache or default_cache
+    key = ("batch", array_key(X), array_key(lengths) if lengths is not None else None)
+    return cache.call(key, analyze_batch, X, lengths, deduplicate=deduplicate)
+
+
+def cache_stats():
+    """Hit/miss counters and memory use of the default cache."""
+    return default_cache.stats()
@@ -0,0 +1,141 @@
+"""Client of the local analysis service (see ``server``).
+
+An AnalysisClient keeps one connection open across calls and reconnects when
+the server has closed it. ``analyze_many`` pipelines its requests: up to
+PIPELINE_DEPTH of them are sent before the first answer is read, so the
+server receives them together and can batch them. Signals travel as ``.npy``
+bytes and results come back as the columnar results files of ``results``.
+"""
+
+import io
+import json
+import socket
+from urllib.parse import urlencode
+
+import numpy as np
+
+from .results import load_results
+from .server import DEFAULT_PORT, PIPELINE_DEPTH
+
+
+class ServiceError(RuntimeError):
+    """An error answer of the analysis service."""
+
+    def __init__(self, status, message):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+def _npy(x):
+    """A signal as the bytes of a .npy file."""
+    buffer = io.BytesIO()
+    np.lib.format.write_array(buffer, np.asarray(x), allow_pickle=False)
+    return buffer.getvalue()
+
+
+class AnalysisClient:
+    """Persistent connection to an analysis server on a Unix socket (``path``) or host:port."""
+
+    def __init__(self, path=None, host="127.0.0.1", port=DEFAULT_PORT, timeout=None):
+        self.address = path or (host, port)
+        self.timeout = timeout
+        self._socket = None
+        self._reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Closes the connection (the next request opens a new one)."""
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+            self._socket = self._reader = None
+
+    def _connect(self):
+        if isinstance(self.address, str):
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(self.timeout)
+            self._socket.connect(self.address)
+        else:
+            self._socket = socket.create_connection(self.address, self.timeout)
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+
+    def _exchange(self, requests):
+        """Sends (method, target, body) requests in one write and returns their (status, body) answers."""
+        data = bytearray()
+        for method, target, body in requests:
+            data += (f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+                     f"Content-Type: application/octet-stream\r\n"
+                     f"Content-Length: {len(body)}\r\n\r\n").encode()
+            data += body
+        self._socket.sendall(data)
+        return [self._receive() for _ in requests]
+
+    def _receive(self):
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionResetError("the analysis server closed the connection")
+        status = int(line.split()[1])
+        length, close = 0, False
+        while True:
+            line = self._reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+            elif name.strip().lower() == "connection":
+                close = value.strip().lower() == "close"
+        body = self._reader.read(length)
+        if close:
+            self.close()
+        return status, body
+
+    def _requests(self, requests):
+        """Answers of the requests, in windows of PIPELINE_DEPTH; raises ServiceError on the first error."""
+        answers = []
+        for first in range(0, len(requests), PIPELINE_DEPTH):
+            window = requests[first:first + PIPELINE_DEPTH]
+            try:
+                if self._socket is None:
+                    self._connect()
+                replies = self._exchange(window)
+            except (ConnectionError, BrokenPipeError):
+                # The server closed an idle connection (or restarted): analyses are safe to resend
+                self.close()
+                self._connect()
+                replies = self._exchange(window)
+            answers.extend(replies)
+        for status, body in answers:
+            if status != 200:
+                raise ServiceError(status, body.decode(errors="replace"))
+        return [body for _, body in answers]
+
+    def analyze(self, x, shift=2, systems=None, verify=True):
+        """Analyzes one signal; returns its results as a ``results.SavedResults``."""
+        return self.analyze_many([x], shift, systems, verify)[0]
+
+    def analyze_many(self, signals, shift=2, systems=None, verify=True):
+        """Analyzes several signals over the one connection; returns a SavedResults per signal.
+
+        ``systems`` is a list of system names (default: all of the server's).
+        """
+        options = {"shift": shift, "verify": int(bool(verify))}
+        if systems:
+            options["systems"] = ",".join(systems)
+        target = "/analyze?" + urlencode(options)
+        bodies = self._requests([("POST", target, _npy(x)) for x in signals])
+        return [load_results(io.BytesIO(body)) for body in bodies]
+
+    def systems(self):
+        """The names of the systems the server can run."""
+        return json.loads(self._requests([("GET", "/systems", b"")])[0])
+
+    def health(self):
+        """True if the server answers."""
+        return self._requests([("GET", "/health", b"")])[0] == b"ok"
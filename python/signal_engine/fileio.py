@@ -0,0 +1,151 @@
+"""Memory-mapped signal files, for captures larger than RAM.
+
+Inputs are raw binary files (any fixed-size NumPy dtype, either byte order) or
+``.npy`` files; both are opened with memory maps, so only the pages actually
+touched are read. Text captures (numbers separated by whitespace, commas or
+newlines) are converted once, block by block, into a ``.npy`` file that is
+then mapped like any other. System outputs are written straight into memory-mapped
+``.npy`` files, block by block, through the streaming processors.
+"""
+
+import contextlib
+import os
+
+import numpy as np
+
+from .accumulate import difference_dtype, sum_dtype
+from .streaming import STREAMING_SYSTEMS, text_chunks
+
+# Sample types accepted for raw binary inputs
+RAW_DTYPES = ("int16", "int32", "int64", "float32", "float64")
+
+# Extensions of files read as text rather than raw binary samples
+TEXT_EXTENSIONS = (".txt", ".csv", ".tsv")
+
+# Samples processed per block when writing outputs
+DEFAULT_BLOCK_SIZE = 1 << 22
+
+# Characters parsed per block when reading text signals
+TEXT_BLOCK_SIZE = 1 << 24
+
+
+def open_signal(path, dtype="float64", byteorder="little"):
+    """Opens a signal file read-only as a memory map.
+
+    ``.npy`` files carry their own dtype; for raw files, ``dtype`` and
+    ``byteorder`` (``"little"`` or ``"big"``) describe the samples.
+    """
+    if path.endswith(".npy"):
+        x = np.load(path, mmap_mode="r")
+        if x.ndim != 1:
+            raise ValueError(f"{path}: expected a 1-D signal, got shape {x.shape}")
+        return x
+    if dtype not in RAW_DTYPES:
+        raise ValueError(f"unsupported raw sample type: {dtype}")
+    raw_dtype = np.dtype(dtype).newbyteorder("<" if byteorder == "little" else ">")
+    if os.path.getsize(path) == 0:
+        return np.empty(0, dtype=raw_dtype)  # np.memmap cannot map an empty file
+    return np.memmap(path, dtype=raw_dtype, mode="r")
+
+
+def is_text_file(path):
+    """True if the file's extension marks it as a text signal."""
+    return path.lower().endswith(TEXT_EXTENSIONS)
+
+
+def _text_source(source):
+    """Opens a path in binary mode, or passes an already open file through."""
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "rb")
+    return contextlib.nullcontext(source)
+
+
+def load_text(source, dtype=None, allow_float=True, block_size=TEXT_BLOCK_SIZE):
+    """Reads a whole text signal (a path or an open file, such as stdin) into one array.
+
+    The text is parsed ``block_size`` characters at a time, so only the samples
+    and one block of text are in memory together. With ``dtype=None`` the result
+    is int64 unless some sample is not an integer.
+    """
+    with _text_source(source) as f:
+        chunks = list(text_chunks(f, dtype, block_size, allow_float))
+    if not chunks:
+        return np.array([], dtype=dtype or np.int64)
+    return np.concatenate(chunks)
+
+
+def convert_text(source, path, dtype="float64", block_size=TEXT_BLOCK_SIZE):
+    """Parses a text signal into a ``.npy`` file without holding it in memory; returns its memory map.
+
+    Samples are appended to the file as each block is parsed. The header is
+    written first for an empty array and rewritten in place with the final
+    length (NumPy leaves room in the header for the shape to grow). If the
+    text turns out to be malformed, the partial file is removed.
+    """
+    dtype = np.dtype(dtype)
+    header = {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (0,)}
+    with _text_source(source) as f, open(path, "wb") as out:
+        np.lib.format.write_array_header_1_0(out, header)
+        data_start = out.tell()
+        length = 0
+        try:
+            for chunk in text_chunks(f, dtype, block_size):
+                chunk.tofile(out)
+                length += len(chunk)
+        except ValueError:
+            out.close()
+            os.remove(path)
+            raise
+        out.seek(0)
+        header["shape"] = (length,)
+        np.lib.format.write_array_header_1_0(out, header)
+        if out.tell() != data_start:
+            raise RuntimeError(f"{path}: the .npy header grew while its length was being recorded")
+    return open_signal(path)
+
+
+def output_dtype(system, dtype):
+    """The (native byte order) sample type a system produces for input samples of ``dtype``."""
+    dtype = np.dtype(dtype).newbyteorder("=")
+    if system == 1:
+        return difference_dtype(dtype)
+    if system == 2:
+        return sum_dtype(dtype)
+    return dtype
+
+
+def output_length(system, length):
+    """The number of samples a system produces for an input of ``length`` samples."""
+    return (length + 1) // 2 if system == 3 else length
+
+
+def create_output(path, dtype, length):
+    """Creates a writable memory-mapped ``.npy`` file for ``length`` samples."""
+    return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(length,))
+
+
+def run_systems_to_files(x, paths, block_size=DEFAULT_BLOCK_SIZE):
+    """Runs systems over x block by block, writing each output to its file.
+
+    ``paths`` maps a system number (1, 2 or 3) to its output path. The input is
+    read once, ``block_size`` samples at a time, so memory use stays bounded no
+    matter how large x is. Returns the output memory maps, keyed like ``paths``.
+    """
+    native = x.dtype.newbyteorder("=")
+    states = {system: STREAMING_SYSTEMS[system]() for system in paths}
+    outputs = {
+        system: create_output(path, output_dtype(system, native), output_length(system, len(x)))
+        for system, path in paths.items()
+    }
+    written = dict.fromkeys(paths, 0)
+
+    for start in range(0, len(x), block_size):
+        block = np.asarray(x[start:start + block_size], dtype=native)  # Pages in one block
+        for system, state in states.items():
+            y = state.process(block)
+            outputs[system][written[system]:written[system] + len(y)] = y
+            written[system] += len(y)
+
+    for output in outputs.values():
+        output.flush()
+    return outputs
@@ -0,0 +1,173 @@
+"""Vectorized evaluation of FIR and IIR difference equations.
+
+    a[0] y[n] + a[1] y[n-1] + ... = b[0] x[n] + b[1] x[n-1] + ...
+
+All filters work along the last axis and never loop over samples in Python:
+
+- short FIR filters are a sum of shifted, scaled copies of x (exact for integer
+  taps on integer signals, accumulated in ``accumulate.fir_dtype``);
+- long FIR filters switch to FFT overlap-add;
+- IIR filters whose denominator is a pure accumulator (a = [1, -1]) are a FIR
+  followed by the widened, compensated ``accumulate.running_sum``;
+- other IIR filters run block by block: inside a block the output is the FFT
+  convolution with the impulse response plus the response to the state at the
+  block start, and only the small state vector is carried between blocks.
+"""
+
+import functools
+
+import numpy as np
+
+from .accumulate import check_fir, fir_dtype, running_sum
+
+# FIR filters with more taps than this are evaluated with FFT overlap-add
+DIRECT_TAPS = 64
+
+# Samples per block for IIR evaluation
+IIR_BLOCK = 1024
+
+
+def _taps(coefficients):
+    """Coefficients as Python ints when all are integral (keeps integer signals exact)."""
+    coefficients = np.atleast_1d(np.asarray(coefficients, dtype=float))
+    if np.all(coefficients == np.round(coefficients)):
+        return [int(c) for c in coefficients]
+    return [float(c) for c in coefficients]
+
+
+@functools.lru_cache(maxsize=None)
+def fast_length(n):
+    """Smallest length >= n of the form 2**i * 3**j, for which the FFT is fast (memoized)."""
+    best = 1 << int(np.ceil(np.log2(max(n, 1))))
+    power3 = 1
+    while power3 < best:
+        candidate = power3
+        while candidate < n:
+            candidate *= 2
+        best = min(best, candidate)
+        power3 *= 3
+    return best
+
+
+def fir_direct(b, x):
+    """FIR filter as a sum of shifted copies of x, O(len(b) * len(x)).
+
+    Integer taps on integer samples follow the widening policy of
+    ``accumulate``; 64-bit outputs that would overflow raise OverflowError.
+    """
+    x = np.asarray(x)
+    b = _taps(b)
+    if b == [1]:
+        return x.copy()  # Identity: keeps the sample type (the running sum then widens it)
+    if x.dtype.kind in "biu" and all(isinstance(tap, int) for tap in b):
+        dtype = fir_dtype(b, x.dtype)
+        if dtype.itemsize == 8:
+            check_fir(b, x, dtype)
+        x = x.astype(dtype)
+    y = b[0] * x
+    for k, tap in enumerate(b[1:], start=1):
+        if tap and k < x.shape[-1]:
+            y[..., k:] += tap * x[..., :-k]
+    return y
+
+
+def fir_overlap_add(b, x):
+    """FIR filter by FFT overlap-add, O(len(x) * log(len(b)))."""
+    x = np.asarray(x, dtype=float)
+    b = np.asarray(b, dtype=float)
+    taps, length = len(b), x.shape[-1]
+    block = max(taps, 256)                      # Input samples per block
+    size = fast_length(block + taps - 1)        # FFT size holding a whole linear convolution
+    count = -(-length // block)
+
+    padded = np.zeros(x.shape[:-1] + (count * block,))
+    padded[..., :length] = x
+    blocks = padded.reshape(x.shape[:-1] + (count, block))
+    spectra = np.fft.rfft(blocks, size) * np.fft.rfft(b, size)
+    pieces = np.fft.irfft(spectra, size)[..., :block + taps - 1]
+
+    # Each block's tail (taps - 1 samples) overlaps the start of the next block
+    y = pieces[..., :block].copy()
+    y[..., 1:, :taps - 1] += pieces[..., :-1, block:]
+    return y.reshape(x.shape[:-1] + (count * block,))[..., :length]
+
+
+def fir(b, x):
+    """FIR filter, choosing direct evaluation or overlap-add from the number of taps."""
+    if len(np.atleast_1d(b)) > DIRECT_TAPS:
+        return fir_overlap_add(b, x)
+    return fir_direct(b, x)
+
+
+def _state_space(b, a):
+    """Transposed direct form II matrices (A, B, C, D) of a normalized (b, a) filter."""
+    order = max(len(a), len(b)) - 1
+    a = np.pad(a, (0, order + 1 - len(a)))
+    b = np.pad(b, (0, order + 1 - len(b)))
+    A = np.zeros((order, order))
+    A[:, 0] = -a[1:]
+    A[:-1, 1:] = np.eye(order - 1)
+    B = b[1:] - a[1:] * b[0]
+    C = np.zeros(order)
+    C[0] = 1
+    return A, B, C, b[0]
+
+
+def iir_blocked(b, a, x, block=IIR_BLOCK):
+    """General IIR filter with zero initial conditions, evaluated block by block.
+
+    Within a block of L samples, y = h * x (FFT convolution with the first L
+    samples of the impulse response) + O z, where z is the filter state at
+    the block start. The state is carried with z' = A^L z + R x. Only that
+    update runs in Python, once per block, on an order-sized vector.
+    """
+    x = np.asarray(x, dtype=float)
+    A, B, C, D = _state_space(np.asarray(b, dtype=float), np.asarray(a, dtype=float))
+    order, length = len(A), x.shape[-1]
+    if order == 0:
+        return D * x
+    block = min(block, max(length, 1))
+
+    # Per-block operators: impulse response h, observability O, reachability R, A^L
+    O = np.empty((block, order))
+    R = np.empty((order, block))
+    power = np.eye(order)
+    for k in range(block):
+        O[k] = C @ power
+        R[:, block - 1 - k] = power @ B
+        power = A @ power
+    h = np.concatenate(([D], O[:-1] @ B))
+    A_block = power
+
+    count = -(-length // block)
+    padded = np.zeros(x.shape[:-1] + (count * block,))
+    padded[..., :length] = x
+    blocks = padded.reshape(x.shape[:-1] + (count, block))
+
+    size = fast_length(2 * block - 1)
+    forced = np.fft.irfft(np.fft.rfft(blocks, size) * np.fft.rfft(h, size), size)[..., :block]
+
+    # Carry the state across blocks: the only sequential part
+    increments = blocks @ R.T
+    states = np.empty(x.shape[:-1] + (count, order))
+    z = np.zeros(x.shape[:-1] + (order,))
+    for k in range(count):
+        states[..., k, :] = z
+        z = z @ A_block.T + increments[..., k, :]
+
+    y = forced + states @ O.T
+    return y.reshape(x.shape[:-1] + (count * block,))[..., :length]
+
+
+def lfilter(b, a, x):
+    """Filters x with the difference equation (b, a), zero initial conditions."""
+    a = np.atleast_1d(np.asarray(a, dtype=float))
+    if a[0] == 0:
+        raise ValueError("a[0] must be nonzero")
+    b = np.atleast_1d(np.asarray(b, dtype=float)) / a[0]
+    a = np.trim_zeros(a / a[0], "b")
+    if len(a) == 1:
+        return fir(b, x)
+    if len(a) == 2 and a[1] == -1:
+        return running_sum(fir(b, x))  # Pure accumulator: exact for integers, compensated for floats
+    return iir_blocked(b, a, x)
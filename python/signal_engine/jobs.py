@@ -0,0 +1,113 @@
+"""Latest-only background jobs for interactive front ends.
+
+A JobRunner owns one worker thread. Submitting a job cancels the one in
+flight, and only the newest submission runs or reports back. Results, errors
+and progress go into a queue that the front end drains from its own event
+loop (e.g. Tk's ``root.after``), so no GUI call ever happens off the main
+thread.
+
+Cancellation is cooperative: a job receives a Job handle and calls
+``job.progress(...)`` or ``job.check()`` between stages. Those calls raise
+Cancelled once a newer job has been submitted.
+"""
+
+import queue
+import threading
+
+
+class Cancelled(Exception):
+    """Raised inside a job that a newer submission has replaced."""
+
+
+class Job:
+    """Handle passed to a running job, to report progress and notice cancellation."""
+
+    def __init__(self, events, number):
+        self.events = events
+        self.number = number
+        self.cancelled = threading.Event()
+
+    def check(self):
+        """Raises Cancelled if a newer job has been submitted."""
+        if self.cancelled.is_set():
+            raise Cancelled()
+
+    def progress(self, fraction, message=""):
+        """Reports progress (0 to 1) to the front end, then checks for cancellation."""
+        self.check()
+        self.events.put(("progress", self.number, (fraction, message)))
+
+
+class JobRunner:
+    """One background worker thread that runs only the latest submitted job.
+
+    ``function(job, *args)`` runs in the worker. ``poll()`` returns the
+    ``(kind, payload)`` events of the latest job: ``("progress", (fraction,
+    message))``, ``("done", result)`` or ``("error", exception)``. Events of
+    replaced jobs are dropped.
+    """
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.latest = 0          # Number of the newest submitted job
+        self._pending = None     # (job, function, args) waiting for the worker
+        self._current = None     # Job running in the worker
+        self._wake = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="signal-jobs", daemon=True)
+        self._thread.start()
+
+    def submit(self, function, *args):
+        """Queues function(job, *args), cancelling the job in flight. Returns the job number."""
+        with self._wake:
+            self.latest += 1
+            if self._current is not None:
+                self._current.cancelled.set()
+            self._pending = (Job(self.events, self.latest), function, args)
+            self._wake.notify()
+        return self.latest
+
+    def cancel(self):
+        """Cancels the running and the queued job, if any."""
+        with self._wake:
+            self.latest += 1  # Late events of the cancelled jobs are dropped by poll()
+            if self._current is not None:
+                self._current.cancelled.set()
+            self._pending = None
+
+    def busy(self):
+        """True while the latest job is queued or running."""
+        with self._wake:
+            job = self._pending[0] if self._pending else self._current
+            return job is not None and job.number == self.latest
+
+    def poll(self):
+        """Drains the queue without blocking; returns the (kind, payload) events of the latest job."""
+        events = []
+        while True:
+            try:
+                kind, number, payload = self.events.get_nowait()
+            except queue.Empty:
+                return events
+            if number == self.latest:
+                events.append((kind, payload))
+
+    def _run(self):
+        """Worker loop: waits for a job, runs it and queues its outcome."""
+        while True:
+            with self._wake:
+                while self._pending is None:
+                    self._wake.wait()
+                job, function, args = self._pending
+                self._pending = None
+                self._current = job
+            try:
+                result = function(job, *args)
+                job.check()  # A job replaced during its last stage has no result to show
+                self.events.put(("done", job.number, result))
+            except Cancelled:
+                pass
+            except Exception as error:  # Reported to the front end, which owns the error dialogs
+                self.events.put(("error", job.number, error))
+            finally:
+                with self._wake:
+                    self._current = None
@@ -0,0 +1,69 @@
+"""Message catalogs of the front ends, one per locale.
+
+Every text the command-line and graphical versions show (prompts, errors,
+report templates, plot titles, widget labels, option help) is a message of a
+JSON file in ``locales/``, so both languages run the same code. Messages are
+``str.format`` templates: ``messages("cli.file.input", length=9, ...)``
+fills one in, ``messages["key"]`` returns it as is.
+
+A catalog reads its file on the first lookup, so only the selected locale is
+ever loaded. A message missing from it falls back to the DEFAULT_LOCALE one.
+"""
+
+import json
+import os
+
+LOCALES = ("en_US", "pt_BR")
+DEFAULT_LOCALE = "en_US"
+
+_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+
+
+class Catalog:
+    """The messages of one locale, read from its file on first use."""
+
+    def __init__(self, locale):
+        if locale not in LOCALES:
+            raise ValueError(f"unknown locale {locale!r} (expected one of {', '.join(LOCALES)})")
+        self.locale = locale
+        self._messages = None
+
+    def _load(self):
+        with open(os.path.join(_DIRECTORY, f"{self.locale}.json"), encoding="utf-8") as f:
+            self._messages = json.load(f)
+        return self._messages
+
+    def __getitem__(self, key):
+        messages = self._messages if self._messages is not None else self._load()
+        if key in messages:
+            return messages[key]
+        if self.locale == DEFAULT_LOCALE:
+            raise KeyError(key)
+        return load_catalog(DEFAULT_LOCALE)[key]
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __call__(self, key, **fields):
+        """The message ``key`` filled in with ``fields``."""
+        return self[key].format(**fields)
+
+    def get(self, key, default=None):
+        """The message ``key``, or ``default`` if no catalog has it."""
+        return self[key] if key in self else default
+
+
+# Catalogs created so far, by locale
+_catalogs = {}
+
+
+def load_catalog(locale=DEFAULT_LOCALE):
+    """The catalog of ``locale`` (one per process; its file is read on the first lookup)."""
+    catalog = _catalogs.get(locale)
+    if catalog is None:
+        catalog = _catalogs[locale] = Catalog(locale)
+    return catalog
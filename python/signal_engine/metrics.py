@@ -0,0 +1,143 @@
+"""Per-stage timing spans, with optional cProfile and tracemalloc capture.
+
+Stages (parsing, each transform, each system, each property check, each
+figure build and draw) are wrapped in ``span(name)``, which records their
+wall time in the default Metrics object as a count, total and maximum per
+stage, so memory stays constant however long a run lasts. Recording costs two
+clock reads, so spans are always on. ``start_capture()``/``stop_capture()``
+additionally profile function calls and trace allocations, and ``summary()``
+returns everything as a JSON-serializable dict. The profiling modules are only
+imported when a capture starts, to keep them out of every run's startup.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+# Entries kept in the profile and allocation tables of a summary
+TOP_ENTRIES = 20
+
+
+class Metrics:
+    """Durations of named stages, plus the profile and memory capture of a run."""
+
+    def __init__(self):
+        self.spans = {}           # Stage name -> [count, total, max] seconds, in first-seen order
+        self.stats = None         # pstats.Stats accumulated over all captures
+        self.allocations = []     # Top allocation sites of the last memory capture
+        self.peak_bytes = None    # Largest traced memory over all captures
+        self.lock = threading.Lock()
+        self._profiler = None
+
+    @contextmanager
+    def span(self, name):
+        """Times the enclosed block as one occurrence of stage ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                stage = self.spans.get(name)
+                if stage is None:
+                    self.spans[name] = [1, elapsed, elapsed]
+                else:
+                    # Running aggregates: a long-running server or live view records spans forever
+                    stage[0] += 1
+                    stage[1] += elapsed
+                    stage[2] = max(stage[2], elapsed)
+
+    def start_capture(self, profile=True, memory=True):
+        """Starts profiling calls (in the current thread) and/or tracing allocations."""
+        import cProfile
+        import tracemalloc
+
+        if profile and self._profiler is None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop_capture(self):
+        """Stops the capture and keeps its profile statistics and allocation peak."""
+        import io
+        import pstats
+        import tracemalloc
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            with self.lock:
+                if self.stats is None:
+                    self.stats = pstats.Stats(self._profiler, stream=io.StringIO())
+                else:
+                    self.stats.add(self._profiler)
+            self._profiler = None
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            with self.lock:
+                self.peak_bytes = max(peak, self.peak_bytes or 0)
+                self.allocations = [{"site": str(stat.traceback), "bytes": stat.size, "blocks": stat.count}
+                                    for stat in snapshot.statistics("lineno")[:TOP_ENTRIES]]
+
+    def reset(self):
+        """Forgets all recorded spans and captures."""
+        with self.lock:
+            self.spans.clear()
+            self.stats = None
+            self.allocations = []
+            self.peak_bytes = None
+
+    def summary(self):
+        """Per-stage count/total/mean/max seconds, plus the top profiled functions and allocation sites."""
+        import pstats
+
+        with self.lock:
+            stages = {name: {"count": count, "total": total, "mean": total / count, "max": longest}
+                      for name, (count, total, longest) in self.spans.items()}
+            result = {"stages": stages}
+            if self.stats is not None:
+                entries = sorted(self.stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+                result["profile"] = [{"function": pstats.func_std_string(function), "calls": calls,
+                                      "total": total, "cumulative": cumulative}
+                                     for function, (_, calls, total, cumulative, _) in entries[:TOP_ENTRIES]]
+            if self.peak_bytes is not None:
+                result["memory"] = {"peak_bytes": self.peak_bytes, "top_allocations": list(self.allocations)}
+        return result
+
+    def format(self):
+        """The summary as a text table."""
+        summary = self.summary()
+        lines = [f"{'Stage':32} {'Count':>6} {'Total (s)':>11} {'Mean (s)':>11} {'Max (s)':>11}"]
+        for name, stage in summary["stages"].items():
+            lines.append(f"{name:32} {stage['count']:6} {stage['total']:11.6f} "
+                         f"{stage['mean']:11.6f} {stage['max']:11.6f}")
+        if "profile" in summary:
+            lines.append("")
+            lines.append(f"{'Calls':>9} {'Own (s)':>10} {'Cumul. (s)':>10}  Function")
+            for entry in summary["profile"]:
+                lines.append(f"{entry['calls']:9} {entry['total']:10.4f} {entry['cumulative']:10.4f}  "
+                             f"{entry['function']}")
+        if "memory" in summary:
+            lines.append("")
+            lines.append(f"Peak traced memory: {summary['memory']['peak_bytes'] / 2**20:.1f} MiB")
+            for entry in summary["memory"]["top_allocations"][:5]:
+                lines.append(f"  {entry['bytes'] / 2**20:9.2f} MiB  {entry['site']}")
+        return "\n".join(lines)
+
+    def export(self, path):
+        """Writes the summary to a JSON file."""
+        import json
+
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=1)
+
+
+# Metrics of the current run, shared by the engine and the front ends
+default_metrics = Metrics()
+
+
+def span(name):
+    """Times the enclosed block as stage ``name`` of the default metrics."""
+    return default_metrics.span(name)
@@ -0,0 +1,261 @@
+"""Multi-core execution of the systems and of batch analysis.
+
+Work is split across a ``concurrent.futures.ProcessPoolExecutor``: a single
+large signal is cut into segments (overlapping by the one sample System 1
+needs), and a batch is cut into groups of rows. Arrays are never pickled to the
+workers. In-memory arrays are placed in ``multiprocessing.shared_memory``
+blocks, and memory-mapped files are re-opened by each worker. Only small
+descriptors travel through the pool.
+
+System 2's cumulative sum is stitched with a prefix-sum fix-up: each worker
+sums its own segment, then every segment is shifted by the total of the
+segments before it. Integer results are exact (and range-checked);
+floating-point results can differ from a serial run in the last bits, since
+the additions are grouped differently.
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .accumulate import RunningSum, check_difference
+from .batch import analyze_batch, batch_dtype
+from .fileio import DEFAULT_BLOCK_SIZE, create_output, output_dtype, output_length
+
+
+def default_workers():
+    """The number of worker processes used when none is given: one per core."""
+    return os.cpu_count() or 1
+
+
+# --- Array descriptors handed to the workers instead of the arrays themselves ---
+
+def _share(array):
+    """Copies an array into a new shared memory block; returns (block, descriptor)."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    shared[...] = array
+    return block, ("shm", block.name, array.dtype, array.shape)
+
+
+def _describe(array, writable=False):
+    """Descriptor of an existing memory map, or None if the array lives in RAM."""
+    if isinstance(array, np.memmap) and array.filename is not None:
+        return ("file", array.filename, array.dtype, array.shape, array.offset,
+                "r+" if writable else "r")
+    return None
+
+
+def _attach(spec):
+    """Opens the array a descriptor points to; returns (handle, array)."""
+    if spec[0] == "shm":
+        _, name, dtype, shape = spec
+        block = shared_memory.SharedMemory(name=name)
+        return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    _, filename, dtype, shape, offset, mode = spec
+    if shape[0] == 0:
+        return None, np.empty(shape, dtype=dtype)  # np.memmap cannot map zero bytes
+    return None, np.memmap(filename, dtype=dtype, mode=mode, offset=offset, shape=shape)
+
+
+def _release(handle, array):
+    """Flushes or detaches what _attach opened."""
+    if isinstance(array, np.memmap):
+        array.flush()
+    if handle is not None:
+        del array
+        handle.close()
+
+
+# --- Worker functions (module level so the pool can pickle them) ---
+
+def _systems_segment(x_spec, out_specs, start, stop):
+    """Computes the three systems on x[start:stop]; returns the segment's sum for System 2."""
+    handles = [_attach(x_spec)] + [_attach(spec) for spec in out_specs]
+    (_, x), (_, y1), (_, y2), (_, y3) = handles
+    segment = x[start:stop]
+
+    # System 1 reads one sample before the segment (the overlap)
+    check_difference(segment, x[start - 1] if start else None, start)
+    if start == 0:
+        y1[0] = 0
+        np.subtract(segment[1:], segment[:-1], out=y1[1:stop], dtype=y1.dtype, casting="unsafe")
+    else:
+        np.subtract(x[start:stop], x[start - 1:stop - 1], out=y1[start:stop], dtype=y1.dtype, casting="unsafe")
+
+    # System 2: local running sum, block by block, shifted later by the preceding segments
+    running = RunningSum()
+    running.position = start  # Overflows are reported at their index in the whole signal
+    for first in range(start, stop, DEFAULT_BLOCK_SIZE):
+        last = min(first + DEFAULT_BLOCK_SIZE, stop)
+        y2[first:last] = running.process(x[first:last])
+    total = y2[stop - 1].item()
+
+    # System 3: even input indices of the segment land at output index // 2
+    first = start + start % 2
+    y3[(start + 1) // 2:(stop + 1) // 2] = x[first:stop:2]
+
+    for handle, array in handles:
+        _release(handle, array)
+    return total
+
+
+def _offset_segment(y2_spec, start, stop, offset):
+    """Adds the sum of all preceding segments to y2[start:stop]."""
+    handle, y2 = _attach(y2_spec)
+    if y2.dtype.kind in "iu":
+        # Python integers are exact, so the shifted range shows any overflow
+        info = np.iinfo(y2.dtype)
+        if not info.min <= int(y2[start:stop].min()) + offset <= info.max \
+                or not info.min <= int(y2[start:stop].max()) + offset <= info.max:
+            raise OverflowError(f"the running sum does not fit in {y2.dtype} within n = {start}..{stop - 1}")
+    y2[start:stop] += offset
+    _release(handle, y2)
+
+
+def _batch_rows(x_spec, lengths_spec, results_spec, start, stop):
+    """Runs analyze_batch on rows start..stop and stores their records."""
+    handles = [_attach(x_spec), _attach(results_spec)]
+    (_, X), (_, results) = handles
+    lengths = None
+    if lengths_spec is not None:
+        handles.append(_attach(lengths_spec))
+        lengths = handles[-1][1][start:stop]
+    results[start:stop] = analyze_batch(X[start:stop], lengths)
+    for handle, array in handles:
+        _release(handle, array)
+
+
+# --- Public API ---
+
+def _boundaries(length, parts):
+    """Splits range(length) into at most ``parts`` contiguous (start, stop) pieces."""
+    edges = np.linspace(0, length, max(1, min(parts, length)) + 1).astype(np.int64)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def _map(pool, function, calls):
+    """Runs the calls on the pool (or inline without one) and returns their results in order."""
+    if pool is None:
+        return [function(*call) for call in calls]
+    return [future.result() for future in [pool.submit(function, *call) for call in calls]]
+
+
+def _run_systems(x_spec, out_specs, length, workers, segments):
+    pieces = _boundaries(length, segments or workers)
+    pool = ProcessPoolExecutor(workers) if workers > 1 and len(pieces) > 1 else None
+    try:
+        totals = _map(pool, _systems_segment, [(x_spec, out_specs, a, b) for a, b in pieces])
+        # Prefix-sum fix-up: segment i is shifted by the sum of segments 0..i-1
+        offsets = list(itertools.accumulate(totals[:-1]))  # Python numbers: integers cannot wrap
+        _map(pool, _offset_segment, [(out_specs[1], a, b, offset)
+                                     for (a, b), offset in zip(pieces[1:], offsets)])
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def parallel_systems(x, workers=None, segments=None):
+    """Computes the three systems of one large signal on several processes.
+
+    Returns ``{1: y1, 2: y2, 3: y3}`` like the whole-array functions in
+    ``systems``. ``segments`` defaults to one segment per worker.
+    """
+    workers = workers or default_workers()
+    x = np.asarray(x) if not isinstance(x, np.memmap) else x
+    native = x.dtype.newbyteorder("=")
+    blocks = []
+    try:
+        x_spec = _describe(x)
+        if x_spec is None:
+            block, x_spec = _share(x)
+            blocks.append(block)
+        outputs = {}
+        for system in (1, 2, 3):
+            block, spec = _share(np.zeros(output_length(system, len(x)), output_dtype(system, native)))
+            blocks.append(block)
+            outputs[system] = (block, spec)
+
+        _run_systems(x_spec, [spec for _, spec in outputs.values()], len(x), workers, segments)
+
+        results = {}
+        for system, (block, (_, _, dtype, shape)) in outputs.items():
+            shared = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            results[system] = shared.copy()  # Detach the result before the block is freed
+            del shared
+        return results
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def parallel_systems_to_files(x, paths, workers=None, segments=None):
+    """Like fileio.run_systems_to_files, with segments computed on several processes.
+
+    ``paths`` must map all three systems to output paths. When x is a memory
+    map, workers open the file themselves, so nothing is loaded in the parent.
+    """
+    workers = workers or default_workers()
+    native = x.dtype.newbyteorder("=")
+    block = None
+    x_spec = _describe(x)
+    if x_spec is None:
+        block, x_spec = _share(np.asarray(x))
+    try:
+        outputs = {system: create_output(paths[system], output_dtype(system, native),
+                                         output_length(system, len(x)))
+                   for system in (1, 2, 3)}
+        for output in outputs.values():
+            output.flush()
+        out_specs = [_describe(outputs[system], writable=True)
+                     or ("file", paths[system], outputs[system].dtype,
+                         outputs[system].shape, 0, "r+")
+                     for system in (1, 2, 3)]
+        _run_systems(x_spec, out_specs, len(x), workers, segments)
+        return outputs
+    finally:
+        if block is not None:
+            block.close()
+            block.unlink()
+
+
+def parallel_batch(X, lengths=None, workers=None):
+    """Runs analyze_batch on groups of rows in several processes.
+
+    Returns the same structured array as ``batch.analyze_batch``.
+    """
+    workers = workers or default_workers()
+    X = np.asarray(X)
+    if X.ndim != 2:
+        raise ValueError(f"expected a 2-D batch of signals, got shape {X.shape}")
+    blocks = []
+    try:
+        x_block, x_spec = _share(X)
+        blocks.append(x_block)
+        lengths_spec = None
+        if lengths is not None:
+            lengths_block, lengths_spec = _share(np.asarray(lengths, dtype=np.int64))
+            blocks.append(lengths_block)
+        results_block, results_spec = _share(np.zeros(len(X), batch_dtype(X.shape[1], X.dtype)))
+        blocks.append(results_block)
+
+        pieces = _boundaries(len(X), workers)
+        pool = ProcessPoolExecutor(workers) if workers > 1 and len(pieces) > 1 else None
+        try:
+            _map(pool, _batch_rows, [(x_spec, lengths_spec, results_spec, a, b) for a, b in pieces])
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        shared = np.ndarray(len(X), dtype=results_spec[2], buffer=results_block.buf)
+        results = shared.copy()
+        del shared
+        return results
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,159 @@
+"""Conversion of typed or piped text into signal arrays.
+
+Samples may be separated by whitespace, commas or newlines. Parsing is done by
+NumPy's C text reader in a single pass, so a signal with millions of samples
+never goes through one Python ``int`` per token. Only when that pass fails is
+the text scanned token by token, to report the first malformed token and its
+line number. The reader is more lenient than the scan in two ways, both
+checked after it: it joins a lone sign to the next number (so the samples are
+counted against the tokens), and it clamps integers that do not fit in 64 bits
+(so samples at the limits of the type are read again exactly).
+"""
+
+import warnings
+
+import numpy as np
+
+# Limits of the classic (teaching) mode; the unlimited mode ignores them
+MAX_SAMPLES = 9
+MAX_AMPLITUDE = 9
+
+# Characters that can only appear in a floating-point token (., exponent, nan/inf)
+_FLOAT_MARKERS = ".eEnN"
+
+
+class SignalParseError(ValueError):
+    """A malformed token in signal text, with its 1-based line number."""
+
+    def __init__(self, line, token, reason="not a number"):
+        super().__init__(f"line {line}: {token!r} is {reason}")
+        self.line = line
+        self.token = token
+        self.reason = reason
+
+    def __reduce__(self):
+        # Rebuilt from the fields, so it survives the trip back from worker processes
+        return type(self), (self.line, self.token, self.reason)
+
+
+def find_bad_token(text, integers_only=False, first_line=1):
+    """The SignalParseError for the first token of text that is not a number (or integer), or None.
+
+    This is the slow, token-by-token path, only taken to explain a failure.
+    """
+    for line, content in enumerate(text.split("\n"), first_line):
+        for token in content.replace(",", " ").split():
+            try:
+                float(token)
+            except ValueError:
+                return SignalParseError(line, token)
+            if integers_only:
+                try:
+                    int(token)
+                except ValueError:
+                    return SignalParseError(line, token, "not an integer")
+    return None
+
+
+def _tokens(text, first_line=1):
+    """(line, token) of every token of text, in order (the slow path)."""
+    for line, content in enumerate(text.split("\n"), first_line):
+        for token in content.replace(",", " ").split():
+            yield line, token
+
+
+def _count_tokens(text):
+    """Number of whitespace-separated tokens of text, counted without splitting it into strings."""
+    if not text.isascii():
+        return len(text.split())
+    codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    space = (codes == 32) | ((codes >= 9) & (codes <= 13))
+    # A token starts at every non-space character that follows a space (or the start)
+    return int(np.count_nonzero(space[:-1] & ~space[1:])) + (not space[0])
+
+
+def _check_saturation(x, text, first_line):
+    """SignalParseError if a 64-bit integer sample was clamped to the range of its type.
+
+    NumPy's reader saturates integers that do not fit. Only samples equal to
+    the smallest or largest value can come from such a token, so only those
+    are read again, exactly, by the slow path.
+    """
+    info = np.iinfo(x.dtype)
+    saturated = (x == info.min) | (x == info.max)
+    if not saturated.any():
+        return
+    indices = set(np.flatnonzero(saturated).tolist())
+    for i, (line, token) in enumerate(_tokens(text, first_line)):
+        if i in indices and not info.min <= int(token) <= info.max:
+            raise SignalParseError(line, token, f"out of the {x.dtype} range")
+
+
+def _narrow(x, dtype, text, first_line):
+    """x (parsed in a wider type) cast to dtype; SignalParseError for the first sample that does not fit."""
+    if dtype.kind in "iu":
+        info = np.iinfo(dtype)
+        bad = (x < info.min) | (x > info.max)
+    else:
+        bad = np.isfinite(x) & (np.abs(x) > np.finfo(dtype).max)  # Would become inf
+    if bad.any():
+        index = int(np.argmax(bad))
+        for i, (line, token) in enumerate(_tokens(text, first_line)):
+            if i == index:
+                raise SignalParseError(line, token, f"out of the {dtype} range")
+    return x.astype(dtype)
+
+
+def parse_signal(text, allow_float=True, dtype=None, first_line=1):
+    """Parses numbers separated by whitespace, commas or newlines into an int64 or float64 array.
+
+    With ``dtype`` given, the text is read into that type instead of choosing
+    int64/float64 from its contents (narrower types are read as int64/float64
+    and range-checked). Raises SignalParseError (a ValueError) when a token is
+    not a number, does not fit ``dtype``, or is not an integer and
+    ``allow_float`` is False. ``first_line`` is the line number of the first
+    line of text in the error messages.
+    """
+    if "," in text:
+        text = text.replace(",", " ")  # CSV: commas separate samples like whitespace
+    if not text or text.isspace():
+        return np.array([], dtype=dtype or np.int64)  # Empty input: empty signal
+
+    if dtype is None:
+        # Integers are kept exact; any float-looking token switches to float64
+        is_float = any(marker in text for marker in _FLOAT_MARKERS)
+        if is_float and not allow_float:
+            raise find_bad_token(text, True, first_line) or ValueError("signal must contain only integers")
+        dtype = np.float64 if is_float else np.int64
+    dtype = np.dtype(dtype)
+    wide = dtype
+    if dtype.kind in "iuf" and dtype.itemsize < 8:
+        wide = np.dtype(np.float64 if dtype.kind == "f" else np.int64)  # Parsed wide, then range-checked
+
+    # Older NumPy only warns on unparsable data; promote that to an error
+    integers_only = np.issubdtype(dtype, np.integer)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            x = np.fromstring(text, dtype=wide, sep=" ")
+        except (ValueError, DeprecationWarning) as exc:
+            raise find_bad_token(text, integers_only, first_line) or ValueError(str(exc)) from None
+    if len(x) != _count_tokens(text):
+        # The reader merged tokens that the scan keeps apart (a lone "-" joins the next number)
+        raise find_bad_token(text, integers_only, first_line) or ValueError("malformed signal")
+    if x.dtype.itemsize == 8 and x.dtype.kind in "iu":
+        _check_saturation(x, text, first_line)
+    return _narrow(x, dtype, text, first_line) if wide != dtype else x
+
+
+def check_limits(x):
+    """Returns None if x fits the classic mode, or the name of the violated limit.
+
+    The name is ``"length"`` (more than MAX_SAMPLES samples) or ``"amplitude"``
+    (a sample outside -MAX_AMPLITUDE..MAX_AMPLITUDE).
+    """
+    if len(x) > MAX_SAMPLES:
+        return "length"
+    if len(x) and np.abs(x).max() > MAX_AMPLITUDE:
+        return "amplitude"
+    return None
@@ -0,0 +1,175 @@
+"""Reusable, level-of-detail plot artists for the front ends.
+
+The figures are built once, and each new signal only replaces the data of the
+existing artists. Short signals are drawn as stem plots. When the visible part
+of a signal has more samples than the axes have room for, the same artists
+draw a min/max envelope instead: one vertical segment per pixel column, read
+from a precomputed multi-resolution pyramid. Zooming or panning re-reads the
+pyramid at the matching resolution, so even 10^8-sample signals redraw
+interactively.
+
+This module never imports matplotlib itself: it works on Axes objects that the
+(already matplotlib-based) front ends pass in, so the engine stays headless.
+"""
+
+import numpy as np
+
+from .transforms import IndexedSignal
+
+# Finest pyramid level, in samples per block (finer views are reduced from raw samples)
+PYRAMID_BASE = 64
+
+# Stem plots are used while there are at least this many pixels per visible sample
+PIXELS_PER_STEM = 3
+
+
+def _limits(low, high, fraction=0.05, minimum=0.5):
+    """Axis limits around [low, high] with a small margin."""
+    margin = max((high - low) * fraction, minimum)
+    return low - margin, high + margin
+
+
+def _reduce(mins, maxs, group):
+    """Min/max over consecutive groups of ``group`` entries (the last group may be shorter)."""
+    if group == 1:
+        return mins, maxs
+    count = -(-len(mins) // group)
+    pad = count * group - len(mins)
+    if pad:
+        # Repeat the last entry, which leaves the last group's min/max unchanged
+        mins = np.concatenate([mins, np.repeat(mins[-1:], pad)])
+        maxs = np.concatenate([maxs, np.repeat(maxs[-1:], pad)])
+    return mins.reshape(count, group).min(axis=1), maxs.reshape(count, group).max(axis=1)
+
+
+class MinMaxPyramid:
+    """Min/max of a signal over blocks of PYRAMID_BASE, 2*PYRAMID_BASE, 4*PYRAMID_BASE, ... samples."""
+
+    def __init__(self, x):
+        self.x = np.asarray(x)
+        self.levels = []  # (block size, mins, maxs), finest first
+        if len(self.x) == 0:
+            return
+        block = PYRAMID_BASE
+        mins, maxs = _reduce(self.x, self.x, block)
+        self.levels.append((block, mins, maxs))
+        while len(mins) > 1:
+            mins, maxs = _reduce(mins, maxs, 2)
+            block *= 2
+            self.levels.append((block, mins, maxs))
+
+    def bounds(self):
+        """Smallest and largest sample of the whole signal."""
+        if not self.levels:
+            return 0, 0
+        _, mins, maxs = self.levels[-1]
+        return mins[0], maxs[0]
+
+    def envelope(self, start, stop, bins):
+        """Min/max of x[start:stop] in about ``bins`` groups.
+
+        Returns ``(first, size, mins, maxs)``: group k covers samples
+        first + k*size .. first + (k+1)*size - 1.
+        """
+        per_bin = max(1, -(-(stop - start) // max(bins, 1)))
+        block, mins, maxs = 1, self.x, self.x
+        for level in self.levels:
+            if level[0] > per_bin:
+                break
+            block, mins, maxs = level
+        first = start // block
+        last = -(-stop // block)
+        group = max(1, per_bin // block)
+        mins, maxs = _reduce(mins[first:last], maxs[first:last], group)
+        return first * block, block * group, mins, maxs
+
+
+class SignalPlot:
+    """A signal plot that is a stem plot when zoomed in and a min/max envelope when zoomed out.
+
+    The index axis must be affine, n = n[0] + step * i, as for the original
+    signal and all the transforms.
+    """
+
+    def __init__(self, ax, title):
+        self.ax = ax
+        # Placeholder sample: matplotlib cannot build a stem plot from empty arrays
+        self.container = ax.stem([0], [0], basefmt=" ")
+        ax.set_title(title)
+        ax.grid(True)
+        self.pyramid = MinMaxPyramid([])
+        self.origin, self.step = 0, 1
+        self.rendering = False   # Set while we change the limits ourselves
+        ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+        self.show(IndexedSignal([]))
+
+    def update(self, n, x, pyramid=None):
+        """Shows samples x at indices n (an affine axis) and rescales the axes to them."""
+        origin = n[0] if len(n) else 0
+        step = n[1] - n[0] if len(n) > 1 else 1
+        self.show(IndexedSignal(x, origin, step), pyramid)
+
+    def show(self, signal, pyramid=None):
+        """Shows an IndexedSignal and rescales the axes to it; no index array is built.
+
+        ``pyramid`` can be a MinMaxPyramid of its values built beforehand (e.g. in a worker thread).
+        """
+        self.pyramid = pyramid if pyramid is not None else MinMaxPyramid(signal.values)
+        x = self.pyramid.x
+        self.origin, self.step = signal.origin, signal.step
+
+        self.rendering = True
+        if len(x):
+            first, last = sorted((self.origin, self.origin + self.step * (len(x) - 1)))
+            self.ax.set_xlim(*_limits(first, last))
+            low, high = self.pyramid.bounds()
+            if np.isfinite(low) and np.isfinite(high):
+                self.ax.set_ylim(*_limits(min(low, 0), max(high, 0)))
+        self.rendering = False
+        self.render()
+
+    def render(self):
+        """Redraws the visible part of the signal at the resolution of the axes."""
+        markerline, stemlines, baseline = self.container
+        x = self.pyramid.x
+        if len(x) == 0:
+            markerline.set_data([], [])
+            stemlines.set_segments([])
+            baseline.set_data([], [])
+            return
+
+        # Visible sample range, from the x limits through the affine index axis
+        low, high = self.ax.get_xlim()
+        a, b = sorted(((low - self.origin) / self.step, (high - self.origin) / self.step))
+        start = int(np.clip(np.floor(a), 0, len(x)))
+        stop = int(np.clip(np.ceil(b) + 1, start, len(x)))
+        pixels = max(int(self.ax.bbox.width), 1)
+
+        if (stop - start) * PIXELS_PER_STEM <= pixels:
+            # Few samples: a regular stem plot, one stem per sample
+            n = self.origin + self.step * np.arange(start, stop, dtype=float)
+            values = np.asarray(x[start:stop], dtype=float)
+            markerline.set_data(n, values)
+            bottoms = np.zeros_like(values)
+        else:
+            # Many samples: one min/max segment per pixel column, no markers.
+            # Each segment covers exactly what the column's stems would cover.
+            first, size, mins, maxs = self.pyramid.envelope(start, stop, pixels)
+            n = self.origin + self.step * (first + size * np.arange(len(mins)) + (size - 1) / 2)
+            markerline.set_data([], [])
+            bottoms = np.minimum(np.asarray(mins, dtype=float), 0)
+            values = np.maximum(np.asarray(maxs, dtype=float), 0)
+
+        segments = np.empty((len(n), 2, 2))   # One vertical segment per stem or pixel column
+        segments[:, :, 0] = n[:, None]
+        segments[:, 0, 1] = bottoms
+        segments[:, 1, 1] = values
+        stemlines.set_segments(segments)
+        if len(n):
+            baseline.set_data([n.min(), n.max()], [0, 0])
+
+    def _on_xlim_changed(self, ax):
+        """Refines the plot after a zoom or pan."""
+        if not self.rendering:
+            self.render()
+            ax.figure.canvas.draw_idle()
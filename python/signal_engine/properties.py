@@ -0,0 +1,222 @@
+"""Empirical verification of system properties with randomized probes.
+
+Each property is tested by feeding a system a whole batch of probe signals (one
+per row of a 2-D array) in a single call and comparing the outputs. Probe
+pairs share a prefix, differ in one sample, are delayed copies, or are scaled
+sums, depending on the property. A property fails as soon as one trial
+contradicts it, and the offending probes are kept as a counterexample.
+
+The systems are treated as operating on finite signals x[0..N-1] with zero
+initial conditions. Results therefore describe the implementation, including
+its boundary conventions, and not an idealized textbook system.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .metrics import span
+
+# Outcome of one property: whether it holds, how many trials ran and failed,
+# one counterexample (a dict of arrays, or None) and, for stability, the
+# largest observed output/input amplitude ratio
+PropertyResult = namedtuple(
+    "PropertyResult", "holds trials failures counterexample bound", defaults=(None,)
+)
+
+# Properties in the order the reports present them
+PROPERTIES = ("causal", "memory", "stable", "time_invariant", "linear")
+
+
+def _apply(system, X):
+    """Runs a system on every row of X, in one call when the system supports it."""
+    try:
+        Y = np.asarray(system(X))
+        if Y.ndim == 2 and len(Y) == len(X):
+            return Y
+    except (ValueError, IndexError, TypeError):
+        pass
+    # The system only understands 1-D signals: fall back to one call per row
+    return np.stack([np.asarray(system(row)) for row in X])
+
+
+def _differs(Y, Y2):
+    """Element-wise mismatch of two output batches.
+
+    Integer outputs must match exactly. Floating-point outputs are compared
+    with a tolerance relative to each row's scale, so that rounding (e.g. from
+    FFT-based filters) is not taken as a violation.
+    """
+    if np.issubdtype(Y.dtype, np.integer) and np.issubdtype(Y2.dtype, np.integer):
+        return Y != Y2
+    scale = np.maximum(np.abs(Y).max(axis=1, keepdims=True, initial=0),
+                       np.abs(Y2).max(axis=1, keepdims=True, initial=0))
+    return ~np.isclose(Y, Y2, rtol=1e-9, atol=1e-9 * scale)
+
+
+def _first_failure(mismatch):
+    """Row and column of the first True entry of a 2-D mismatch mask, or None."""
+    rows = np.flatnonzero(mismatch.any(axis=1))
+    if len(rows) == 0:
+        return None
+    return rows[0], int(np.argmax(mismatch[rows[0]]))
+
+
+def _result(holds, mismatch, counterexample, bound=None):
+    return PropertyResult(bool(holds), len(mismatch), int(mismatch.any(axis=1).sum()),
+                          counterexample, bound)
+
+
+def check_causality(system, X, rng):
+    """Inputs equal up to a random cut k must give outputs equal up to k."""
+    trials, length = X.shape
+    cut = rng.integers(0, length - 1, trials)[:, None]
+    after = np.arange(length) > cut
+    X2 = np.where(after, X + rng.standard_normal(X.shape) + 1, X)  # Change only the future
+
+    Y, Y2 = _apply(system, X), _apply(system, X2)
+    columns = min(Y.shape[1], Y2.shape[1])
+    mismatch = _differs(Y[:, :columns], Y2[:, :columns]) & (np.arange(columns) <= cut)
+    failure = _first_failure(mismatch)
+    counterexample = None
+    if failure is not None:
+        row, n = failure
+        counterexample = {"x": X[row], "x_changed_after": int(cut[row, 0]), "x2": X2[row],
+                          "y": Y[row], "y2": Y2[row], "n": n}
+    return _result(failure is None, mismatch, counterexample)
+
+
+def check_memory(system, X, rng):
+    """Changing only x[j] must change only y[j] for a memoryless system.
+
+    Unlike the other checks, ``holds`` is True when the system HAS memory
+    (the counterexample is then the witness).
+    """
+    trials, length = X.shape
+    j = rng.integers(0, length, trials)[:, None]
+    X2 = np.where(np.arange(length) == j, X + rng.standard_normal((trials, 1)) + 1, X)
+
+    Y, Y2 = _apply(system, X), _apply(system, X2)
+    columns = min(Y.shape[1], Y2.shape[1])
+    mismatch = _differs(Y[:, :columns], Y2[:, :columns]) & (np.arange(columns) != j)
+    failure = _first_failure(mismatch)
+    counterexample = None
+    if failure is not None:
+        row, n = failure
+        counterexample = {"x": X[row], "x_changed_at": int(j[row, 0]), "x2": X2[row],
+                          "y": Y[row], "y2": Y2[row], "n": n}
+    return _result(failure is not None, mismatch, counterexample)
+
+
+def _gain(system, X):
+    """Largest output/input amplitude ratio over the probes, and the row reaching it."""
+    Y = _apply(system, X)
+    with np.errstate(over="ignore", invalid="ignore"):
+        gains = np.abs(Y).max(axis=1, initial=0) / np.abs(X).max(axis=1)
+    row = int(np.nanargmax(gains)) if np.isfinite(gains).any() else 0
+    return gains, row, Y
+
+
+def _bounded_probes(trials, length, rng):
+    """Inputs bounded by 1: constant, alternating and random-sign, plus random levels."""
+    n = np.arange(length)
+    fixed = np.stack([np.ones(length), (-1.0) ** n, -np.ones(length)])
+    signs = rng.choice([-1.0, 1.0], size=(max(trials - len(fixed), 1), length))
+    signs *= rng.uniform(0.5, 1, (len(signs), 1))
+    return np.concatenate([fixed, signs])
+
+
+def check_stability(system, trials, length, rng, growth=1.5):
+    """BIBO: the output/input amplitude ratio must not keep growing with the signal length.
+
+    The gain is measured on bounded probes of ``length``, ``4 * length`` and
+    ``16 * length`` samples. An unstable system (such as an accumulator) shows a
+    gain that grows at every step. A stable one settles at its actual bound,
+    possibly after a first step where a long impulse response is still filling up.
+    """
+    bounds = []
+    for size in (length, 4 * length, 16 * length):
+        X = _bounded_probes(trials, size, rng)
+        gains, row, Y = _gain(system, X)
+        bounds.append(np.nanmax(gains) if np.isfinite(gains).any() else np.inf)
+
+    short_bound, middle_bound, long_bound = bounds
+    keeps_growing = middle_bound > growth * short_bound and long_bound > growth * middle_bound
+    unstable = (gains > growth * middle_bound) | ~np.isfinite(gains)
+    holds = not keeps_growing and np.isfinite(long_bound)
+    counterexample = None
+    if not holds:
+        counterexample = {"x": X[row], "y": Y[row], "gain": float(gains[row]),
+                          "gains_by_length": [float(bound) for bound in bounds]}
+    return PropertyResult(bool(holds), len(gains), int(unstable.sum()) if not holds else 0,
+                          counterexample, float(long_bound))
+
+
+def check_time_invariance(system, X, rng):
+    """Delaying the input by d samples must delay the output by d samples."""
+    trials, length = X.shape
+    rows = np.arange(trials)[:, None]
+    d = rng.integers(1, max(length // 4, 1) + 1, trials)[:, None]
+
+    # Probes end in length // 4 zeros, so the delay never pushes samples out of the window
+    X = np.where(np.arange(length) < length - max(length // 4, 1), X, 0)
+    index = np.arange(length) - d
+    X_delayed = np.where(index >= 0, X[rows, index.clip(0)], 0)  # x[n - d], zero before the start
+    Y, Y_delayed = _apply(system, X), _apply(system, X_delayed)
+
+    # Compare y_delayed[n] with y[n - d] wherever both exist
+    columns = min(Y.shape[1], Y_delayed.shape[1])
+    out_index = np.arange(columns) - d
+    expected = Y[rows, out_index.clip(0)]
+    mismatch = _differs(Y_delayed[:, :columns], expected) & (out_index >= 0)
+    failure = _first_failure(mismatch)
+    counterexample = None
+    if failure is not None:
+        row, n = failure
+        counterexample = {"x": X[row], "delay": int(d[row, 0]), "x_delayed": X_delayed[row],
+                          "y": Y[row], "y_delayed": Y_delayed[row], "n": n}
+    return _result(failure is None, mismatch, counterexample)
+
+
+def check_linearity(system, X, rng):
+    """y(a*x1 + b*x2) must equal a*y(x1) + b*y(x2) (additivity and homogeneity)."""
+    trials, length = X.shape
+    X2 = rng.standard_normal(X.shape)
+    a, b = rng.uniform(-3, 3, (2, trials, 1))
+
+    Y_combined = _apply(system, a * X + b * X2)
+    expected = a * _apply(system, X) + b * _apply(system, X2)
+    columns = min(Y_combined.shape[1], expected.shape[1])
+    Y_combined, expected = Y_combined[:, :columns], expected[:, :columns]
+    mismatch = _differs(Y_combined, expected)
+    failure = _first_failure(mismatch)
+    counterexample = None
+    if failure is not None:
+        row, n = failure
+        counterexample = {"x1": X[row], "x2": X2[row], "a": float(a[row, 0]), "b": float(b[row, 0]),
+                          "y": Y_combined[row], "expected": expected[row], "n": n}
+    return _result(failure is None, mismatch, counterexample)
+
+
+def verify_system(system, trials=1000, length=32, seed=0):
+    """Empirically tests the five properties of a system callable.
+
+    ``system`` maps a signal to its output; it is called once per check with
+    a 2-D array of ``trials`` probes of ``length`` samples (one per row), or
+    once per probe if it only handles 1-D signals. Returns a dict mapping each
+    name in PROPERTIES to a PropertyResult.
+    """
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((trials, length))
+    results = {}
+    with span("property/causal"):
+        results["causal"] = check_causality(system, X, rng)
+    with span("property/memory"):
+        results["memory"] = check_memory(system, X, rng)
+    with span("property/stable"):
+        results["stable"] = check_stability(system, trials, length, rng)
+    with span("property/time_invariant"):
+        results["time_invariant"] = check_time_invariance(system, X, rng)
+    with span("property/linear"):
+        results["linear"] = check_linearity(system, X, rng)
+    return results
@@ -0,0 +1,375 @@
+"""Sliding-window analysis of live input streams.
+
+A SlidingWindow keeps the last ``size`` samples of a stream in a ring buffer,
+together with the difference and cumulative-sum outputs of those samples, and
+updates everything incrementally as chunks arrive:
+
+- the systems run through their streaming states (``streaming``), O(1) per
+  sample;
+- window sums (for the mean and standard deviation) add the samples entering
+  the window and subtract those leaving it, O(1) per sample. They are
+  re-summed exactly every ``size`` samples, so rounding errors cannot pile up;
+- the minimum and maximum come from a segment tree over the ring's slots,
+  O(log N) per chunk plus O(1) per sample;
+- the spectrum is a Welch average over the window's segments of
+  SPECTRUM_SEGMENT samples: each segment is transformed once, when it is
+  complete, and enters and leaves a running total, O(log SPECTRUM_SEGMENT)
+  per sample whatever the window length.
+
+LiveAnalysis feeds a window from a pipe, FIFO or stdin in a background thread.
+Front ends take snapshots at their own frame rate, so a fast input never floods
+the display and a slow display never holds the input back.
+"""
+
+import math
+import sys
+import threading
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+
+from .accumulate import difference_dtype, sum_dtype
+from .fileio import is_text_file
+from .filters import fast_length
+from .spectrum import Spectrum, _one_sided, periodogram
+from .streaming import StreamingCumulativeSum, StreamingDifference, binary_chunks, text_chunks
+from .transforms import IndexedSignal
+
+# Samples kept by default in the window
+DEFAULT_WINDOW = 4096
+
+# Welch segment length of the sliding spectrum (SPECTRUM_SEGMENT // 2 + 1 frequencies)
+SPECTRUM_SEGMENT = 256
+
+# Bytes requested per read of a live source; reads return as soon as some data is there
+LIVE_READ = 1 << 16
+
+# Count, mean, standard deviation, min and max of the samples in a window
+WindowStats = namedtuple("WindowStats", "count mean std min max")
+
+# State of a live analysis at one instant: stream position (samples read), the
+# window and the system outputs as IndexedSignals on the stream's index axis,
+# the WindowStats of each ("input" and each system) and the window's Spectrum
+LiveSnapshot = namedtuple("LiveSnapshot", "position signal outputs stats spectrum")
+
+
+class RingBuffer:
+    """The last ``capacity`` samples of a stream, readable as one contiguous array.
+
+    Every sample is stored twice, in slot i and in slot i + capacity, so the
+    window is always the slice data[start:start + capacity] and reading it
+    copies nothing. Slots not written yet hold zeros.
+    """
+
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("a sliding window needs at least one sample")
+        self.capacity = capacity
+        self.data = np.zeros(2 * capacity, dtype=dtype)
+        self.start = 0  # Slot of the oldest sample of the window
+        self.count = 0  # Samples appended so far
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, chunk):
+        """Appends at most ``capacity`` samples; returns a copy of the window slots they replaced (oldest first)."""
+        chunk = np.asarray(chunk)
+        k, a, c = len(chunk), self.start, self.capacity
+        if k > c:
+            raise ValueError(f"cannot append {k} samples to a window of {c}")
+        old = self.data[a:a + k].copy()
+        self.data[a:a + k] = chunk  # a < c and k <= c, so this stays inside the array
+        head = min(k, c - a)        # Samples that went to the first half; the rest went to the second
+        self.data[a + c:a + c + head] = chunk[:head]
+        self.data[:k - head] = chunk[head:]
+        self.start = (a + k) % c
+        self.count += k
+        return old
+
+    def window(self):
+        """All ``capacity`` slots, oldest first (a view, zeros before the first samples)."""
+        return self.data[self.start:self.start + self.capacity]
+
+    def values(self):
+        """The samples in the window, oldest first (a view)."""
+        end = self.start + self.capacity
+        return self.data[end - len(self):end]
+
+
+class _Extremes:
+    """Min and max segment trees over the slots of a ring buffer.
+
+    Overwriting k consecutive slots costs O(k + log N); the min and max of
+    the whole window are read at the root.
+    """
+
+    def __init__(self, capacity, dtype):
+        dtype = np.dtype(dtype)
+        self.capacity = capacity
+        self.leaves = 1 << (capacity - 1).bit_length()
+        if dtype.kind in "iu":
+            lowest, highest = np.iinfo(dtype).min, np.iinfo(dtype).max
+        else:
+            lowest, highest = -np.inf, np.inf
+        # Empty slots hold the neutral element: the highest value for the min tree, the lowest for the max tree
+        self.low = np.full(2 * self.leaves, highest, dtype=dtype)
+        self.high = np.full(2 * self.leaves, lowest, dtype=dtype)
+
+    def set(self, slot, values):
+        """Writes values to slots slot, slot + 1, ... (wrapping around) and updates their ancestors."""
+        head = min(len(values), self.capacity - slot)
+        for first, part in ((slot, values[:head]), (0, values[head:])):
+            if len(part) == 0:
+                continue
+            a = self.leaves + first
+            b = a + len(part)
+            self.low[a:b] = part
+            self.high[a:b] = part
+            while b - a > 1:
+                a, b = a // 2, (b - 1) // 2 + 1  # Parents of nodes a..b-1
+                np.minimum(self.low[2 * a:2 * b:2], self.low[2 * a + 1:2 * b + 1:2], out=self.low[a:b])
+                np.maximum(self.high[2 * a:2 * b:2], self.high[2 * a + 1:2 * b + 1:2], out=self.high[a:b])
+            self._climb(a)
+
+    def _climb(self, node):
+        """Updates the ancestors of one node, with scalar operations (cheaper than slices of one element)."""
+        low, high = self.low, self.high
+        while node > 1:
+            node //= 2
+            left, right = low[2 * node], low[2 * node + 1]
+            low[node] = left if left <= right or left != left else right  # NaNs propagate, as in np.minimum
+            left, right = high[2 * node], high[2 * node + 1]
+            high[node] = left if left >= right or left != left else right
+
+    def bounds(self):
+        return self.low[1], self.high[1]
+
+
+class SlidingStats:
+    """Count, mean, standard deviation, min and max of the last ``size`` samples of a stream.
+
+    The sums are kept relative to a reference value (the window mean at the
+    last exact re-summation), which keeps the variance accurate for signals
+    with a large offset.
+    """
+
+    def __init__(self, size, dtype=np.float64):
+        self.ring = RingBuffer(size, dtype)
+        self.extremes = _Extremes(size, self.ring.data.dtype)
+        self.reference = None
+        self.total = self.squares = 0.0  # Sums of x - reference and of its square over the window
+        self.since = 0                   # Samples added since the last exact re-summation
+
+    def append(self, chunk):
+        """Adds at most ``size`` samples to the window."""
+        chunk = np.asarray(chunk)
+        if len(chunk) == 0:
+            return
+        ring = self.ring
+        slot, seen = ring.start, len(ring)
+        old = ring.append(chunk)
+        self.extremes.set(slot, ring.data[slot:slot + len(chunk)])
+        if self.reference is None:
+            self.reference = float(chunk[0])
+        # Only the replaced slots that held samples leave the window (the others were still empty)
+        leaving = old[len(old) - max(0, seen + len(chunk) - ring.capacity):]
+        self.since += len(chunk)
+        if self.since >= ring.capacity:
+            self.resum()
+        else:
+            new = np.asarray(chunk, dtype=float) - self.reference
+            gone = np.asarray(leaving, dtype=float) - self.reference
+            self.total += new.sum() - gone.sum()
+            self.squares += np.dot(new, new) - np.dot(gone, gone)
+
+    def resum(self):
+        """Recomputes the sums exactly from the window, around its current mean."""
+        values = np.asarray(self.ring.values(), dtype=float)
+        self.reference = float(values.mean()) if len(values) else 0.0
+        deviations = values - self.reference
+        self.total, self.squares = float(deviations.sum()), float(np.dot(deviations, deviations))
+        self.since = 0
+
+    def summary(self):
+        """The WindowStats of the samples in the window (NaNs while it is empty)."""
+        count = len(self.ring)
+        if count == 0:
+            return WindowStats(0, math.nan, math.nan, math.nan, math.nan)
+        offset = self.total / count
+        variance = max(self.squares / count - offset * offset, 0.0)
+        low, high = self.extremes.bounds()
+        return WindowStats(count, self.reference + offset, math.sqrt(variance), low.item(), high.item())
+
+
+class SlidingSpectrum:
+    """Welch power spectrum of the last ``size`` samples, updated one segment at a time.
+
+    The window is covered by Hann-windowed segments of ``segment`` samples
+    that overlap by half, as in ``spectrum.welch``, but they are aligned to
+    the stream rather than to the window: they start at multiples of half a
+    segment in the stream, so sliding the window never moves them. The result
+    is ``welch`` of the window's samples from the first such start to the end
+    of the last complete segment; up to half a segment at either end of the
+    window is left out. Each segment is transformed once, when its last sample
+    arrives. Its power is added to a running total, and subtracted again when
+    the segment leaves the window, so a sample costs O(log segment) however
+    long the window is. The total is re-summed exactly each time the window's
+    segments have all been replaced. A window no longer than one segment gets
+    a periodogram instead, as in ``spectrum.power_spectrum``.
+    """
+
+    def __init__(self, size, segment=SPECTRUM_SEGMENT):
+        self.size = size
+        self.segment = min(segment, size)
+        self.hop = max(self.segment // 2, 1)
+        self.taper = np.hanning(self.segment + 2)[1:-1]  # Same window as spectrum.welch
+        self.fft_size = fast_length(self.segment)
+        self.powers = deque()  # (end position, power) of the segments inside the window, oldest first
+        self.total = np.zeros(self.fft_size // 2 + 1)
+        self.done = 0          # Stream position where the last transformed segment ends
+        self.added = 0         # Segments added since the last exact re-summation
+
+    def update(self, ring, position):
+        """Transforms the segments completed at ``position`` (samples read); ``ring`` holds the window."""
+        if self.size <= self.segment:
+            return  # Periodogram of the whole window, computed when asked for
+        values = ring.values()
+        origin = position - len(values)  # Stream index of values[0]
+        # New segment ends: multiples of hop, past the last one done, with the whole segment in the window
+        first = max(self.done + self.hop, -(-(origin + self.segment) // self.hop) * self.hop)
+        ends = np.arange(first, position + 1, self.hop)
+        if len(ends):
+            segments = np.lib.stride_tricks.sliding_window_view(values, self.segment)[ends - self.segment - origin]
+            segments = np.asarray(segments, dtype=float)
+            segments -= segments.mean(axis=1, keepdims=True)  # Remove each segment's DC level
+            powers = np.abs(np.fft.rfft(segments * self.taper, self.fft_size)) ** 2
+            self.powers.extend(zip(ends.tolist(), powers))
+            self.total += powers.sum(axis=0)
+            self.done = int(ends[-1])
+            self.added += len(ends)
+        while self.powers and self.powers[0][0] - self.segment < origin:
+            self.total -= self.powers.popleft()[1]  # The segment has left the window
+        if self.added >= max(len(self.powers), 1):
+            self.total = np.zeros_like(self.total)
+            for _, power in self.powers:
+                self.total += power
+            self.added = 0
+
+    def spectrum(self, ring):
+        """The window's one-sided power spectral density, as a ``spectrum.Spectrum``."""
+        if not self.powers:
+            return periodogram(ring.values())  # Short window, or not one complete segment yet
+        count = len(self.powers)
+        power = _one_sided(self.total / (count * np.sum(self.taper ** 2)), self.fft_size)
+        return Spectrum(np.fft.rfftfreq(self.fft_size), power, "welch", count)
+
+
+class SlidingWindow:
+    """Real-time analysis of the last ``size`` samples of a stream.
+
+    ``process(chunk)`` takes chunks of any length. The window, the outputs
+    of the difference and cumulative-sum systems over the same samples, their
+    statistics and the window's spectrum are always up to date. The outputs
+    continue over the whole stream: the cumulative sum includes the samples
+    that already left the window.
+    """
+
+    def __init__(self, size=DEFAULT_WINDOW, dtype=np.float64, segment=SPECTRUM_SEGMENT):
+        self.size = size
+        self.dtype = np.dtype(dtype)
+        self.position = 0  # Samples processed so far
+        self.input = SlidingStats(size, self.dtype)
+        self.systems = {"difference": StreamingDifference(), "cumulative_sum": StreamingCumulativeSum()}
+        self.outputs = {"difference": SlidingStats(size, difference_dtype(self.dtype)),
+                        "cumulative_sum": SlidingStats(size, sum_dtype(self.dtype))}
+        self.spectrum = SlidingSpectrum(size, segment)
+
+    def process(self, chunk):
+        """Slides the window over a chunk of new samples."""
+        chunk = np.asarray(chunk).astype(self.dtype, copy=False)
+        for first in range(0, len(chunk), self.size):
+            piece = chunk[first:first + self.size]
+            self.input.append(piece)
+            for name, system in self.systems.items():
+                self.outputs[name].append(system.process(piece))
+            self.position += len(piece)
+            self.spectrum.update(self.input.ring, self.position)
+
+    def snapshot(self):
+        """A LiveSnapshot with copies of the window and outputs, safe to keep while processing goes on."""
+        origin = self.position - len(self.input.ring)
+        outputs = {name: IndexedSignal(stats.ring.values().copy(), origin) for name, stats in self.outputs.items()}
+        summaries = {"input": self.input.summary()}
+        summaries.update((name, stats.summary()) for name, stats in self.outputs.items())
+        return LiveSnapshot(self.position, IndexedSignal(self.input.ring.values().copy(), origin),
+                            outputs, summaries, self.spectrum.spectrum(self.input.ring))
+
+
+def live_chunks(source="-", dtype=np.float64, text=None):
+    """Yields chunks of samples from a pipe, FIFO or file as soon as they arrive ("-" reads stdin).
+
+    Sources are text (numbers separated by whitespace or commas) unless
+    ``text`` is False or a file path does not have a text extension, in which
+    case they hold raw samples of ``dtype``. Reads are unbuffered, so a chunk
+    is yielded as soon as the writer has written something.
+    """
+    dtype = np.dtype(dtype)
+    if text is None:
+        text = source == "-" or is_text_file(source)
+    f = sys.stdin.buffer.raw if source == "-" else open(source, "rb", buffering=0)
+    try:
+        if text:
+            yield from text_chunks(f, dtype, LIVE_READ, allow_float=dtype.kind in "fc")
+        else:
+            yield from binary_chunks(f, dtype, LIVE_READ // dtype.itemsize)
+    finally:
+        if source != "-":
+            f.close()
+
+
+class LiveAnalysis:
+    """Runs a SlidingWindow over a stream of chunks in a background thread.
+
+    ``snapshot()`` may be called from any thread, at any rate. ``error`` holds
+    the exception that stopped the stream, if any.
+    """
+
+    def __init__(self, chunks, window):
+        self.chunks = chunks
+        self.window = window
+        self.error = None
+        self.finished = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="signal-live", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            for chunk in self.chunks:
+                with self._lock:
+                    self.window.process(chunk)
+        except Exception as error:  # Reported to the front end through self.error
+            self.error = error
+        finally:
+            self.finished.set()
+
+    def snapshot(self):
+        with self._lock:
+            return self.window.snapshot()
+
+    def frames(self, fps):
+        """Yields a snapshot ``fps`` times per second until the stream ends, then a last one.
+
+        Ticks missed while the caller was busy are skipped, not made up for.
+        """
+        interval = 1 / fps
+        deadline = time.monotonic() + interval
+        while not self.finished.wait(max(deadline - time.monotonic(), 0)):
+            yield self.snapshot()
+            deadline = max(deadline + interval, time.monotonic())
+        yield self.snapshot()
@@ -0,0 +1,109 @@
+"""Registry of named systems that the front ends can analyze.
+
+A system can be registered from its difference-equation coefficients (b, a),
+from FIR taps, or as any NumPy callable working along the last axis. The
+built-in difference and cumulative-sum systems are themselves registered as
+difference equations (b = [1, -1] and a = [1, -1]); System 3's decimation,
+which is not LTI, is registered as a callable.
+
+Additional systems are usually defined in a Python file that calls the
+``register_*`` functions and is loaded with ``load_systems``.
+"""
+
+import runpy
+
+import numpy as np
+
+from .filters import lfilter
+from .systems import decimate
+
+
+class RegisteredSystem:
+    """A named system: a callable plus the description it was built from."""
+
+    def __init__(self, name, function, label, kind, b=None, a=None):
+        self.name = name
+        self.function = function
+        self.label = label or name   # Text shown in reports, e.g. "y[n] = x[2n]"
+        self.kind = kind             # "lti", "fir" or "callable"
+        self.b = b                   # Numerator coefficients (LTI and FIR systems)
+        self.a = a                   # Denominator coefficients (LTI systems)
+
+    def __call__(self, x):
+        return self.function(x)
+
+    def __repr__(self):
+        return f"RegisteredSystem({self.name!r}, kind={self.kind!r}, label={self.label!r})"
+
+
+# All registered systems by name, in registration order
+REGISTRY = {}
+
+
+def _hold_first(function, history):
+    """Wraps a filter so the input is taken as constant at x[0] before n = 0."""
+    def filtered(x):
+        x = np.asarray(x)
+        before = np.repeat(x[..., :1], history, axis=-1)
+        return function(np.concatenate([before, x], axis=-1))[..., history:]
+    return filtered
+
+
+def register_system(name, function, label=None):
+    """Registers an arbitrary callable mapping a signal (or rows of signals) to its output."""
+    REGISTRY[name] = RegisteredSystem(name, function, label, "callable")
+    return REGISTRY[name]
+
+
+def register_lti(name, b, a=(1,), label=None, initial="zero"):
+    """Registers the LTI system a[0] y[n] + a[1] y[n-1] + ... = b[0] x[n] + b[1] x[n-1] + ...
+
+    ``initial`` is ``"zero"`` (zero initial conditions) or, for FIR systems only,
+    ``"hold"`` (the input is taken as constant at x[0] before n = 0).
+    """
+    b = [float(c) for c in np.atleast_1d(b)]
+    a = [float(c) for c in np.atleast_1d(a)]
+    function = lambda x: lfilter(b, a, x)
+    if initial == "hold":
+        if len(np.trim_zeros(a, "b")) > 1:
+            raise ValueError("initial='hold' is only supported for FIR systems")
+        function = _hold_first(function, len(b) - 1)
+    elif initial != "zero":
+        raise ValueError(f"unknown initial condition: {initial!r}")
+    kind = "fir" if len(np.trim_zeros(a, "b")) == 1 else "lti"
+    REGISTRY[name] = RegisteredSystem(name, function, label, kind, b, a)
+    return REGISTRY[name]
+
+
+def register_fir(name, taps, label=None, initial="zero"):
+    """Registers the FIR system y[n] = sum of taps[k] x[n-k]."""
+    return register_lti(name, taps, (1,), label, initial)
+
+
+def get_system(name):
+    """Returns the registered system called ``name`` (KeyError if there is none)."""
+    return REGISTRY[name]
+
+
+def unregister_system(name):
+    """Removes a registered system."""
+    del REGISTRY[name]
+
+
+def load_systems(path):
+    """Runs a Python file that registers systems; returns the names it added."""
+    before = set(REGISTRY)
+    runpy.run_path(path, init_globals={"register_system": register_system,
+                                       "register_lti": register_lti,
+                                       "register_fir": register_fir})
+    return [name for name in REGISTRY if name not in before]
+
+
+# --- Built-in systems ---
+# y[0] = 0 in System 1 corresponds to holding x[0] before the start
+register_lti("difference", b=[1, -1], label="y[n] = x[n] - x[n-1]", initial="hold")
+register_lti("cumulative_sum", b=[1], a=[1, -1], label="y[n] = cumulative sum of x[k]")
+register_system("decimate", decimate, label="y[n] = x[2n]")
+
+# Names of the systems every front end presents as Systems 1, 2 and 3
+BUILTIN_SYSTEMS = ("difference", "cumulative_sum", "decimate")
@@ -0,0 +1,50 @@
+"""Text reports of the system analyses, built from structured results.
+
+The front ends collect one SystemReport per system (its output and property
+verdicts) and hand them to ``format_report``, which fills the report
+templates of a message catalog (see ``messages``). The templates are looked
+up once per report, each system is one ``str.format`` of a whole block, and
+the blocks are joined at the end, so a report costs about as much as printing
+the outputs.
+
+A catalog holds one set of templates per layout: ``"cli"`` (the command-line
+report) and ``"gui"`` (the System Analysis tab).
+"""
+
+from collections import namedtuple
+
+from .registry import BUILTIN_SYSTEMS
+
+# name: registry name; label: the system's own description (e.g. "y[n] = x[2n]");
+# output: the system's output; verdict: the property results of properties.verify
+SystemReport = namedtuple("SystemReport", "name label output verdict")
+
+
+def format_report(reports, messages, layout="cli"):
+    """The report text of a sequence of SystemReports, in the language of ``messages``.
+
+    The built-in systems are shown as Systems 1, 2 and 3 with their
+    translated labels; other systems keep their own label.
+    """
+    prefix = f"report.{layout}."
+    block, numbered, titled, stable, unstable, separator = (
+        messages[prefix + key] for key in ("system", "numbered", "title", "stable", "unstable", "separator"))
+    yes_no = {True: messages["yes"], False: messages["no"]}
+    blocks = []
+    for report in reports:
+        verdict = report.verdict
+        if report.name in BUILTIN_SYSTEMS:
+            label = messages.get(f"system.{report.name}", report.label)
+            title = numbered.format(number=BUILTIN_SYSTEMS.index(report.name) + 1, label=label)
+        else:
+            title = titled.format(label=report.label)
+        bound = verdict["stable"].bound
+        blocks.append(block.format(
+            title=title,
+            output=report.output,
+            causal=yes_no[verdict["causal"].holds],
+            memory=yes_no[verdict["memory"].holds],
+            stable=(stable if verdict["stable"].holds else unstable).format(bound=bound),
+            time_invariant=yes_no[verdict["time_invariant"].holds],
+            linear=yes_no[verdict["linear"].holds]))
+    return separator.join(blocks)
@@ -0,0 +1,234 @@
+"""Compact columnar files holding the results of an analysis.
+
+A results file is an ``.npz`` archive with one member per column: the original
+signal ``x``, each transform's index axis (``shifted_n``) and values
+(``shifted``), each system output (``y_<system name>``) and a table of the
+property verdicts. A batch of signals uses the same layout in a single file:
+the columns of all signals are concatenated, and the ``index`` member holds
+where each signal's part of every column ends.
+
+Nothing is stored twice. Index axes that are arithmetic progressions (all the
+transforms produce them) are stored as a start and a step, and a column that
+is a view of the same data as an earlier one (shift and reflection keep the
+samples of x) is stored as an alias. Archives are written uncompressed by
+default, so ``load_results(path, mmap_mode="r")`` maps the columns straight
+from the file; ``compress=True`` deflates them instead, for archiving.
+"""
+
+import struct
+import zipfile
+from collections import namedtuple
+
+import numpy as np
+
+from .properties import PropertyResult
+from .transforms import IndexedSignal
+
+# Version of the layout written by this module
+RESULTS_FORMAT = 1
+
+# Integers checked per block when testing whether an index axis is a progression
+_RANGE_BLOCK = 1 << 20
+
+# How each column is stored: as a member of its own, as another column, or as start + step * i
+_LAYOUT_DTYPE = np.dtype([("column", "U64"), ("kind", "U5"), ("source", "U64"),
+                          ("start", np.int64), ("step", np.int64)])
+
+_PROPERTIES_DTYPE = np.dtype([("system", "U64"), ("property", "U16"), ("holds", np.bool_),
+                              ("trials", np.int64), ("failures", np.int64), ("bound", np.float64)])
+
+# Contents of a loaded results file: column name -> concatenated array, the
+# per-signal end offsets of every column, and system -> property -> PropertyResult
+SavedResults = namedtuple("SavedResults", "columns index verdicts")
+
+
+def _progression(n):
+    """(start, step) if n is an integer arithmetic progression, else None."""
+    if n.ndim != 1 or not np.issubdtype(n.dtype, np.integer):
+        return None
+    if len(n) < 2:
+        return (int(n[0]) if len(n) else 0), 1
+    start, step = int(n[0]), int(n[1] - n[0])
+    for first in range(0, len(n) - 1, _RANGE_BLOCK):
+        block = np.asarray(n[first:first + _RANGE_BLOCK + 1])
+        if np.any(block[1:] - block[:-1] != step):
+            return None
+    return start, step
+
+
+def _same_data(a, b):
+    """True if a and b are the same view of the same memory."""
+    return (a.dtype == b.dtype and a.shape == b.shape and a.strides == b.strides
+            and a.__array_interface__["data"][0] == b.__array_interface__["data"][0])
+
+
+def _verdict_table(verdicts):
+    """The verdicts of each system (system name -> verify_system dict) as a structured array."""
+    rows = [(system, name, result.holds, result.trials, result.failures,
+             np.nan if result.bound is None else result.bound)
+            for system, results in (verdicts or {}).items() for name, result in results.items()]
+    return np.array(rows, dtype=_PROPERTIES_DTYPE)
+
+
+def _write(path, columns, lengths, ranges, aliases, verdicts, compress):
+    """Writes a results archive.
+
+    ``columns`` maps a column name to its concatenated data, ``ranges`` and
+    ``aliases`` map the columns stored as (start, step) or as another column,
+    and ``lengths`` gives the per-signal lengths of every column.
+    """
+    names = list(lengths)
+    layout = np.zeros(len(names), dtype=_LAYOUT_DTYPE)
+    index = np.zeros(len(next(iter(lengths.values()), [])), dtype=[(name, np.int64) for name in names])
+    for row, name in enumerate(names):
+        layout[row]["column"] = name
+        if name in ranges:
+            layout[row]["kind"] = "range"
+            layout[row]["start"], layout[row]["step"] = ranges[name]
+        elif name in aliases:
+            layout[row]["kind"] = "alias"
+            layout[row]["source"] = aliases[name]
+        else:
+            layout[row]["kind"] = "data"
+        index[name] = np.cumsum(lengths[name])
+    members = {"format": np.array(RESULTS_FORMAT), "layout": layout, "index": index,
+               "properties": _verdict_table(verdicts)}
+    members.update((f"column/{name}", data) for name, data in columns.items())
+    (np.savez_compressed if compress else np.savez)(path, **members)
+
+
+def save_results(path, x, transforms, outputs, verdicts=None, compress=False):
+    """Writes the analysis of one signal to a results file.
+
+    ``transforms`` maps a transform name to its IndexedSignal (or its
+    ``(n, values)`` pair), ``outputs`` maps a system name to its output, and
+    ``verdicts`` maps a system name to its ``verify_system`` dict.
+    """
+    arrays = {"x": np.asarray(x)}
+    for name, transformed in transforms.items():
+        if isinstance(transformed, IndexedSignal):
+            arrays[f"{name}_n"] = transformed  # Stored as its origin and step, never expanded
+            arrays[name] = transformed.values
+        else:
+            arrays[f"{name}_n"] = np.asarray(transformed[0])
+            arrays[name] = np.asarray(transformed[1])
+    arrays.update((f"y_{name}", np.asarray(y)) for name, y in outputs.items())
+
+    columns, ranges, aliases = {}, {}, {}
+    for name, array in arrays.items():
+        if isinstance(array, IndexedSignal):
+            ranges[name] = array.origin, array.step
+            continue
+        progression = _progression(array) if name.endswith("_n") else None
+        source = next((other for other, data in columns.items() if _same_data(array, data)), None)
+        if progression is not None:
+            ranges[name] = progression
+        elif source is not None:
+            aliases[name] = source
+        else:
+            columns[name] = array
+    lengths = {name: np.array([len(array)]) for name, array in arrays.items()}
+    _write(path, columns, lengths, ranges, aliases, verdicts, compress)
+
+
+def save_batch_results(path, results, verdicts=None, compress=False, shift_by=2):
+    """Writes the structured array of ``analyze_batch`` to one results file.
+
+    The padding of each row is dropped: every column holds only the valid
+    samples of each signal, one after the other. ``shift_by`` is the shift the
+    batch was analyzed with.
+    """
+    length = results.dtype["x"].shape[0] if len(results.dtype["x"].shape) else 0
+    lengths = results["length"]
+    half = (lengths + 1) // 2
+    valid = np.arange(length) < lengths[:, None]
+    valid_half = valid[:, ::2]
+    columns = {
+        "x": results["x"][valid],
+        "compressed": results["compressed"][valid_half],
+        "y_difference": results["y1"][valid],
+        "y_cumulative_sum": results["y2"][valid],
+    }
+    ranges = {"shifted_n": (shift_by, 1), "reflected_n": (0, -1), "compressed_n": (0, 1)}
+    aliases = {"shifted": "x", "reflected": "x", "y_decimate": "compressed"}
+    lengths = {"x": lengths, "shifted_n": lengths, "shifted": lengths, "reflected_n": lengths,
+               "reflected": lengths, "compressed_n": half, "compressed": half,
+               "y_difference": lengths, "y_cumulative_sum": lengths, "y_decimate": half}
+    _write(path, columns, lengths, ranges, aliases, verdicts, compress)
+
+
+def _map_member(path, archive, member, mmap_mode):
+    """Memory-maps an uncompressed ``.npy`` member of a zip archive, or returns None if it is compressed."""
+    info = archive.getinfo(member)
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(path, "rb") as f:
+        # The data follows the member's local header: 30 bytes plus its name and extra field
+        f.seek(info.header_offset + 26)
+        name_length, extra_length = struct.unpack("<HH", f.read(4))
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if fortran_order or dtype.hasobject:
+        return None
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)  # np.memmap cannot map zero bytes
+    return np.memmap(path, dtype=dtype, mode=mmap_mode, offset=offset, shape=shape)
+
+
+def load_results(path, mmap_mode=None):
+    """Reads a results file back; returns a SavedResults.
+
+    With ``mmap_mode="r"``, the columns of an uncompressed file are memory
+    maps into it (compressed columns are always read into memory). Columns
+    stored as progressions are rebuilt per signal.
+    """
+    with np.load(path) as archive:
+        if int(archive["format"]) > RESULTS_FORMAT:
+            raise ValueError(f"{path}: results format {int(archive['format'])} is newer than this version")
+        layout, index, table = archive["layout"], archive["index"], archive["properties"]
+        data = {}
+        members = zipfile.ZipFile(path) if mmap_mode else None  # Only needed to locate mapped members
+        try:
+            for row in layout[layout["kind"] == "data"]:
+                name = str(row["column"])
+                array = _map_member(path, members, f"column/{name}.npy", mmap_mode) if mmap_mode else None
+                data[name] = array if array is not None else archive[f"column/{name}"]
+        finally:
+            if members is not None:
+                members.close()
+
+    columns = {}
+    for row in layout:
+        name, kind = str(row["column"]), str(row["kind"])
+        if kind == "data":
+            columns[name] = data[name]
+        elif kind == "alias":
+            columns[name] = data[str(row["source"])]
+        else:
+            # start + step * (position within its own signal)
+            ends = index[name]
+            lengths = np.diff(ends, prepend=0)
+            offsets = np.repeat(ends - lengths, lengths)  # Where each sample's signal starts
+            columns[name] = int(row["start"]) + int(row["step"]) * (np.arange(len(offsets)) - offsets)
+
+    verdicts = {}
+    for row in table:
+        bound = None if np.isnan(row["bound"]) else float(row["bound"])
+        verdicts.setdefault(str(row["system"]), {})[str(row["property"])] = PropertyResult(
+            bool(row["holds"]), int(row["trials"]), int(row["failures"]), None, bound)
+    return SavedResults(columns, index, verdicts)
+
+
+def saved_signal(saved, i=0):
+    """The columns of signal i of a loaded results file, as a dict of arrays."""
+    signal = {}
+    for name, column in saved.columns.items():
+        ends = saved.index[name]
+        start = int(ends[i - 1]) if i > 0 else 0
+        signal[name] = column[start:int(ends[i])]
+    return signal
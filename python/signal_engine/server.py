@@ -0,0 +1,400 @@
+"""Local analysis service: the engine behind a persistent asyncio server.
+
+Other tools can analyze signals without paying the interpreter (and NumPy)
+startup on every call. The server speaks a minimal HTTP/1.1 on a Unix socket
+or on a localhost TCP port, with keep-alive and pipelined requests:
+
+- ``POST /analyze`` takes one signal as the body, either a ``.npy`` file or
+  raw samples of the ``dtype`` given in the query. It returns the columnar
+  results file of ``results.save_results`` (``application/x-npz``): the
+  signal, its transforms, the output of each system and their verdicts.
+  Query options: ``shift`` (default 2), ``systems`` (comma-separated names,
+  default all) and ``verify`` (0 to skip the verdicts).
+- ``GET /systems`` lists the system names as JSON, and ``GET /health``
+  answers ``ok``.
+
+No number ever goes through JSON. The analyses run in a pool of worker
+processes, started and warmed up (engine imported, verdicts of the systems
+computed) before the server accepts connections. Requests wait in a queue
+while every worker is busy. When a worker frees up, it takes all the waiting
+small requests with the same options at once and runs them as one
+``analyze_batch`` call. A lone request therefore never waits for a batch to
+fill, and a burst of small ones costs a few vectorized passes.
+"""
+
+import asyncio
+import io
+import json
+import os
+import signal
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from .batch import analyze_batch, pack_signals, signal_result
+from .cache import cached_verify
+from .metrics import span
+from .parallel import default_workers
+from .registry import BUILTIN_SYSTEMS, REGISTRY, load_systems
+from .results import save_results
+from .systems import SYSTEMS
+from .transforms import compress, reflect, shift
+
+# TCP port of the service when no Unix socket is given
+DEFAULT_PORT = 8765
+
+# Largest request body accepted (bytes)
+MAX_BODY = 1 << 30
+
+# Padded samples (requests x longest signal) run in one batched computation
+BATCH_SAMPLES = 1 << 20
+
+# Requests a connection may have in flight; the client sends no more at once
+PIPELINE_DEPTH = 64
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            411: "Length Required", 413: "Payload Too Large", 422: "Unprocessable Entity",
+            500: "Internal Server Error"}
+
+# The whole-array functions behind the built-in names, as the front ends use them
+_BUILTINS = dict(zip(BUILTIN_SYSTEMS, SYSTEMS.values()))
+
+# Columns of analyze_batch holding the output of each built-in system
+_BATCH_COLUMNS = dict(zip(BUILTIN_SYSTEMS, ("y1", "y2", "y3")))
+
+
+class HTTPError(Exception):
+    """A request the server answers with an error status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# --- Worker side (module level so the pool can pickle it) ---
+
+def _system(name):
+    return _BUILTINS.get(name) or REGISTRY[name]
+
+
+def _warm_up(systems_file):
+    """Worker initializer: loads the extra systems and computes every verdict once."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C stops the server, which shuts the pool down
+    if systems_file:
+        load_systems(systems_file)
+    for name in list(BUILTIN_SYSTEMS) + [name for name in REGISTRY if name not in _BUILTINS]:
+        cached_verify(_system(name))
+
+
+def _ready():
+    return os.getpid()
+
+
+def _outputs(x, names):
+    """The outputs of the named systems for one signal."""
+    return {name: np.asarray(_system(name)(x)) for name in names}
+
+
+def _encode(x, shift_by, outputs, names, verify):
+    """The results file of one analysis, as bytes."""
+    transforms = {"shifted": shift(x, shift_by), "reflected": reflect(x), "compressed": compress(x, 2)}
+    verdicts = {name: cached_verify(_system(name)) for name in names} if verify else None
+    buffer = io.BytesIO()
+    save_results(buffer, x, transforms, {name: outputs[name] for name in names}, verdicts)
+    return buffer.getvalue()
+
+
+def analyze_requests(signals, shift_by=2, names=BUILTIN_SYSTEMS, verify=True):
+    """Analyzes several signals of the same type; returns one results file (bytes) per signal.
+
+    The built-in systems of all the signals run in one ``analyze_batch`` call.
+    A signal that cannot be analyzed gets its exception in place of its bytes.
+    """
+    outputs = None
+    builtin = [name for name in names if name in _BATCH_COLUMNS]
+    if len(signals) > 1 and builtin:
+        try:
+            X, lengths = pack_signals(signals)
+            results = analyze_batch(X, lengths, shift_by)
+            outputs = []
+            for i, x in enumerate(signals):
+                row = signal_result(results, i)
+                output = {name: row[_BATCH_COLUMNS[name]] for name in builtin}
+                output.update(_outputs(x, [name for name in names if name not in output]))
+                outputs.append(output)
+        except (ValueError, ArithmeticError):
+            outputs = None  # Analyzed one by one below, so only the faulty signal fails
+
+    responses = []
+    for i, x in enumerate(signals):
+        try:
+            output = outputs[i] if outputs is not None else _outputs(x, names)
+            responses.append(_encode(x, shift_by, output, names, verify))
+        except (ValueError, ArithmeticError) as error:
+            responses.append(error)
+    return responses
+
+
+# --- Server side ---
+
+def _parse_signal(body, options):
+    """The signal carried by a request body: a .npy file, or raw samples of ``dtype``."""
+    try:
+        if body.startswith(b"\x93NUMPY"):
+            x = np.load(io.BytesIO(body), allow_pickle=False)
+        else:
+            dtype = np.dtype(options.get("dtype", "float64"))
+            if dtype.hasobject or len(body) % dtype.itemsize:
+                raise ValueError(f"{len(body)} bytes are not a whole number of {dtype} samples")
+            x = np.frombuffer(body, dtype=dtype)
+    except (ValueError, TypeError) as error:
+        raise HTTPError(400, f"invalid signal: {error}") from None
+    if x.ndim != 1 or x.dtype.kind not in "biuf":
+        raise HTTPError(400, f"expected a 1-D numeric signal, got shape {x.shape} of {x.dtype}")
+    return x.astype(x.dtype.newbyteorder("="), copy=False)
+
+
+async def _read_request(reader):
+    """(method, path, options, headers, body) of the next request, or None at end of stream."""
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(400, "malformed request line") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise HTTPError(411, "chunked bodies are not supported; send a Content-Length")
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(400, "invalid Content-Length") from None
+    if length > MAX_BODY:
+        raise HTTPError(413, f"bodies are limited to {MAX_BODY} bytes")
+    body = await reader.readexactly(length) if length else b""
+    url = urlsplit(target)
+    options = {key: values[-1] for key, values in parse_qs(url.query).items()}
+    if version == "HTTP/1.0" or headers.get("connection", "").lower() == "close":
+        headers["connection"] = "close"
+    return method, url.path, options, headers, body
+
+
+def _response(status, body, content_type="text/plain; charset=utf-8"):
+    if isinstance(body, str):
+        body = body.encode()
+    return status, content_type, body
+
+
+def _done(value):
+    """A future already holding value (for responses known before any computation)."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+class AnalysisServer:
+    """The analysis service: a warm process pool behind an asyncio HTTP server.
+
+    ``workers`` defaults to one process per core. ``systems_file`` is loaded
+    into the registry of every worker, like the front ends' ``--systems``.
+    """
+
+    def __init__(self, workers=None, systems_file=None):
+        self.workers = workers or default_workers()
+        self.systems_file = systems_file
+        if systems_file:
+            load_systems(systems_file)  # So that requests can be checked for unknown names
+        self.names = tuple(BUILTIN_SYSTEMS) + tuple(name for name in REGISTRY if name not in _BUILTINS)
+        self.pool = None
+        self.server = None
+        self._waiting = {}   # (dtype, shift, names, verify) -> [(signal, future)] in arrival order
+        self._busy = 0       # Batches running in the pool
+        self._tasks = set()
+
+    async def start(self, path=None, host="127.0.0.1", port=DEFAULT_PORT):
+        """Starts and warms up the workers, then listens on ``path`` (Unix socket) or host:port.
+
+        A socket left at ``path`` by a server that did not shut down is
+        replaced; anything else there raises FileExistsError.
+        """
+        if path and os.path.lexists(path) and not _is_socket(path):
+            raise FileExistsError("exists and is not a socket; refusing to replace it")
+        loop = asyncio.get_running_loop()
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_warm_up, initargs=(self.systems_file,))
+        await asyncio.gather(*(loop.run_in_executor(self.pool, _ready) for _ in range(self.workers)))
+        if path:
+            if _is_socket(path):
+                os.unlink(path)  # A socket left behind by a server that did not shut down
+            self.server = await asyncio.start_unix_server(self._connection, path)
+        else:
+            self.server = await asyncio.start_server(self._connection, host, port)
+        return self.server
+
+    async def close(self):
+        """Stops listening and shuts the workers down."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    # --- Connections: requests are read ahead and answered in order ---
+
+    async def _connection(self, reader, writer):
+        responses = asyncio.Queue(PIPELINE_DEPTH)
+        sender = asyncio.ensure_future(self._send(responses, writer))
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except HTTPError as error:
+                    await responses.put((_done(_response(error.status, str(error))), True))
+                    break
+                if request is None:
+                    break
+                await responses.put((asyncio.ensure_future(self._respond(*request[:3], request[4])),
+                                     request[3].get("connection") == "close"))
+                if request[3].get("connection") == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # The client went away; answer what was already read
+        finally:
+            await responses.put(None)
+            await sender
+
+    async def _send(self, responses, writer):
+        try:
+            while True:
+                item = await responses.get()
+                if item is None:
+                    break
+                pending, close = item
+                status, content_type, body = await pending
+                writer.write(f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                             f"Content-Type: {content_type}\r\n"
+                             f"Content-Length: {len(body)}\r\n"
+                             f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode() + body)
+                await writer.drain()
+                if close:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method, path, options, body):
+        with span("server/request"):
+            try:
+                return await self._route(method, path, options, body)
+            except HTTPError as error:
+                return _response(error.status, str(error))
+            except (ValueError, ArithmeticError) as error:
+                return _response(422, str(error))
+            except Exception as error:  # Reported to the client; the server keeps running
+                return _response(500, f"{type(error).__name__}: {error}")
+
+    async def _route(self, method, path, options, body):
+        if path == "/health":
+            return _response(200, "ok")
+        if path == "/systems":
+            return _response(200, json.dumps(list(self.names)), "application/json")
+        if path != "/analyze":
+            raise HTTPError(404, f"no such resource: {path}")
+        if method != "POST":
+            raise HTTPError(405, "send the signal with POST")
+        x = _parse_signal(body, options)
+        try:
+            shift_by = int(options.get("shift", 2))
+        except ValueError:
+            raise HTTPError(400, f"invalid shift: {options['shift']!r}") from None
+        names = tuple(options["systems"].split(",")) if options.get("systems") else self.names
+        unknown = [name for name in names if name not in self.names]
+        if unknown:
+            raise HTTPError(400, f"unknown systems: {', '.join(unknown)}")
+        verify = options.get("verify", "1") not in ("0", "false", "no")
+        result = await self._analyze(x, (x.dtype.str, shift_by, names, verify))
+        if isinstance(result, Exception):
+            raise result
+        return _response(200, result, "application/x-npz")
+
+    # --- Batching of the waiting requests ---
+
+    def _analyze(self, x, key):
+        future = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(key, []).append((x, future))
+        self._dispatch()
+        return future
+
+    def _dispatch(self):
+        """Hands waiting requests to free workers, as many compatible small ones per batch as fit."""
+        while self._waiting and self._busy < self.workers:
+            key = next(iter(self._waiting))
+            waiting = self._waiting[key]
+            batch = [waiting.pop(0)]
+            longest = len(batch[0][0])
+            while waiting and (len(batch) + 1) * max(longest, len(waiting[0][0])) <= BATCH_SAMPLES:
+                batch.append(waiting.pop(0))
+                longest = max(longest, len(batch[-1][0]))
+            if not waiting:
+                del self._waiting[key]
+            self._busy += 1
+            task = asyncio.ensure_future(self._run(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            with span("server/batch"):
+                results = await loop.run_in_executor(self.pool, analyze_requests,
+                                                     [x for x, _ in batch], *key[1:])
+        except Exception as error:  # E.g. a worker died: every request of the batch fails
+            results = [error] * len(batch)
+        finally:
+            self._busy -= 1
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+        self._dispatch()
+
+
+def _is_socket(path):
+    """Whether path is a Unix socket (not following symbolic links)."""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except OSError:
+        return False
+
+
+async def _serve(path, host, port, workers, systems_file, ready):
+    server = AnalysisServer(workers, systems_file)
+    await server.start(path, host, port)
+    if ready is not None:
+        ready()
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+        if path and _is_socket(path):
+            os.unlink(path)
+
+
+def serve(path=None, host="127.0.0.1", port=DEFAULT_PORT, workers=None, systems_file=None, ready=None):
+    """Runs the analysis service until interrupted (Ctrl+C).
+
+    Listens on the Unix socket ``path`` when given, else on host:port.
+    ``ready()`` is called once the workers are warm and the server listens.
+    """
+    try:
+        asyncio.run(_serve(path, host, port, workers, systems_file, ready))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,156 @@
+"""Frequency-domain analysis: signal spectra and system frequency responses.
+
+Frequencies are in cycles per sample, from 0 to 0.5 (the Nyquist frequency),
+since the signals carry no sampling rate. Spectra are one-sided power spectral
+densities, so those of short and long signals can be compared. The mean of
+each signal (or segment) is removed first, so that a DC offset does not hide
+the rest of the spectrum:
+
+- a signal of at most ``segment`` samples gets a periodogram, its ``rfft``
+  zero-padded to a fast FFT length (at least MIN_FFT_SIZE);
+- a longer one gets a Welch average over Hann-windowed, half-overlapping
+  segments. Segments are transformed a block at a time, so memory stays
+  bounded even for memory-mapped captures larger than RAM.
+
+FFT lengths come from the memoized ``filters.fast_length`` (NumPy's pocketfft
+keeps its own cache of plans). Registered LTI and FIR systems get their exact
+response from their coefficients. Other callables are characterized by the
+spectrum of their impulse response, which is only meaningful for LTI systems,
+so callables that the property checks find not linear or not time-invariant
+(such as System 3's decimation) get no frequency response.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .cache import cached_verify
+from .filters import fast_length
+from .metrics import span
+
+# Longest signal analyzed with a single periodogram; also the Welch segment length
+DEFAULT_SEGMENT = 4096
+
+# Shortest periodogram FFT: zero-padding samples the spectrum of short signals more finely
+MIN_FFT_SIZE = 256
+
+# Welch segments transformed together in one rfft call
+SEGMENTS_PER_BLOCK = 64
+
+# Frequencies at which frequency responses are evaluated
+RESPONSE_POINTS = 512
+
+# Range of decibels below a curve's peak that to_db keeps (lower values are clipped)
+DYNAMIC_RANGE_DB = 120
+
+# One-sided power spectral density of a signal; method is "periodogram" or "welch"
+Spectrum = namedtuple("Spectrum", "freqs power method segments")
+
+# H(e^{j 2 pi f}) of a system at frequencies f; exact is False when H comes
+# from the impulse response of a callable rather than from its coefficients
+FrequencyResponse = namedtuple("FrequencyResponse", "freqs response exact")
+
+
+def _one_sided(power, size):
+    """Doubles the bins that stand for both a positive and a negative frequency."""
+    power[..., 1:(size + 1) // 2] *= 2  # Not DC, nor Nyquist when size is even
+    return power
+
+
+def periodogram(x):
+    """One-sided power spectral density of x from one rfft, zero-padded to a fast length."""
+    x = np.asarray(x, dtype=float)
+    size = fast_length(max(len(x), MIN_FFT_SIZE))
+    power = np.abs(np.fft.rfft(x - x.mean() if len(x) else x, size)) ** 2 / max(len(x), 1)
+    return Spectrum(np.fft.rfftfreq(size), _one_sided(power, size), "periodogram", 1)
+
+
+def welch(x, segment=DEFAULT_SEGMENT):
+    """Welch power spectral density: average over Hann-windowed segments overlapping by half.
+
+    x may be a memory map: only SEGMENTS_PER_BLOCK segments are read and
+    transformed at a time.
+    """
+    segment = min(segment, len(x))
+    hop = max(segment // 2, 1)
+    count = (len(x) - segment) // hop + 1
+    window = np.hanning(segment + 2)[1:-1]  # Periodic-like Hann window without zero end points
+    size = fast_length(segment)
+    total = np.zeros(size // 2 + 1)
+    for first in range(0, count, SEGMENTS_PER_BLOCK):
+        last = min(first + SEGMENTS_PER_BLOCK, count)
+        block = np.asarray(x[first * hop:(last - 1) * hop + segment], dtype=float)
+        segments = np.lib.stride_tricks.sliding_window_view(block, segment)[::hop]
+        segments = segments - segments.mean(axis=1, keepdims=True)  # Remove each segment's DC level
+        total += (np.abs(np.fft.rfft(segments * window, size)) ** 2).sum(axis=0)
+    power = total / (count * np.sum(window ** 2))
+    return Spectrum(np.fft.rfftfreq(size), _one_sided(power, size), "welch", count)
+
+
+def power_spectrum(x, segment=DEFAULT_SEGMENT):
+    """Periodogram of a short signal, Welch average of a long one."""
+    return periodogram(x) if len(x) <= segment else welch(x, segment)
+
+
+def is_lti(system):
+    """Whether a system is linear and time-invariant (difference equations always are; callables are checked)."""
+    if getattr(system, "b", None) is not None:
+        return True
+    verdicts = cached_verify(system)
+    return verdicts["linear"].holds and verdicts["time_invariant"].holds
+
+
+def frequency_response(system, points=RESPONSE_POINTS):
+    """Frequency response of a system at ``points`` frequencies from 0 to 0.5 cycles/sample.
+
+    Poles on the unit circle (the accumulator at f = 0) give infinite values.
+    Raises ValueError for a system that is not LTI, which has no frequency
+    response.
+    """
+    if not is_lti(system):
+        raise ValueError(f"{getattr(system, 'name', system)} is not linear and time-invariant")
+    size = 2 * (points - 1)
+    b = getattr(system, "b", None)
+    if b is not None:
+        a = getattr(system, "a", None) or [1.0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            response = np.fft.rfft(b, size) / np.fft.rfft(a, size)
+        exact = True
+    else:
+        impulse = np.zeros(size)
+        impulse[0] = 1
+        response = np.fft.rfft(np.asarray(system(impulse), dtype=float), size)
+        exact = False
+    return FrequencyResponse(np.fft.rfftfreq(size), response, exact)
+
+
+def analyze_spectrum(x, outputs, systems, segment=DEFAULT_SEGMENT):
+    """The frequency-domain stage of an analysis.
+
+    ``outputs`` maps a system name to its output for x, and ``systems`` maps
+    a name to the system. Returns a dict with the ``input`` Spectrum, the
+    ``outputs`` Spectrum of each system output and the ``responses``
+    (FrequencyResponse) of each system, None for those that are not LTI.
+    """
+    with span("spectrum/input"):
+        spectrum = power_spectrum(x, segment)
+    result = {"input": spectrum, "outputs": {}, "responses": {}}
+    for name, y in outputs.items():
+        with span(f"spectrum/{name}"):
+            result["outputs"][name] = power_spectrum(y, segment)
+    for name, system in systems.items():
+        with span(f"response/{name}"):
+            result["responses"][name] = frequency_response(system) if is_lti(system) else None
+    return result
+
+
+def to_db(power, dynamic_range=DYNAMIC_RANGE_DB):
+    """Powers as decibels (pass |H|**2 for a magnitude response), clipped ``dynamic_range`` dB below the peak.
+
+    Infinite powers (poles) stay infinite, which plots leave as gaps.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        db = 10 * np.log10(np.abs(power))
+    finite = db[np.isfinite(db)]
+    floor = (finite.max() if len(finite) else 0.0) - dynamic_range
+    return np.where(np.isnan(db), floor, np.maximum(db, floor))
@@ -0,0 +1,144 @@
+"""Chunk-by-chunk evaluation of the three systems with bounded memory.
+
+Each system keeps the small state it needs between chunks (the last sample,
+the running sum, or the sample parity), so feeding a signal in chunks gives
+outputs bit-identical to the whole-array functions in ``systems``, with the
+same output types. They also keep the sample type of the first chunk:
+later chunks are converted to it, or rejected when they cannot be (see
+``accumulate.conform_chunk``).
+"""
+
+import codecs
+
+import numpy as np
+
+from .accumulate import RunningSum, check_difference, conform_chunk, difference_dtype
+from .parsing import parse_signal
+
+
+class StreamingDifference:
+    """System 1, y[n] = x[n] - x[n-1], carrying the last sample between chunks."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.last = None  # Last sample of the previous chunk (None before the first)
+        self.position = 0  # Index in the whole signal of the next sample
+
+    def process(self, chunk):
+        chunk = conform_chunk(np.asarray(chunk), None if self.last is None else self.last.dtype)
+        y = np.empty(chunk.shape, dtype=difference_dtype(chunk.dtype))
+        if len(chunk) == 0:
+            return y
+        check_difference(chunk, self.last, self.position)
+        if self.last is None:
+            y[0] = 0  # Same convention as the whole-array system: y[0] = 0
+        else:
+            np.subtract(chunk[:1], self.last, out=y[:1], dtype=y.dtype, casting="unsafe")
+        np.subtract(chunk[1:], chunk[:-1], out=y[1:], dtype=y.dtype, casting="unsafe")
+        self.last = chunk[-1]
+        self.position += len(chunk)
+        return y
+
+
+class StreamingCumulativeSum(RunningSum):
+    """System 2, y[n] = sum of x[k], carrying the running sum between chunks.
+
+    The state (the carried sum and the unfinished block of a floating-point
+    sum) is that of ``accumulate.RunningSum``.
+    """
+
+
+class StreamingDecimate:
+    """System 3, y[n] = x[2n], tracking sample parity across chunk boundaries."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.position = 0  # Index in the whole signal of the next sample
+        self.dtype = None  # Sample type of the first chunk
+
+    def process(self, chunk):
+        chunk = conform_chunk(np.asarray(chunk), self.dtype)
+        if len(chunk):
+            self.dtype = chunk.dtype
+        start = self.position % 2  # First even-indexed sample of this chunk
+        self.position += len(chunk)
+        return chunk[start::2].copy()
+
+
+# Streaming counterparts of systems.SYSTEMS
+STREAMING_SYSTEMS = {
+    1: StreamingDifference,
+    2: StreamingCumulativeSum,
+    3: StreamingDecimate,
+}
+
+
+def stream_system(chunks, system):
+    """Yields the output chunks of one system (1, 2 or 3) for the input chunks."""
+    state = STREAMING_SYSTEMS[system]()
+    for chunk in chunks:
+        yield state.process(chunk)
+
+
+def stream_systems(chunks, systems=(1, 2, 3)):
+    """Runs several systems in a single pass, yielding one tuple of outputs per chunk.
+
+    Useful for one-shot sources such as stdin, which cannot be read once per system.
+    """
+    states = [STREAMING_SYSTEMS[number]() for number in systems]
+    for chunk in chunks:
+        yield tuple(state.process(chunk) for state in states)
+
+
+def text_chunks(f, dtype=np.float64, block_size=1 << 20, allow_float=True):
+    """Reads numbers separated by whitespace, commas or newlines from a text file (or stdin) in chunks.
+
+    At most ``block_size`` characters are held at a time; a number split across
+    two blocks is carried over to the next one. Files opened in binary mode are
+    decoded as UTF-8. A malformed token raises SignalParseError with its line
+    number in the whole input. ``dtype=None`` picks int64 or float64 per chunk,
+    as ``parse_signal`` does; the streaming systems keep the type of the first chunk.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    rest = ""
+    line = 1  # Line number of the first character of rest
+    while True:
+        block = f.read(block_size)
+        if not block:
+            break
+        if isinstance(block, bytes):
+            block = decoder.decode(block)
+        block = rest + block
+        cut = max(block.rfind(" "), block.rfind("\n"), block.rfind("\t"), block.rfind(","))
+        if cut < 0:
+            rest = block  # No separator yet: the whole block is one partial token
+            continue
+        rest = block[cut + 1:]
+        chunk = parse_signal(block[:cut], allow_float, dtype, first_line=line)
+        line += block.count("\n", 0, cut + 1)
+        if len(chunk):
+            yield chunk
+    chunk = parse_signal(rest + decoder.decode(b"", final=True), allow_float, dtype, first_line=line)
+    if len(chunk):
+        yield chunk
+
+
+def binary_chunks(f, dtype=np.float64, chunk_size=1 << 20):
+    """Reads raw binary samples of the given dtype from a file (or stdin) in chunks."""
+    dtype = np.dtype(dtype)
+    rest = b""
+    while True:
+        block = f.read(chunk_size * dtype.itemsize)
+        if not block:
+            break
+        block = rest + block
+        usable = len(block) - len(block) % dtype.itemsize  # Keep partial samples for later
+        rest = block[usable:]
+        if usable:
+            yield np.frombuffer(block[:usable], dtype=dtype)
+    if rest:
+        raise ValueError("input ends in the middle of a sample")
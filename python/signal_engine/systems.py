@@ -0,0 +1,44 @@
+"""The three discrete systems analyzed by the front ends.
+
+Each system is a pure function taking the input signal x[n] and returning the
+output signal y[n] as a new NumPy array. All of them are single vectorized
+NumPy passes over x, so they run in O(n) without Python-level loops. They work
+along the last axis, so a 2-D array is processed as one signal per row.
+
+Outputs follow the sample-type policy of ``accumulate``: differences and
+running sums are computed in types wide enough not to overflow, and 64-bit
+integer results that would overflow raise OverflowError.
+"""
+
+import numpy as np
+
+from .accumulate import check_difference, difference_dtype, running_sum
+
+
+def difference(x):
+    """System 1: y[n] = x[n] - x[n-1], with y[0] = 0."""
+    x = np.asarray(x)
+    check_difference(x)
+    y = np.empty(x.shape, dtype=difference_dtype(x.dtype))  # Output array, filled below without temporaries
+    y[..., :1] = 0
+    # Difference between consecutive samples, computed in the (wider) output type
+    np.subtract(x[..., 1:], x[..., :-1], out=y[..., 1:], dtype=y.dtype, casting="unsafe")
+    return y
+
+
+def cumulative_sum(x):
+    """System 2: y[n] = sum of x[k] for k = 0..n (integrator)."""
+    return running_sum(x)  # Widened, blocked and compensated running sum
+
+
+def decimate(x):
+    """System 3: y[n] = x[2n] (time compression by 2)."""
+    return np.asarray(x)[..., ::2].copy()
+
+
+# Systems in the order the front ends present them: (number, function)
+SYSTEMS = {
+    1: difference,
+    2: cumulative_sum,
+    3: decimate,
+}
@@ -0,0 +1,99 @@
+"""Time-axis transformations applied to a discrete signal x[n], n = 0..N-1.
+
+Every transformation returns an IndexedSignal: the samples, plus the affine
+map that places sample i at n = origin + step * i. A shift only moves the
+origin and a reflection only negates origin and step, so both are O(1) and
+share the samples of x. A compression is a strided view of them. Chained
+transforms (x[-2n + 3]) therefore compose without building any intermediate
+array. Index arrays are only built on request (``signal.n``), e.g. for export.
+"""
+
+import math
+
+import numpy as np
+
+
+class IndexedSignal:
+    """Samples on an affine index axis: ``values[i]`` is the sample at n = origin + step * i.
+
+    A negative step means the samples are stored in decreasing n order. The
+    signal unpacks as the pair ``(n, values)``, which builds the index array.
+    """
+
+    __slots__ = ("values", "origin", "step")
+
+    def __init__(self, values, origin=0, step=1):
+        if step == 0:
+            raise ValueError("the index step of a signal cannot be zero")
+        self.values = np.asarray(values)
+        self.origin = int(origin)
+        self.step = int(step)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter((self.n, self.values))
+
+    def __repr__(self):
+        return f"IndexedSignal(origin={self.origin}, step={self.step}, values={self.values!r})"
+
+    @property
+    def n(self):
+        """The index axis as an array (allocates one integer per sample)."""
+        return np.arange(len(self.values), dtype=np.int64) * self.step + self.origin
+
+    def shift(self, k=2):
+        """x[n-k]: the same samples, k units later."""
+        return IndexedSignal(self.values, self.origin + k, self.step)
+
+    def reflect(self):
+        """x[-n]: the same samples on the negated index axis."""
+        return IndexedSignal(self.values, -self.origin, -self.step)
+
+    def compress(self, factor=2):
+        """x[factor*n]: the samples whose index is a multiple of factor, as a strided view."""
+        if factor <= 0:
+            raise ValueError(f"compression factor must be positive, got {factor}")
+        # Along i, the kept samples repeat every factor/gcd(step, factor) positions
+        period = factor // math.gcd(self.step, factor)
+        first = next((i for i in range(min(period, len(self.values)))
+                      if (self.origin + self.step * i) % factor == 0), None)
+        if first is None:
+            return IndexedSignal(self.values[:0], 0, 1)  # No sample falls on a multiple of factor
+        return IndexedSignal(self.values[first::period], (self.origin + self.step * first) // factor,
+                             self.step * period // factor)
+
+    def remap(self, scale, offset=0):
+        """x[scale*n + offset], as a shift, an optional reflection and a compression."""
+        if scale == 0:
+            raise ValueError("scale must be nonzero")
+        signal = self.shift(-offset)
+        if scale < 0:
+            signal = signal.reflect()
+        return signal.compress(abs(scale)) if abs(scale) != 1 else signal
+
+
+def _indexed(x):
+    """x itself if it is an IndexedSignal, else samples x[0..N-1] on the axis n = 0..N-1."""
+    return x if isinstance(x, IndexedSignal) else IndexedSignal(x)
+
+
+def shift(x, k=2):
+    """Time shift x[n-k]: moves the signal forward by k units."""
+    return _indexed(x).shift(k)  # The signal values remain unchanged
+
+
+def reflect(x):
+    """Time reflection x[-n]: flips the time axis."""
+    return _indexed(x).reflect()  # Values remain unchanged
+
+
+def compress(x, factor=2):
+    """Time compression x[factor*n]: keeps every factor-th sample."""
+    return _indexed(x).compress(factor)  # Strided view of x[0], x[factor], x[2*factor], ...
+
+
+def remap(x, scale, offset=0):
+    """General time transformation x[scale*n + offset] (e.g. x[-2n + 3])."""
+    return _indexed(x).remap(scale, offset)
@@ -0,0 +1,464 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Make the shared signal engine (in this directory) importable
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import signal_engine as engine
+
+# Language and program name set by the launcher script of each language directory (English when run directly)
+messages = engine.load_catalog(globals().get("LOCALE", engine.DEFAULT_LOCALE))
+PROG = globals().get("PROG")
+
+# Function to welcome the user and provide instructions
+def present_system(unlimited=False):
+    print("\n" + messages["welcome"])
+    print("-" * 40)
+    print(messages["cli.intro"])
+    print(messages["cli.intro.unlimited" if unlimited else "cli.intro.limited"])
+    print("-" * 40)
+
+# Function to obtain validated user input
+def get_signal(unlimited=False):
+    if not sys.stdin.isatty():
+        return read_piped_signal(unlimited)  # Piped or redirected input: no prompt to repeat
+    while True:
+        user_input = input("\n" + messages["cli.prompt.unlimited" if unlimited else "cli.prompt.limited"])
+        try:
+            with engine.span("parse"):
+                x = engine.parse_signal(user_input, allow_float=unlimited)  # Vectorized conversion to a NumPy array
+        except ValueError as error:
+            print(messages("cli.invalid.unlimited" if unlimited else "cli.invalid.limited", error=error))
+            continue
+        violation = None if unlimited else engine.check_limits(x)
+        if violation:
+            print(messages[f"cli.limits.{violation}"])  # Too many samples, or out of range
+        else:
+            return x
+
+# Function to read a whole piped signal (any number of lines, separated by spaces, commas or newlines)
+def read_piped_signal(unlimited=False):
+    try:
+        with engine.span("parse"):
+            x = engine.load_text(sys.stdin.buffer, allow_float=unlimited)  # Parsed block by block in C
+    except ValueError as error:
+        sys.exit(messages("cli.invalid.unlimited" if unlimited else "cli.invalid.limited", error=error))
+    violation = None if unlimited else engine.check_limits(x)
+    if violation:
+        sys.exit(messages[f"cli.limits.{violation}"])
+    return x
+
+# Function to plot the original signal graphically
+def plot_signal(x):
+    # matplotlib is only loaded when a plot is requested (never with --no-plot)
+    import matplotlib.pyplot as plt
+    from signal_engine.plotting import SignalPlot  # Stem plot / min-max envelope by zoom level
+
+    with engine.span("figure/original/build"):
+        fig = plt.figure(figsize=(8, 4))
+        plot = SignalPlot(plt.gca(), messages["plot.original"])  # Stem plot, or min/max envelope for long signals
+        plot.show(engine.IndexedSignal(x))  # Index axis n = 0, 1, ..., never built as an array
+        plt.xlabel("n")
+        plt.ylabel("x[n]")
+    with engine.span("figure/original/draw"):
+        fig.canvas.draw()
+    plt.show()
+
+# Function to plot the transformed signals
+def plot_transforms(shifted, reflected, compressed):
+    import matplotlib.pyplot as plt
+    from signal_engine.plotting import SignalPlot
+
+    with engine.span("figure/transforms/build"):
+        fig, axs = plt.subplots(3, 1, figsize=(10, 8))
+        # Keep the plots referenced: they refine themselves on zoom and pan
+        plots = []
+
+        # Time-shifted signal plot
+        plots.append(SignalPlot(axs[0], messages["plot.shifted"]))
+        plots[-1].show(shifted)
+
+        # Time-reflected signal plot
+        plots.append(SignalPlot(axs[1], messages["plot.reflected"]))
+        plots[-1].show(reflected)
+
+        # Time-compressed signal plot
+        plots.append(SignalPlot(axs[2], messages["plot.compressed"]))
+        plots[-1].show(compressed)
+
+        plt.tight_layout()
+    with engine.span("figure/transforms/draw"):
+        fig.canvas.draw()
+    plt.show()
+
+# Function to print the frequency-domain stage: dominant frequencies and system gains
+def report_spectrum(spectra):
+    print(messages["cli.spectrum.heading"])
+    method = messages[f"spectrum.{spectra['input'].method}"]
+    print(messages("cli.spectrum.input", frequency=dominant_frequency(spectra["input"]), method=method))
+    for name, spectrum in spectra["outputs"].items():
+        print(messages("cli.spectrum.output", name=name, frequency=dominant_frequency(spectrum)))
+    for name, response in spectra["responses"].items():
+        if response is None:
+            print(messages("cli.spectrum.not_lti", name=name))  # No gain to print
+            continue
+        gains = engine.to_db(np.abs(response.response) ** 2, dynamic_range=np.inf)  # Zeros print as -inf
+        middle = len(gains) // 2  # f = 0.25
+        source = "" if response.exact else messages["cli.spectrum.impulse"]
+        print(messages("cli.spectrum.gains", name=name, low=gains[0], middle=gains[middle], high=gains[-1],
+                       source=source))
+    print("-" * 40)
+
+# Function to find the frequency with the most power in a spectrum
+def dominant_frequency(spectrum):
+    return spectrum.freqs[np.argmax(spectrum.power)]
+
+# Function to plot the spectra and the frequency responses
+def plot_spectrum(spectra):
+    import matplotlib.pyplot as plt
+
+    with engine.span("figure/spectrum/build"):
+        fig, axs = plt.subplots(2, 1, figsize=(10, 8))
+        axs[0].plot(spectra["input"].freqs, engine.to_db(spectra["input"].power), label="x[n]", linewidth=2)
+        for name, spectrum in spectra["outputs"].items():
+            axs[0].plot(spectrum.freqs, engine.to_db(spectrum.power), label=name)
+        axs[0].set_title(messages["cli.plot.spectrum"])
+        axs[1].set_title(messages["cli.plot.responses"])
+        for name, response in spectra["responses"].items():
+            if response is None:
+                continue  # Not LTI: no frequency response
+            axs[1].plot(response.freqs, engine.to_db(np.abs(response.response) ** 2), label=name)
+        for ax in axs:
+            ax.set_xlabel(messages["plot.frequency"])
+            ax.set_ylabel("dB")
+            ax.grid(True)
+            ax.legend()
+        plt.tight_layout()
+    with engine.span("figure/spectrum/draw"):
+        fig.canvas.draw()
+    plt.show()
+
+# Function to run the systems over a signal file without loading it into memory
+def analyze_file(args):
+    # Output files are written next to the input unless a directory is given
+    output_dir = args.output_dir or os.path.dirname(os.path.abspath(args.input))
+    stem = os.path.splitext(os.path.basename(args.input))[0]
+
+    if engine.is_text_file(args.input):
+        # Text capture: converted block by block into a .npy file, then mapped like one
+        samples_path = os.path.join(output_dir, f"{stem}_samples.npy")  # Not <stem>.npy, which may be a capture of its own
+        start = time.perf_counter()
+        try:
+            with engine.span("file/parse"):
+                x = engine.convert_text(args.input, samples_path, args.dtype)
+        except ValueError as error:
+            sys.exit(f"{args.input}: {error}")
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(args.input) / 1e6
+        print("\n" + messages("cli.file.parsed", size=size, elapsed=elapsed, rate=size / max(elapsed, 1e-9),
+                              path=samples_path))
+    else:
+        x = engine.open_signal(args.input, args.dtype, args.endian)  # Memory-mapped, read-only
+    print("\n" + messages("cli.file.input", length=len(x), dtype=x.dtype.name, path=args.input))
+
+    paths = {number: os.path.join(output_dir, f"{stem}_system{number}.npy") for number in engine.SYSTEMS}
+
+    workers = worker_count(args, 1)
+    try:
+        with engine.span("file/systems"):
+            if workers == 1:
+                engine.run_systems_to_files(x, paths, args.block_size)
+            else:
+                engine.parallel_systems_to_files(x, paths, workers)  # Segments on several processes
+    except OverflowError as error:
+        sys.exit(f"{args.input}: {error}")  # 64-bit integer outputs cannot be widened further
+    for number, name in zip(paths, engine.BUILTIN_SYSTEMS):
+        print(messages("cli.file.written", number=number, label=messages[f"system.{name}"], path=paths[number]))
+
+# Function to pick the worker processes of a mode: --workers, or the mode's default (0 = one per core)
+def worker_count(args, default):
+    return default if args.workers is None else args.workers
+
+# Function to report how many results were reused from the cache
+def print_cache_stats():
+    print(messages("cli.cache", **engine.cache_stats()))
+
+# Function to print and/or export the per-stage timings (and profile) of the run
+def report_metrics(args):
+    metrics = engine.default_metrics
+    if args.profile:
+        metrics.stop_capture()
+        print("\n" + messages["cli.metrics.heading"])
+        print(metrics.format())
+    if args.metrics:
+        metrics.export(args.metrics)
+        print(messages("cli.metrics.written", path=args.metrics))
+
+# Function to analyze every signal of a batch file in one vectorized pass
+def analyze_batch_file(args):
+    try:
+        with engine.span("batch/load"):
+            X, lengths = engine.load_batch(args.signals, args.lengths)
+    except ValueError as error:
+        sys.exit(f"{args.signals}: {error}")
+    workers = worker_count(args, 1)
+    start = time.perf_counter()
+    try:
+        with engine.span("batch/analyze"):
+            if args.cache_dir:
+                results = engine.cached_batch(X, lengths, args.dedupe)  # Reused from disk when the batch was seen before
+            elif workers == 1:
+                results = engine.analyze_batch(X, lengths, deduplicate=args.dedupe)
+            else:
+                results = engine.parallel_batch(X, lengths, workers)  # Groups of rows on several processes
+    except OverflowError as error:
+        sys.exit(f"{args.signals}: {error}")
+    elapsed = time.perf_counter() - start
+
+    output = args.output or os.path.splitext(args.signals)[0] + "_results.npz"
+    with engine.span("batch/save"):
+        if output.endswith(".npy"):
+            np.save(output, results)  # One zero-padded structured record per signal
+        else:
+            # One columnar file for the whole batch, indexed by signal, with the verdicts of the systems
+            verdicts = {name: engine.cached_verify(system)
+                        for name, system in zip(engine.BUILTIN_SYSTEMS, engine.SYSTEMS.values())}
+            engine.save_batch_results(output, results, verdicts, args.compress)
+    rate = len(results) / elapsed if elapsed > 0 else float("inf")
+    print("\n" + messages("cli.batch.done", count=len(results), length=X.shape[1], elapsed=elapsed, rate=rate))
+    print(messages("results.written", path=output))
+    if args.cache_dir:
+        print_cache_stats()
+
+# Function to keep the engine running as a local service for other tools
+def run_server(args):
+    where = args.socket or f"http://127.0.0.1:{args.port}"
+    try:
+        engine.serve(args.socket, port=args.port, workers=worker_count(args, 0), systems_file=args.systems,
+                     ready=lambda: print(messages("cli.serve.listening", address=where), flush=True))
+    except FileExistsError as error:
+        sys.exit(f"{args.socket}: {error}")  # Only a stale socket is ever replaced
+    print("\n" + messages["cli.serve.stopped"])
+
+# Function to write the plots of every signal of a batch file, without a display
+def export_batch_plots(args):
+    try:
+        with engine.span("export/load"):
+            X, lengths = engine.load_batch(args.signals, args.lengths)
+    except ValueError as error:
+        sys.exit(f"{args.signals}: {error}")
+    directory = args.output or os.path.splitext(args.signals)[0] + "_plots"
+    titles = tuple(messages[f"plot.{name}"] for name in ("original", "shifted", "reflected", "compressed"))
+    start = time.perf_counter()
+    paths = engine.export_plots(X, lengths, directory, args.format, worker_count(args, 0), args.dpi, titles)
+    elapsed = time.perf_counter() - start
+    rate = len(paths) / elapsed if elapsed > 0 else float("inf")
+    print("\n" + messages("cli.export.done", count=len(paths), signals=len(X), elapsed=elapsed, rate=rate))
+    print(messages("cli.export.written", path=directory))
+
+# Function to describe a sliding window of a live stream on one line
+def describe_window(snapshot):
+    parts = [f"n = {snapshot.position:,}"]
+    for name, stats in snapshot.stats.items():
+        label = "x" if name == "input" else messages.get(f"live.{name}", name)
+        parts.append(messages("live.stats", label=label, stats=stats))
+    parts.append(messages("cli.live.dominant", frequency=dominant_frequency(snapshot.spectrum)))
+    return " | ".join(parts)
+
+# Function to follow a live stream over a sliding window, refreshing its statistics at a fixed rate
+def analyze_live(args):
+    window = engine.SlidingWindow(args.window, args.dtype)
+    live = engine.LiveAnalysis(engine.live_chunks(args.source, args.dtype), window).start()
+    terminal = sys.stdout.isatty()
+    width = 0
+    try:
+        for snapshot in live.frames(args.fps):
+            line = describe_window(snapshot)
+            if terminal:
+                width = max(width, len(line))
+                print("\r" + line.ljust(width), end="", flush=True)  # One line, rewritten in place
+            else:
+                print(line, flush=True)
+    except KeyboardInterrupt:
+        pass
+    if terminal:
+        print()
+    if live.error is not None:
+        sys.exit(f"{args.source}: {live.error}")
+
+# Function to build the command-line options
+def build_parser():
+    FILE, DIR, SAMPLES = messages["metavar.file"], messages["metavar.dir"], messages["metavar.samples"]
+    parser = argparse.ArgumentParser(prog=PROG, description=messages["title"])
+    parser.add_argument("--unlimited", action="store_true", help=messages["cli.help.unlimited"])
+    parser.add_argument("--input", metavar=FILE, help=messages["cli.help.input"])
+    parser.add_argument("--dtype", choices=engine.RAW_DTYPES, default="float64", help=messages["cli.help.dtype"])
+    parser.add_argument("--endian", choices=("little", "big"), default="little", help=messages["cli.help.endian"])
+    parser.add_argument("--output-dir", metavar=DIR, help=messages["cli.help.output_dir"])
+    parser.add_argument("--block-size", type=int, default=1 << 22, metavar=SAMPLES, help=messages["cli.help.block_size"])
+    parser.add_argument("--systems", metavar=FILE, help=messages["help.systems"])
+    parser.add_argument("--cache-dir", metavar=DIR, help=messages["cli.help.cache_dir"])
+    parser.add_argument("--cache-size", type=int, default=256, metavar="MB", help=messages["cli.help.cache_size"])
+    parser.add_argument("--cache-disk-size", type=int, default=1024, metavar="MB", help=messages["cli.help.cache_disk_size"])
+    parser.add_argument("--workers", type=int, metavar="N", help=messages["cli.help.workers"])
+    parser.add_argument("--no-plot", action="store_true", help=messages["cli.help.no_plot"])
+    parser.add_argument("--profile", action="store_true", help=messages["cli.help.profile"])
+    parser.add_argument("--metrics", metavar=FILE, help=messages["cli.help.metrics"])
+    parser.add_argument("--spectrum", action="store_true", help=messages["cli.help.spectrum"])
+    parser.add_argument("--save", metavar=FILE, help=messages["cli.help.save"])
+    parser.add_argument("--compress", action="store_true", help=messages["cli.help.compress"])
+    subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser("batch", help=messages["cli.help.batch"])
+    batch_parser.add_argument("signals", help=messages["cli.help.signals"])
+    batch_parser.add_argument("--lengths", metavar=FILE, help=messages["cli.help.lengths"])
+    batch_parser.add_argument("--dedupe", action="store_true", help=messages["cli.help.dedupe"])
+    batch_parser.add_argument("--output", metavar=FILE, help=messages["cli.help.batch_output"])
+    serve_parser = subparsers.add_parser("serve", help=messages["cli.help.serve"])
+    serve_parser.add_argument("--socket", metavar=messages["metavar.path"], help=messages["cli.help.socket"])
+    serve_parser.add_argument("--port", type=int, default=8765, help=messages["cli.help.port"])
+    export_parser = subparsers.add_parser("export", help=messages["cli.help.export"])
+    export_parser.add_argument("signals", help=messages["cli.help.signals"])
+    export_parser.add_argument("--lengths", metavar=FILE, help=messages["cli.help.lengths"])
+    export_parser.add_argument("--format", choices=("png", "svg"), default="png", help=messages["cli.help.format"])
+    export_parser.add_argument("--dpi", type=int, default=100, help=messages["cli.help.dpi"])
+    export_parser.add_argument("--output", metavar=DIR, help=messages["cli.help.export_output"])
+    live_parser = subparsers.add_parser("live", help=messages["cli.help.live"])
+    live_parser.add_argument("source", nargs="?", default="-", help=messages["cli.help.source"])
+    live_parser.add_argument("--window", type=int, default=4096, metavar=SAMPLES, help=messages["cli.help.window"])
+    live_parser.add_argument("--fps", type=float, default=4, help=messages["cli.help.fps"])
+    return parser
+
+# Function to run the program: the mode picked by the options, or the prompt
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # --- Profiling of the whole run (timing spans are always recorded) ---
+    if args.profile:
+        engine.default_metrics.start_capture()
+
+    # --- Result cache (memory, plus disk with --cache-dir) ---
+    engine.configure_cache(args.cache_size * 1024 * 1024, args.cache_dir, args.cache_disk_size * 1024 * 1024)
+
+    # --- Load user-defined systems into the registry ---
+    if args.systems:
+        engine.load_systems(args.systems)
+
+    # --- Batch mode: vectorized analysis of many signals, no prompt or plots ---
+    if args.command == "batch":
+        analyze_batch_file(args)
+        report_metrics(args)
+        return
+
+    # --- Server mode: analyses requested by other tools over a socket ---
+    if args.command == "serve":
+        run_server(args)
+        report_metrics(args)
+        return
+
+    # --- Export mode: plots of many signals written to files, no prompt or display ---
+    if args.command == "export":
+        export_batch_plots(args)
+        report_metrics(args)
+        return
+
+    # --- Live mode: sliding-window analysis of a stream, refreshed at a fixed rate ---
+    if args.command == "live":
+        analyze_live(args)
+        report_metrics(args)
+        return
+
+    # --- File mode: memory-mapped input and outputs, no prompt or plots ---
+    if args.input:
+        analyze_file(args)
+        report_metrics(args)
+        return
+
+    # --- Execute menu and user input ---
+    present_system(args.unlimited)
+    signal = get_signal(args.unlimited)
+    if not args.no_plot:
+        plot_signal(signal)
+
+    # --- Initialize data for transformations ---
+    x = signal
+
+    # --- Signal Transformations ---
+    # Each one returns the samples of x (or a strided view of them) with a new affine index axis
+
+    # 1. Time shift: moves the signal forward by 2 units
+    with engine.span("transform/shift"):
+        shifted = engine.shift(x, 2)
+
+    # 2. Time reflection: flips the time axis
+    with engine.span("transform/reflect"):
+        reflected = engine.reflect(x)
+
+    # 3. Time compression by 2: "accelerates" the time
+    with engine.span("transform/compress"):
+        compressed = engine.compress(x, 2)
+
+    # --- Plot transformed signals ---
+    if not args.no_plot:
+        plot_transforms(shifted, reflected, compressed)
+
+    # --- Implementation of Discrete Systems ---
+
+    # Outputs are widened as needed (e.g. int16 differences are int32); only
+    # 64-bit integer results that do not fit raise an OverflowError
+    try:
+        # System 1: Difference between consecutive samples
+        with engine.span("system/difference"):
+            y1 = engine.cached_system(engine.difference, x)  # y[n] = x[n] - x[n-1]; assuming y[0] = 0
+
+        # System 2: Cumulative sum of the signal (integrator)
+        with engine.span("system/cumulative_sum"):
+            y2 = engine.cached_system(engine.cumulative_sum, x)  # Cumulative sum from x[0] to x[n]
+    except OverflowError as error:
+        sys.exit(messages("cli.overflow", error=error))
+
+    # System 3: Time compression
+    with engine.span("system/decimate"):
+        y3 = engine.cached_system(engine.decimate, x)  # y[n] = x[2n]
+
+    # --- User-defined systems from the registry ---
+    systems = dict(zip(engine.BUILTIN_SYSTEMS, engine.SYSTEMS.values()))
+    outputs = {"difference": y1, "cumulative_sum": y2, "decimate": y3}
+    for name, system in engine.REGISTRY.items():
+        if name not in engine.BUILTIN_SYSTEMS:
+            with engine.span(f"system/{name}"):
+                outputs[name] = engine.cached_system(system, x)
+            systems[name] = system
+
+    # --- Analysis of the properties of each system ---
+    # Each property is tested empirically on randomized probe signals; the verdicts are reused from the cache
+    reports = [engine.SystemReport(name, engine.REGISTRY[name].label, outputs[name], engine.cached_verify(system))
+               for name, system in systems.items()]
+    print(engine.format_report(reports, messages, "cli"), end="")
+
+    # --- Frequency-domain stage: spectra of the input and outputs, responses of the systems ---
+    if args.spectrum:
+        # Exact responses come from the registered coefficients (engine.SYSTEMS holds plain functions)
+        spectra = engine.analyze_spectrum(x, outputs, {name: engine.REGISTRY[name] for name in systems})
+        report_spectrum(spectra)
+        if not args.no_plot:
+            plot_spectrum(spectra)
+
+    # --- Save every result to one columnar file (the verdicts come from the cache) ---
+    if args.save:
+        with engine.span("save"):
+            engine.save_results(args.save, x,
+                                {"shifted": shifted, "reflected": reflected, "compressed": compressed},
+                                outputs, {name: engine.cached_verify(system) for name, system in systems.items()},
+                                args.compress)
+        print(messages("results.written", path=args.save))
+
+    if args.cache_dir:
+        print_cache_stats()
+    report_metrics(args)
+
+# Worker processes of the parallel modes import this script again; only a direct run starts the program
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The front ends import the engine from python/; so do the tests
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,31 @@
+"""A batch gives each signal the results of analyzing it alone."""
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+
+
+def test_batch_matches_single_signals():
+    signals = [np.array([1, 2, 3, -4]), np.array([5]), np.array([0, -9, 9, 1, 2, 3, 4])]
+    X, lengths = engine.pack_signals(signals)
+    results = engine.analyze_batch(X, lengths)
+    for i, x in enumerate(signals):
+        result = engine.signal_result(results, i)
+        assert result["x"].tolist() == x.tolist()
+        assert result["y1"].tolist() == engine.difference(x).tolist()
+        assert result["y2"].tolist() == engine.cumulative_sum(x).tolist()
+        assert result["y3"].tolist() == engine.decimate(x).tolist()
+        assert result["shifted_n"].tolist() == engine.shift(x, 2).n.tolist()
+
+
+def test_deduplicated_batch_matches_full_analysis():
+    X = np.array([[1, 2, 3], [4, 5, 6], [1, 2, 3]])
+    assert engine.analyze_batch(X, deduplicate=True).tobytes() == engine.analyze_batch(X).tobytes()
+
+
+@pytest.mark.parametrize("dtype", ["int16", "int64", "uint64", "float64"])
+def test_empty_batches(dtype):
+    results = engine.analyze_batch(np.zeros((0, 5), dtype=dtype))
+    assert len(results) == 0
+    assert engine.cumulative_sum(np.zeros((0, 5), dtype=dtype)).shape == (0, 5)
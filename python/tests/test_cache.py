@@ -0,0 +1,115 @@
+"""Cache keys tell systems apart, cached results never alias the caller's arrays, and the disk tier stays in budget."""
+
+import os
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+from signal_engine.cache import ResultCache, _disk_key, system_id
+
+
+def gain(k):
+    return lambda x: x * k
+
+
+@pytest.fixture
+def cache():
+    return ResultCache()
+
+
+def test_lambdas_with_different_constants_get_different_results(cache):
+    double = engine.register_system("test_double", lambda x: x * 2)
+    triple = engine.register_system("test_triple", lambda x: x * 3)
+    try:
+        x = np.array([1, 2, 3])
+        assert engine.cached_system(double, x, cache).tolist() == [2, 4, 6]
+        assert engine.cached_system(triple, x, cache).tolist() == [3, 6, 9]
+        assert engine.cached_verify(double, cache=cache)["stable"].bound == pytest.approx(2)
+        assert engine.cached_verify(triple, cache=cache)["stable"].bound == pytest.approx(3)
+    finally:
+        engine.unregister_system("test_double")
+        engine.unregister_system("test_triple")
+
+
+def test_closures_get_different_keys(cache):
+    x = np.array([1, 2, 3])
+    assert engine.cached_system(gain(5), x, cache).tolist() == [5, 10, 15]
+    assert engine.cached_system(gain(7), x, cache).tolist() == [7, 14, 21]
+    assert system_id(gain(5)) != system_id(gain(5))  # Distinct objects in memory...
+    assert _disk_key(system_id(gain(5))) == _disk_key(system_id(gain(5)))  # ...same content on disk
+    assert _disk_key(system_id(gain(5))) != _disk_key(system_id(gain(7)))
+
+
+def test_disk_tier_is_keyed_by_content(tmp_path):
+    x = np.array([1, 2, 3])
+    ResultCache(directory=str(tmp_path)).put(("system", system_id(gain(5)), 0), np.array([0]))
+    later = ResultCache(directory=str(tmp_path))  # Another run: new function objects
+    assert later.get(("system", system_id(gain(5)), 0)) is not None
+    assert later.get(("system", system_id(gain(7)), 0)) is None
+    assert engine.cached_system(gain(7), x, later).tolist() == [7, 14, 21]
+
+
+def test_functions_without_stable_content_stay_in_memory(tmp_path):
+    handle = object()
+
+    def system(x):
+        return x if handle else -x  # Closes over an object that has no content to hash
+    cache = ResultCache(directory=str(tmp_path))
+    assert engine.cached_system(system, np.array([1]), cache).tolist() == [1]
+    assert engine.cached_system(system, np.array([1]), cache).tolist() == [1]
+    assert cache.stats()["hits"] == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cached_transform_leaves_the_input_writable(cache):
+    x = np.array([1, 2, 3])
+    shifted = engine.cached_transform("shift", x, 2, cache=cache)
+    x[0] = 5  # Must not raise
+    assert shifted.values.tolist() == [1, 2, 3]
+    assert not shifted.values.flags.writeable
+
+
+def test_system_returning_its_input_leaves_it_writable(cache):
+    x = np.array([1, 2, 3])
+    y = engine.cached_system(lambda signal: signal, x, cache)
+    x[0] = 5
+    assert y.tolist() == [1, 2, 3]
+
+
+def test_put_copies_the_callers_array(cache):
+    x = np.array([1, 2, 3])
+    stored = cache.put("key", x)
+    assert x.flags.writeable
+    assert stored is not x
+
+
+def test_functions_without_a_module_are_keyed_by_content(tmp_path):
+    namespace = {}
+    exec("scale = 4\ndef system(x):\n    return x * scale", namespace)  # No __name__: __module__ is None
+    system = namespace["system"]
+    assert system.__module__ is None
+    cache = ResultCache(directory=str(tmp_path))
+    assert engine.cached_system(system, np.array([1, 2]), cache).tolist() == [4, 8]
+    namespace["scale"] = 5  # A referenced global changes the disk key
+    assert engine.cached_system(system, np.array([1, 2]), ResultCache(directory=str(tmp_path))).tolist() == [5, 10]
+
+
+def test_disk_tier_removes_the_least_recently_used_files(tmp_path):
+    value = np.zeros(1000)
+    ResultCache(directory=str(tmp_path)).put("size", value)
+    size = next(tmp_path.iterdir()).stat().st_size
+    os.remove(next(tmp_path.iterdir()))
+    cache = ResultCache(directory=str(tmp_path), max_disk_bytes=2 * size)
+    cache.put("a", value)
+    cache.put("b", value)
+    for age, path in enumerate(sorted(tmp_path.iterdir(), key=lambda path: path.stat().st_mtime)):
+        os.utime(path, (1000 + age, 1000 + age))  # a, then b, long ago
+    cache.clear()
+    assert cache.get("a") is not None  # Read from disk: now the most recently used
+    cache.put("c", value)
+    assert len(list(tmp_path.iterdir())) == 2
+    later = ResultCache(directory=str(tmp_path))
+    assert later.get("a") is not None and later.get("c") is not None
+    assert later.get("b") is None
+    assert cache.stats()["disk_evictions"] == 1
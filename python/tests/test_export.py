@@ -0,0 +1,51 @@
+"""Exported plots are the same however they are drawn: alone, over a kept background, or by workers."""
+
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("matplotlib")
+from matplotlib.image import imread
+
+import signal_engine as engine
+from signal_engine import export
+from signal_engine.export import SIGNALS_PER_TASK
+
+
+def test_files_of_every_signal(tmp_path):
+    X = np.random.default_rng(0).integers(-5, 5, (3, 8))
+    paths = engine.export_plots(X, [8, 3, 0], str(tmp_path), "svg", workers=1)
+    names = [f"signal_{i:05d}{suffix}.svg" for i in range(3) for suffix in ("", "_transforms")]
+    assert [os.path.basename(path) for path in paths] == names
+    assert sorted(os.listdir(tmp_path)) == sorted(names)
+    with open(paths[1]) as f:
+        assert "Shifted Signal" in f.read()
+    titles = ("A", "B", "C", "Compressed here")
+    engine.export_plots(X[:1], None, str(tmp_path / "titled"), "svg", workers=1, titles=titles)
+    with open(tmp_path / "titled" / "signal_00000_transforms.svg") as f:
+        assert "Compressed here" in f.read()
+
+
+def test_kept_backgrounds_draw_the_same_imread(tmp_path):
+    first, second = np.array([0, 1, 3, 2]), np.array([3, 2, 0, 1])  # Same axis limits in every plot
+    engine.export_plots([second], directory=str(tmp_path / "alone"), workers=1)
+    engine.export_plots([first, second], directory=str(tmp_path / "after"), workers=1)
+    assert all(len(figure.backgrounds) == 1 for figure in export._figures)  # Drawn once, then reused
+    for name in ("signal_00000.png", "signal_00000_transforms.png"):
+        again = name.replace("00000", "00001")
+        np.testing.assert_array_equal(imread(tmp_path / "alone" / name), imread(tmp_path / "after" / again))
+
+
+def test_workers_draw_the_same_imread(tmp_path):
+    X = np.random.default_rng(1).integers(-3, 3, (SIGNALS_PER_TASK + 2, 6))
+    serial = engine.export_plots(X, directory=str(tmp_path / "serial"), workers=1, dpi=30)
+    parallel = engine.export_plots(X, directory=str(tmp_path / "parallel"), workers=2, dpi=30)
+    assert [os.path.basename(path) for path in serial] == [os.path.basename(path) for path in parallel]
+    for a, b in zip(serial[-4:], parallel[-4:]):
+        np.testing.assert_array_equal(imread(a), imread(b))
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="unknown export format"):
+        engine.export_plots(np.zeros((1, 2)), directory=str(tmp_path), format="bmp")
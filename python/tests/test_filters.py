@@ -0,0 +1,48 @@
+"""Direct, FFT and blocked filter evaluations agree with each other and with the recursion."""
+
+import numpy as np
+import pytest
+
+from signal_engine.filters import fir_direct, fir_overlap_add, iir_blocked, lfilter
+
+
+def recursion(b, a, x):
+    """Reference: the difference equation evaluated one sample at a time."""
+    y = np.zeros(len(x))
+    for n in range(len(x)):
+        y[n] = sum(b[k] * x[n - k] for k in range(len(b)) if n >= k)
+        y[n] -= sum(a[k] * y[n - k] for k in range(1, len(a)) if n >= k)
+    return y / a[0]
+
+
+@pytest.mark.parametrize("taps", [1, 2, 5, 64, 300])
+@pytest.mark.parametrize("length", [1, 100, 1000])
+def test_fir_direct_matches_overlap_add(taps, length):
+    rng = np.random.default_rng(taps)
+    b = rng.standard_normal(taps)
+    X = rng.standard_normal((3, length))
+    np.testing.assert_allclose(fir_direct(b, X), fir_overlap_add(b, X), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(fir_direct(b, X[0]), np.convolve(X[0], b)[:length], rtol=1e-9, atol=1e-9)
+
+
+def test_integer_fir_is_exact():
+    x = np.random.default_rng(0).integers(-2**15, 2**15, 5000).astype(np.int16)
+    b = [3, -7, 0, 11]
+    y = fir_direct(b, x)
+    assert y.dtype.kind == "i" and y.dtype.itemsize > 2
+    assert y.tolist() == np.convolve(x.astype(np.int64), b)[:len(x)].tolist()
+
+
+@pytest.mark.parametrize("block", [7, 64, 1024])
+def test_iir_blocked_matches_the_recursion(block):
+    b, a = [0.5, 0.25], [1.0, -0.9, 0.2]
+    x = np.random.default_rng(1).standard_normal(300)
+    np.testing.assert_allclose(iir_blocked(b, a, x, block), recursion(b, a, x), rtol=1e-9, atol=1e-9)
+
+
+def test_lfilter_normalizes_and_picks_the_accumulator():
+    x = np.arange(10.0)
+    np.testing.assert_allclose(lfilter([2.0], [2.0, -2.0], x), np.cumsum(x))
+    np.testing.assert_allclose(lfilter([1.0, 1.0], [2.0], x), recursion([1.0, 1.0], [2.0], x))
+    with pytest.raises(ValueError):
+        lfilter([1.0], [0.0, 1.0], x)
@@ -0,0 +1,39 @@
+"""Segments and groups of rows computed on several processes give the serial results."""
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+
+
+def make_signal(dtype, length=20_011, seed=0):
+    info = np.iinfo(dtype)
+    rng = np.random.default_rng(seed)
+    return rng.integers(max(info.min, -2**40), min(info.max, 2**40), length, endpoint=True).astype(dtype)
+
+
+@pytest.mark.parametrize("dtype", ["int8", "uint16", "int32", "int64"])
+def test_parallel_systems_match_serial(dtype):
+    x = make_signal(dtype)
+    outputs = engine.parallel_systems(x, workers=2, segments=7)
+    for number, system in engine.SYSTEMS.items():
+        assert outputs[number].dtype == system(x).dtype
+        assert outputs[number].tobytes() == system(x).tobytes()
+
+
+def test_parallel_systems_to_files_read_a_memory_map(tmp_path):
+    path = tmp_path / "signal.bin"
+    make_signal("int16").tofile(path)
+    x = engine.open_signal(str(path), "int16")
+    paths = {number: str(tmp_path / f"system{number}.npy") for number in engine.SYSTEMS}
+    outputs = engine.parallel_systems_to_files(x, paths, workers=2, segments=5)
+    for number, system in engine.SYSTEMS.items():
+        assert np.load(paths[number]).tobytes() == system(np.asarray(x)).tobytes()
+        assert np.asarray(outputs[number]).tobytes() == system(np.asarray(x)).tobytes()
+
+
+def test_parallel_batch_matches_serial():
+    rng = np.random.default_rng(1)
+    X = rng.integers(-1000, 1000, (50, 16)).astype(np.int32)
+    lengths = rng.integers(0, 17, 50)
+    assert engine.parallel_batch(X, lengths, workers=2).tobytes() == engine.analyze_batch(X, lengths).tobytes()
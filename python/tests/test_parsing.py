@@ -0,0 +1,59 @@
+"""The fast parse path accepts exactly what the token scan accepts."""
+
+import io
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1 2 3 -4", [1, 2, 3, -4]),
+    ("1,2,,3\n4", [1, 2, 3, 4]),
+    ("+3 -4", [3, -4]),
+    ("-9223372036854775808 9223372036854775807", [-2**63, 2**63 - 1]),
+])
+def test_valid_signals(text, expected):
+    assert engine.parse_signal(text).tolist() == expected
+
+
+@pytest.mark.parametrize("text, message", [
+    ("1 - 2", "line 1: '-' is not a number"),
+    ("4 +\n5", "line 1: '+' is not a number"),
+    ("1\n12x", "line 2: '12x' is not a number"),
+    ("99999999999999999999", "out of the int64 range"),
+    ("1\n-99999999999999999999", "line 2: '-99999999999999999999' is out of the int64 range"),
+])
+def test_malformed_signals(text, message):
+    with pytest.raises(engine.SignalParseError, match=message.replace("+", r"\+")):
+        engine.parse_signal(text)
+
+
+def test_narrow_types_are_range_checked():
+    assert engine.parse_signal("-32768 32767", dtype=np.int16).dtype == np.int16
+    with pytest.raises(engine.SignalParseError, match="line 2: '40000' is out of the int16 range"):
+        engine.parse_signal("1 2\n3 40000", dtype=np.int16)
+    with pytest.raises(engine.SignalParseError, match="out of the float32 range"):
+        engine.parse_signal("1e39", dtype=np.float32)
+
+
+def test_text_chunks_number_lines_across_blocks():
+    text = "1 2\n" * 1000 + "oops\n"
+    with pytest.raises(engine.SignalParseError, match="line 1001"):
+        engine.load_text(io.BytesIO(text.encode()), block_size=64)
+
+
+def test_convert_text_removes_its_partial_output(tmp_path):
+    source = tmp_path / "capture.txt"
+    source.write_text("1 2\n3 40000\n")
+    with pytest.raises(engine.SignalParseError, match="line 2"):
+        engine.convert_text(str(source), str(tmp_path / "capture_samples.npy"), "int16")
+    assert not (tmp_path / "capture_samples.npy").exists()
+
+
+def test_batch_errors_give_their_line(tmp_path):
+    path = tmp_path / "vectors.txt"
+    path.write_text("1 2 3\n4 5\noops 6\n")
+    with pytest.raises(engine.SignalParseError, match="line 3: 'oops'"):
+        engine.load_batch(str(path))
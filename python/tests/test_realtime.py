@@ -0,0 +1,62 @@
+"""Sliding-window statistics and spectra match the whole-array computations on the window."""
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+
+
+def chunks_of(x, seed=0):
+    """x cut into chunks of random lengths, from 1 sample to twice the window."""
+    rng = np.random.default_rng(seed)
+    first = 0
+    while first < len(x):
+        length = int(rng.integers(1, 600))
+        yield x[first:first + length]
+        first += length
+
+
+@pytest.mark.parametrize("x", [
+    np.random.default_rng(1).integers(-2**15, 2**15, 5000).astype(np.int16),
+    1e6 + np.random.default_rng(2).standard_normal(5000),  # Large offset: variance from the reference
+], ids=["int16", "offset"])
+def test_sliding_window_statistics_match_numpy(x):
+    size = 300
+    window = engine.SlidingWindow(size, dtype=x.dtype)
+    outputs = {name: engine.REGISTRY[name](x) for name in ("difference", "cumulative_sum")}
+    for chunk in chunks_of(x):
+        window.process(chunk)
+        snapshot = window.snapshot()
+        end = snapshot.position
+        start = max(end - size, 0)
+        assert snapshot.signal.values.tolist() == x[start:end].tolist()
+        assert snapshot.signal.n[0] == start
+        expected = {"input": x[start:end]}
+        expected.update((name, y[start:end]) for name, y in outputs.items())
+        for name, values in expected.items():
+            stats = snapshot.stats[name]
+            if name != "input":
+                assert snapshot.outputs[name].values.tolist() == values.tolist()
+            assert stats.count == len(values)
+            assert (stats.min, stats.max) == (values.min(), values.max())
+            assert stats.mean == pytest.approx(values.mean(), rel=1e-12, abs=1e-9)
+            assert stats.std == pytest.approx(values.std(), rel=1e-6, abs=1e-6)
+
+
+@pytest.mark.parametrize("chunk", [1, 37, 500, 5000])
+def test_sliding_spectrum_is_welch_of_the_aligned_segments(chunk):
+    size, segment = 500, 64
+    hop = segment // 2
+    x = np.random.default_rng(0).standard_normal(2011)
+    window = engine.SlidingWindow(size, segment=segment)
+    for first in range(0, len(x), chunk):
+        window.process(x[first:first + chunk])
+        if window.position < size:
+            continue
+        origin = window.position - size
+        start = -(-origin // hop) * hop  # Segments start at multiples of hop in the stream...
+        end = start + (window.position - start - segment) // hop * hop + segment  # ...and end inside the window
+        expected = engine.welch(x[start:end], segment)
+        spectrum = window.snapshot().spectrum
+        assert spectrum.segments == expected.segments
+        np.testing.assert_allclose(spectrum.power, expected.power, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,63 @@
+"""Results files read back the columns and verdicts they were written with."""
+
+import zipfile
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+
+
+def analysis(x):
+    transforms = {"shifted": engine.shift(x, 2), "reflected": engine.reflect(x), "compressed": engine.compress(x, 2)}
+    outputs = {name: engine.REGISTRY[name](x) for name in engine.BUILTIN_SYSTEMS}
+    return transforms, outputs
+
+
+@pytest.mark.parametrize("mmap_mode, compress", [(None, False), ("r", False), ("r", True)])
+def test_load_results_round_trip(tmp_path, mmap_mode, compress):
+    x = np.array([3, -1, 4, 1, -5, 9, 2], dtype=np.int16)
+    transforms, outputs = analysis(x)
+    verdicts = {"difference": engine.verify_system(engine.difference)}
+    path = str(tmp_path / "results.npz")
+    engine.save_results(path, x, transforms, outputs, verdicts, compress)
+
+    saved = engine.load_results(path, mmap_mode)
+    columns = saved.columns
+    assert columns["x"].tolist() == x.tolist() and columns["x"].dtype == x.dtype
+    for name, transformed in transforms.items():
+        assert columns[f"{name}_n"].tolist() == transformed.n.tolist()
+        assert columns[name].tolist() == transformed.values.tolist()
+    for name, y in outputs.items():
+        assert columns[f"y_{name}"].tolist() == y.tolist() and columns[f"y_{name}"].dtype == y.dtype
+    assert isinstance(columns["x"], np.memmap) == (mmap_mode == "r" and not compress)
+    stable = saved.verdicts["difference"]["stable"]
+    assert (stable.holds, stable.bound) == (verdicts["difference"]["stable"].holds, pytest.approx(2))
+
+
+def test_columns_are_stored_once(tmp_path):
+    x = np.arange(100.0)
+    path = str(tmp_path / "results.npz")
+    engine.save_results(path, x, *analysis(x))
+    with zipfile.ZipFile(path) as archive:
+        members = {name for name in archive.namelist() if name.startswith("column/")}
+    assert "column/x.npy" in members
+    assert not members & {"column/shifted.npy", "column/reflected.npy", "column/shifted_n.npy"}
+
+
+def test_batch_results_hold_each_signal(tmp_path):
+    X = np.random.default_rng(0).integers(-100, 100, (4, 9))
+    lengths = np.array([9, 0, 5, 2])
+    path = str(tmp_path / "batch.npz")
+    engine.save_batch_results(path, engine.analyze_batch(X, lengths))
+    saved = engine.load_results(path)
+    for i, length in enumerate(lengths):
+        signal = engine.saved_signal(saved, i)
+        x = X[i, :length]
+        transforms, outputs = analysis(x)
+        assert signal["x"].tolist() == x.tolist()
+        for name, transformed in transforms.items():
+            assert signal[f"{name}_n"].tolist() == transformed.n.tolist()
+            assert signal[name].tolist() == transformed.values.tolist()
+        for name, y in outputs.items():
+            assert signal[f"y_{name}"].tolist() == y.tolist()
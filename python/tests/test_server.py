@@ -0,0 +1,67 @@
+"""The analysis service answers with the results of a local analysis."""
+
+import os
+import signal
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+from signal_engine.server import analyze_requests
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVER = """
+import sys
+import signal_engine as engine
+engine.serve(sys.argv[1], workers=1, ready=lambda: print("ready", flush=True))
+"""
+
+
+@pytest.fixture
+def server(tmp_path):
+    path = str(tmp_path / "engine.sock")
+    process = subprocess.Popen([sys.executable, "-c", SERVER, path], cwd=PYTHON_DIR,
+                               stdout=subprocess.PIPE, text=True)
+    try:
+        assert process.stdout.readline().strip() == "ready"
+        yield path
+    finally:
+        process.send_signal(signal.SIGINT)
+        process.wait(30)
+    assert not os.path.exists(path)  # The socket is removed on exit
+
+
+def test_round_trip_over_a_unix_socket(server):
+    signals = [np.array([1, 2, 3, 5], dtype=np.int16), np.arange(10.0), np.array([], dtype=np.int32)]
+    with engine.AnalysisClient(server) as client:
+        assert client.health()
+        assert set(engine.BUILTIN_SYSTEMS) <= set(client.systems())
+        answers = client.analyze_many(signals, shift=3)
+        for x, saved in zip(signals, answers):
+            assert saved.columns["x"].tolist() == x.tolist()
+            assert saved.columns["shifted_n"].tolist() == engine.shift(x, 3).n.tolist()
+            for name in engine.BUILTIN_SYSTEMS:
+                assert saved.columns[f"y_{name}"].tolist() == engine.REGISTRY[name](x).tolist()
+            assert saved.verdicts["cumulative_sum"]["stable"].holds is False
+        only = client.analyze(signals[0], systems=["difference"], verify=False)
+        assert "y_cumulative_sum" not in only.columns and only.verdicts == {}
+        with pytest.raises(engine.ServiceError):
+            client.analyze(signals[0], systems=["no_such_system"])
+
+
+def test_batched_requests_match_single_ones():
+    signals = [np.array([1, -2, 3]), np.array([4, 5]), np.array([7])]
+    together = analyze_requests(signals)
+    for x, body in zip(signals, together):
+        assert body == analyze_requests([x])[0]
+
+
+def test_refuses_to_replace_a_file_that_is_not_a_socket(tmp_path):
+    path = tmp_path / "not_a_socket"
+    path.write_text("keep me")
+    with pytest.raises(FileExistsError):
+        engine.serve(str(path), workers=1)
+    assert path.read_text() == "keep me"
@@ -0,0 +1,65 @@
+"""Spectra conserve power and find tones; responses come only from LTI systems."""
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+from signal_engine.spectrum import DEFAULT_SEGMENT, SEGMENTS_PER_BLOCK
+
+
+def tone(frequency, length, seed=0):
+    noise = np.random.default_rng(seed).standard_normal(length) * 0.01
+    return np.sin(2 * np.pi * frequency * np.arange(length)) + noise
+
+
+def test_periodogram_conserves_power():
+    x = np.random.default_rng(0).standard_normal(1000)
+    spectrum = engine.periodogram(x)
+    size = 2 * (len(spectrum.freqs) - 1)
+    assert spectrum.power.sum() == pytest.approx(size * np.sum((x - x.mean()) ** 2) / len(x))
+
+
+@pytest.mark.parametrize("length", [1000, 50_000])
+def test_power_spectrum_peaks_at_the_tone(length):
+    spectrum = engine.power_spectrum(tone(0.125, length))
+    assert spectrum.method == ("periodogram" if length <= DEFAULT_SEGMENT else "welch")
+    assert spectrum.freqs[np.argmax(spectrum.power)] == pytest.approx(0.125, abs=1e-3)
+
+
+def test_welch_by_blocks_matches_all_segments_at_once():
+    segment, hop = 64, 32
+    x = tone(0.2, 3 * SEGMENTS_PER_BLOCK * hop + 17)
+    segments = np.lib.stride_tricks.sliding_window_view(x, segment)[::hop]
+    segments = segments - segments.mean(axis=1, keepdims=True)
+    window = np.hanning(segment + 2)[1:-1]
+    power = (np.abs(np.fft.rfft(segments * window)) ** 2).sum(axis=0) / (len(segments) * np.sum(window ** 2))
+    power[1:-1] *= 2
+    spectrum = engine.welch(x, segment)
+    assert spectrum.segments == len(segments) > SEGMENTS_PER_BLOCK
+    np.testing.assert_allclose(spectrum.power, power, rtol=1e-9)
+
+
+def test_frequency_responses_of_the_builtin_systems():
+    difference = engine.frequency_response(engine.REGISTRY["difference"])
+    assert difference.exact
+    assert abs(difference.response[0]) == pytest.approx(0)
+    assert abs(difference.response[-1]) == pytest.approx(2)
+    cumulative = engine.frequency_response(engine.REGISTRY["cumulative_sum"])
+    assert np.isinf(abs(cumulative.response[0]))
+    assert abs(cumulative.response[-1]) == pytest.approx(0.5)
+    with pytest.raises(ValueError, match="not linear and time-invariant"):
+        engine.frequency_response(engine.REGISTRY["decimate"])
+
+
+def test_analyze_spectrum_leaves_out_responses_of_non_lti_systems():
+    x = tone(0.25, 512)
+    outputs = {name: engine.REGISTRY[name](x) for name in engine.BUILTIN_SYSTEMS}
+    result = engine.analyze_spectrum(x, outputs, {name: engine.REGISTRY[name] for name in engine.BUILTIN_SYSTEMS})
+    assert result["responses"]["decimate"] is None
+    assert result["responses"]["difference"] is not None
+    assert set(result["outputs"]) == set(engine.BUILTIN_SYSTEMS)
+
+
+def test_to_db_clips_below_the_peak():
+    db = engine.to_db(np.array([1.0, 1e-20, 0.0, np.inf]), dynamic_range=60)
+    assert db[0] == 0 and db[1] == -60 and db[2] == -60 and np.isinf(db[3])
@@ -0,0 +1,75 @@
+"""Chunked evaluation gives the bytes and dtypes of the whole-array systems."""
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+from signal_engine.fileio import run_systems_to_files
+
+DTYPES = ("int8", "uint8", "int16", "uint16", "int32", "int64", "float32", "float64")
+
+
+def make_signal(dtype, length=10_000, seed=0):
+    rng = np.random.default_rng(seed)
+    if np.dtype(dtype).kind == "f":
+        return (rng.standard_normal(length) * 1000).astype(dtype)
+    info = np.iinfo(dtype)
+    return rng.integers(max(info.min, -2**40), min(info.max, 2**40), length, endpoint=True).astype(dtype)
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("chunk", [1, 7, 4096, 4097, 10_000])
+def test_streamed_outputs_match_whole_array(dtype, chunk):
+    x = make_signal(dtype, length=10_000 if chunk > 7 else 300)
+    chunks = [x[i:i + chunk] for i in range(0, len(x), chunk)]
+    for number, system in engine.SYSTEMS.items():
+        streamed = np.concatenate(list(engine.stream_system(chunks, number)))
+        whole = system(x)
+        assert streamed.dtype == whole.dtype
+        assert streamed.tobytes() == whole.tobytes()
+
+
+def test_stream_systems_runs_all_systems_in_one_pass():
+    x = make_signal("int16")
+    outputs = list(engine.stream_systems(x[i:i + 1000] for i in range(0, len(x), 1000)))
+    for number, streamed in zip(engine.SYSTEMS, zip(*outputs)):
+        assert np.concatenate(streamed).tobytes() == engine.SYSTEMS[number](x).tobytes()
+
+
+@pytest.mark.parametrize("dtype", ["int16", "float32"])
+def test_output_files_match_whole_array(tmp_path, dtype):
+    x = make_signal(dtype)
+    paths = {number: str(tmp_path / f"system{number}.npy") for number in engine.SYSTEMS}
+    outputs = run_systems_to_files(x, paths, block_size=999)
+    for number, system in engine.SYSTEMS.items():
+        assert outputs[number].dtype == system(x).dtype
+        assert np.asarray(outputs[number]).tobytes() == system(x).tobytes()
+
+
+def test_streamed_overflow_raises_like_whole_array():
+    x = np.array([0, 2**62, -2**62 - 1, 5], dtype=np.int64)
+    with pytest.raises(OverflowError, match="n = 2"):
+        engine.difference(x)
+    with pytest.raises(OverflowError, match="n = 2"):
+        list(engine.stream_system([x[:2], x[2:]], 1))
+
+
+def test_int64_difference_at_the_limit_does_not_overflow():
+    x = np.array([0, 2**62, -2**62, 5], dtype=np.int64)  # 2**62 -> -2**62 is exactly -2**63
+    streamed = np.concatenate(list(engine.stream_system([x[:2], x[2:]], 1)))
+    assert streamed.tobytes() == engine.difference(x).tobytes()
+
+
+def test_integer_chunks_after_float_ones_continue_as_float():
+    chunks = [np.array([1.5, -2.0]), np.array([3, 4], dtype=np.int64), np.array([0.25])]
+    x = np.concatenate(chunks)
+    for number, system in engine.SYSTEMS.items():
+        streamed = np.concatenate(list(engine.stream_system(chunks, number)))
+        assert streamed.dtype == system(x).dtype
+        assert streamed.tobytes() == system(x).tobytes()
+
+
+def test_float_chunks_after_integer_ones_raise():
+    for number in engine.SYSTEMS:
+        with pytest.raises(ValueError, match="float64 samples follows chunks of int64"):
+            list(engine.stream_system([np.array([1, 2]), np.array([0.5])], number))
@@ -0,0 +1,73 @@
+"""The registered systems match the systems module, values and dtypes included."""
+
+import numpy as np
+import pytest
+
+import signal_engine as engine
+
+DTYPES = ("bool", "int8", "uint8", "int16", "uint16", "int32", "uint32", "int64", "uint64",
+          "float16", "float32", "float64")
+
+
+def make_signal(dtype, length=500, seed=0):
+    rng = np.random.default_rng(seed)
+    if dtype == "bool":
+        return rng.integers(0, 2, length).astype(bool)
+    if np.dtype(dtype).kind == "f":
+        return rng.standard_normal(length).astype(dtype)
+    info = np.iinfo(dtype)
+    return rng.integers(info.min, info.max, length, endpoint=True, dtype=dtype)  # Full range: widening matters
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+@pytest.mark.parametrize("name", ["difference", "cumulative_sum", "decimate"])
+def test_registry_matches_systems(dtype, name):
+    x = make_signal(dtype)
+    if dtype in ("int64", "uint64") and name != "decimate":
+        x = x // 2**20  # Keep the 64-bit differences and running sums representable
+    system = dict(zip(engine.BUILTIN_SYSTEMS, engine.SYSTEMS.values()))[name]
+    expected = system(x)
+    y = engine.REGISTRY[name](x)
+    assert y.dtype == expected.dtype
+    assert y.tobytes() == expected.tobytes()
+
+
+def test_registered_difference_widens_int16():
+    x = np.array([30000, -30000, 30000], dtype=np.int16)
+    y = engine.REGISTRY["difference"](x)
+    assert y.dtype == np.int32
+    assert y.tolist() == [0, -60000, 60000]
+
+
+def test_user_fir_does_not_wrap():
+    system = engine.register_fir("pair_sum", [1, 1])
+    try:
+        y = system(np.array([30000, 30000, -30000], dtype=np.int16))
+        assert y.tolist() == [30000, 60000, 0]
+    finally:
+        engine.unregister_system("pair_sum")
+
+
+def test_int64_outputs_raise_instead_of_wrapping():
+    x = np.array([2**62, -2**62 - 1], dtype=np.int64)
+    with pytest.raises(OverflowError):
+        engine.difference(x)
+    with pytest.raises(OverflowError):
+        engine.REGISTRY["difference"](x)
+    with pytest.raises(OverflowError):
+        engine.cumulative_sum(np.array([2**62, 2**62], dtype=np.int64))
+
+
+@pytest.mark.parametrize("dtype", ["int64", "uint64"])
+def test_empty_64_bit_batches(dtype):
+    X = np.zeros((0, 5), dtype=dtype)
+    assert engine.difference(X).shape == (0, 5)
+    assert engine.REGISTRY["difference"](X).shape == (0, 5)
+    assert engine.difference(np.zeros(0, dtype=dtype)).shape == (0,)
+
+
+def test_float32_running_sum_is_accumulated_in_float64():
+    x = np.full(1_000_000, 0.1, dtype=np.float32)
+    y = engine.cumulative_sum(x)
+    assert y.dtype == np.float64
+    assert y[-1] == pytest.approx(1_000_000 * float(np.float32(0.1)), rel=1e-12)